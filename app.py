@@ -1,9 +1,12 @@
 import streamlit as st
 from src.database import RealEstateDB
 from src.auth import UserManager
+from src.connection import DEFAULT_DB_PATH
 from src.analyzer import get_all_area_summaries, format_price_display
+from src import analytics
 import plotly.express as px
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import tempfile
@@ -144,9 +147,20 @@ with col3:
         st.rerun()
 
 # DB 연결 (파일 업로드 전에 먼저 정의)
-# 캐시 제거 - 데이터 업데이트가 즉시 반영되도록 함
+# 조회는 재실행마다 새로 열지 않고 읽기 전용 연결 하나를 재사용
+# (WAL 모드 + 자동 커밋 조회라 쿼리마다 최신 커밋을 봄 - 데이터 업데이트가 즉시 반영됨)
+@st.cache_resource
 def get_db():
-    return RealEstateDB("data/real_estate.db")
+    return RealEstateDB(DEFAULT_DB_PATH, readonly=True)
+
+@contextmanager
+def write_db():
+    """업로드/초기화 동안만 풀에서 쓰기 연결을 빌리고 끝나면 반납"""
+    writer = RealEstateDB(DEFAULT_DB_PATH)
+    try:
+        yield writer
+    finally:
+        writer.close()
 
 db = get_db()
 
@@ -274,7 +288,7 @@ st.sidebar.header("🗄️ 데이터베이스 관리")
 try:
     db_stats_cursor = db.conn.execute("SELECT COUNT(*) FROM complexes")
     complex_count = db_stats_cursor.fetchone()[0]
-    db_stats_cursor = db.conn.execute("SELECT COUNT(*) FROM prices")
+    db_stats_cursor = db.conn.execute("SELECT COUNT(*) FROM latest_listings")
     price_count = db_stats_cursor.fetchone()[0]
     st.sidebar.info(f"📊 단지: {complex_count}개 | 매물: {price_count}개")
 except:
@@ -285,11 +299,9 @@ confirm_reset = st.sidebar.checkbox("⚠️ 정말 초기화하시겠습니까?"
 
 if st.sidebar.button("🗑️ 데이터베이스 초기화", type="secondary", disabled=not confirm_reset):
     try:
-        # 모든 가격 데이터 삭제
-        db.conn.execute("DELETE FROM prices")
-        # 모든 단지 정보 삭제
-        db.conn.execute("DELETE FROM complexes")
-        db.conn.commit()
+        # 모든 매물/가격 변경 이력/단지 정보 삭제
+        with write_db() as writer:
+            writer.reset_listings()
         st.sidebar.success("✅ 데이터베이스 초기화 완료!")
         st.cache_data.clear()
         st.rerun()
@@ -325,88 +337,87 @@ if uploaded_file is not None:
             # 형식 1: 단일 단지 데이터
             complexes_list = [json_data]
         
-        # 각 단지 처리
-        for complex_data in complexes_list:
-            # 메타데이터 추출
-            metadata = complex_data.get('metadata', {})
-            complex_name = metadata.get('complex_name', 'Unknown')
-            complex_no = metadata.get('complex_no', 'unknown')
-            total_households = metadata.get('total_households', 0)
-            
-            # 기존 데이터 삭제 (중복 방지)
-            db.conn.execute("DELETE FROM prices WHERE complex_no = ?", (complex_no,))
-            db.conn.commit()
-            
-            # DB에 단지 정보 저장 (UPDATE 또는 INSERT)
-            db.conn.execute("""
-                INSERT OR REPLACE INTO complexes (complex_no, complex_name, address, total_households, build_year, updated_at)
-                VALUES (?, ?, ?, ?, ?, datetime('now'))
-            """, (complex_no, complex_name, metadata.get('address', ''), total_households, 2010))
-            db.conn.commit()
-            
-            # 매물 데이터 처리
-            listings = complex_data.get('listings', [])
-            sale_count = 0
-            lease_count = 0
-            
-            for listing in listings:
-                area = listing.get('exclusive_area', 0)
-                area_type = listing.get('area_type', '')  # 원본 타입명 사용 (예: 86B/59m², 111A/84m²)
+        # 각 단지 처리 (업로드 동안만 쓰기 연결 사용)
+        with write_db() as writer:
+            for complex_data in complexes_list:
+                # 메타데이터 추출
+                metadata = complex_data.get('metadata', {})
+                complex_name = metadata.get('complex_name', 'Unknown')
+                complex_no = metadata.get('complex_no', 'unknown')
+                total_households = metadata.get('total_households', 0)
                 
-                # 면적 필터링 (59m², 75m², 84m²)
-                if not (56 <= area <= 62 or 72 <= area <= 78 or 81 <= area <= 87):
-                    continue
+                # DB에 단지 정보 저장 (UPDATE 또는 INSERT)
+                writer.conn.execute("""
+                    INSERT OR REPLACE INTO complexes (complex_no, complex_name, address, total_households, build_year, updated_at)
+                    VALUES (?, ?, ?, ?, ?, datetime('now'))
+                """, (complex_no, complex_name, metadata.get('address', ''), total_households, 2010))
+                writer.conn.commit()
                 
-                # 매매 데이터 - count 값을 int로 변환하여 비교
-                sale_price_val = listing.get('sale_price', 0)
-                sale_count_val = int(listing.get('sale_count', 0)) if str(listing.get('sale_count', 0)).isdigit() else 0
+                # 매물 데이터 처리
+                listings = complex_data.get('listings', [])
+                sale_count = 0
+                lease_count = 0
+                price_rows = []  # 단지 단위로 모아서 한 번에 저장 (매물 식별 키 순번 유지)
                 
-                if sale_price_val > 0 and sale_count_val > 0:
-                    floor_str = listing.get('sale_floor', '')
-                    floor_num = 15 if '고' in floor_str else 9 if '중' in floor_str else 5
+                for listing in listings:
+                    area = listing.get('exclusive_area', 0)
+                    area_type = listing.get('area_type', '')  # 원본 타입명 사용 (예: 86B/59m², 111A/84m²)
+                    
+                    # 면적 필터링 (59m², 75m², 84m²)
+                    if not (56 <= area <= 62 or 72 <= area <= 78 or 81 <= area <= 87):
+                        continue
+                    
+                    # 매매 데이터 - count 값을 int로 변환하여 비교
+                    sale_price_val = listing.get('sale_price', 0)
+                    sale_count_val = int(listing.get('sale_count', 0)) if str(listing.get('sale_count', 0)).isdigit() else 0
+                    
+                    if sale_price_val > 0 and sale_count_val > 0:
+                        floor_str = listing.get('sale_floor', '')
+                        floor_num = 15 if '고' in floor_str else 9 if '중' in floor_str else 5
+                        
+                        if floor_num >= 4:
+                            price_rows.append({
+                                '면적타입': area_type,
+                                '전용면적': area,
+                                '거래유형': 'SALE',
+                                '층': floor_str,
+                                '층수': floor_num,
+                                '방향': '',
+                                '가격': sale_price_val,  # 이미 만원 단위
+                                '보증금': 0,
+                            })
+                            sale_count += 1
+                    
+                    # 전세 데이터 - count 값을 int로 변환하여 비교
+                    lease_price_val = listing.get('lease_price', 0)
+                    lease_count_val = int(listing.get('lease_count', 0)) if str(listing.get('lease_count', 0)).isdigit() else 0
                     
-                    if floor_num >= 4:
-                        sale_df = pd.DataFrame([{
-                            '면적타입': area_type,
-                            '전용면적': area,
-                            '거래유형': 'SALE',
-                            '층': floor_str,
-                            '층수': floor_num,
-                            '방향': '',
-                            '가격': sale_price_val,  # 이미 만원 단위
-                            '보증금': 0,
-                        }])
-                        db.save_prices(sale_df, complex_no)
-                        sale_count += 1
+                    if lease_price_val > 0 and lease_count_val > 0:
+                        floor_str = listing.get('lease_floor', '')
+                        floor_num = 15 if '고' in floor_str else 9 if '중' in floor_str else 5
+                        
+                        if floor_num >= 4:
+                            price_rows.append({
+                                '면적타입': area_type,
+                                '전용면적': area,
+                                '거래유형': 'LEASE',
+                                '층': floor_str,
+                                '층수': floor_num,
+                                '방향': '',
+                                '가격': 0,
+                                '보증금': lease_price_val,  # 이미 만원 단위
+                            })
+                            lease_count += 1
                 
-                # 전세 데이터 - count 값을 int로 변환하여 비교
-                lease_price_val = listing.get('lease_price', 0)
-                lease_count_val = int(listing.get('lease_count', 0)) if str(listing.get('lease_count', 0)).isdigit() else 0
+                # 재업로드 시 같은 매물은 last_seen만 갱신되므로 기존 데이터 삭제 불필요
+                if price_rows:
+                    writer.save_prices(pd.DataFrame(price_rows), complex_no)
+                writer.refresh_latest_listings([complex_no])
                 
-                if lease_price_val > 0 and lease_count_val > 0:
-                    floor_str = listing.get('lease_floor', '')
-                    floor_num = 15 if '고' in floor_str else 9 if '중' in floor_str else 5
-                    
-                    if floor_num >= 4:
-                        lease_df = pd.DataFrame([{
-                            '면적타입': area_type,
-                            '전용면적': area,
-                            '거래유형': 'LEASE',
-                            '층': floor_str,
-                            '층수': floor_num,
-                            '방향': '',
-                            '가격': 0,
-                            '보증금': lease_price_val,  # 이미 만원 단위
-                        }])
-                        db.save_prices(lease_df, complex_no)
-                        lease_count += 1
-            
-            st.sidebar.success(f"✅ {complex_name} 가져오기 성공!")
-            st.sidebar.info(f"매매 {sale_count}개, 전세 {lease_count}개")
+                st.sidebar.success(f"✅ {complex_name} 가져오기 성공!")
+                st.sidebar.info(f"매매 {sale_count}개, 전세 {lease_count}개")
+                # 가격 히스토리는 save_prices 저장 시점에 자동 갱신됨
             
-            # 🆕 가격 히스토리 자동 저장
-            db.save_daily_summary(complex_no)
-        
         # 캐시 클리어 및 즉시 새로고침
         st.cache_data.clear()
         st.success("✅ 데이터가 업데이트되었습니다! 페이지를 새로고침합니다...")
@@ -439,57 +450,32 @@ st.sidebar.markdown("---")
 # ================================
 
 def load_formatted_data(complex_no=None):
-    """데이터 로드 (항상 새 DB 연결로 최신 데이터 반영)"""
-    # 매번 새로운 DB 연결을 생성하여 최신 데이터 보장
-    fresh_db = RealEstateDB("data/real_estate.db")
-    
-    query = """
-    SELECT 
-        c.complex_no,
-        c.complex_name as 아파트명,
-        c.address as 주소,
-        c.total_households as 세대수,
-        c.build_year as 연식,
-        p.area_type as 면적타입,
-        p.exclusive_area as 면적_m2,
-        CASE 
-            WHEN p.transaction_type = 'SALE' THEN ROUND(p.price / 10000.0, 2)
-            ELSE 0
-        END as 매매가_억,
-        CASE 
-            WHEN p.transaction_type = 'LEASE' THEN ROUND(p.deposit / 10000.0, 2)
-            ELSE 0
-        END as 전세가_억,
-        p.transaction_type as 거래유형,
-        p.floor,
-        p.floor_number as 층수,
-        p.direction as 방향,
-        p.collected_at,
-        CASE p.transaction_type WHEN 'SALE' THEN '매매' WHEN 'LEASE' THEN '전세' ELSE '기타' END as 타입
-    FROM prices p
-    JOIN complexes c ON p.complex_no = c.complex_no
-    """
-    
-    params = []
-    
-    # 특정 단지 필터링
-    if complex_no:
-        query += " WHERE c.complex_no = ?"
-        params.append(complex_no)
-    
-    query += " ORDER BY c.complex_name, p.area_type, p.transaction_type"
+    """데이터 로드 (읽기 전용 연결 - WAL 모드라 크롤링 중에도 막히지 않음)"""
+    fresh_db = RealEstateDB(DEFAULT_DB_PATH, readonly=True)
     
     try:
-        result = pd.read_sql_query(query, fresh_db.conn, params=params)
-        fresh_db.close()  # 연결 종료
+        result = fresh_db.get_listings(complex_no)
+        fresh_db.close()  # 연결 반납
         return result
     except Exception as e:
         print(f"데이터 로드 오류: {e}")
         fresh_db.close()
         return pd.DataFrame()
 
+@st.cache_resource
+def get_analytics_engine():
+    """DuckDB 집계 엔진 (duckdb 미설치/초기화 실패 시 None → pandas 집계)"""
+    if not analytics.is_available():
+        return None
+    try:
+        return analytics.AnalyticsEngine(DEFAULT_DB_PATH)
+    except Exception as e:
+        print(f"DuckDB 집계 엔진 초기화 실패 (pandas 집계 사용): {e}")
+        return None
+
 # 데이터 로드
 df = load_formatted_data()
+watchlist_nos = None
 
 # 관심 단지 필터링
 if filter_mode == "내 관심 단지만" and current_watchlist:
@@ -545,18 +531,24 @@ st.sidebar.caption("ℹ️ 필터는 새 데이터 수집 시 적용됩니다")
 # 필터링 적용
 filtered_df = df.copy()
 
-if selected_type == "매매만":
-    filtered_df = filtered_df[filtered_df['거래유형'] == 'SALE']
-elif selected_type == "전세만":
-    filtered_df = filtered_df[filtered_df['거래유형'] == 'LEASE']
+type_filter = {"매매만": 'SALE', "전세만": 'LEASE'}.get(selected_type)
+if type_filter:
+    filtered_df = filtered_df[filtered_df['거래유형'] == type_filter]
+
+area_ranges = {"59m²": (56, 62), "75m²": (72, 78), "84m²": (81, 87)}
+area_range = area_ranges.get(selected_area)
+if area_range:
+    filtered_df = filtered_df[(filtered_df['면적_m2'] >= area_range[0]) & (filtered_df['면적_m2'] <= area_range[1])]
 
-if selected_area != "전체":
-    if "59" in selected_area:
-        filtered_df = filtered_df[(filtered_df['면적_m2'] >= 56) & (filtered_df['면적_m2'] <= 62)]
-    elif "75" in selected_area:
-        filtered_df = filtered_df[(filtered_df['면적_m2'] >= 72) & (filtered_df['면적_m2'] <= 78)]
-    elif "84" in selected_area:
-        filtered_df = filtered_df[(filtered_df['면적_m2'] >= 81) & (filtered_df['면적_m2'] <= 87)]
+# 통계 탭 집계: DuckDB가 있으면 같은 필터로 SQLite를 직접 집계, 없으면 filtered_df를 pandas로 집계
+analytics_engine = get_analytics_engine()
+analytics_filters = {'complex_nos': watchlist_nos, 'transaction_type': type_filter, 'area_range': area_range}
+
+def aggregate(name, *args, **kwargs):
+    """통계 탭 집계 (analytics 모듈의 같은 이름 함수/메소드)"""
+    if analytics_engine is not None:
+        return getattr(analytics_engine, name)(*args, **kwargs, **analytics_filters)
+    return getattr(analytics, name)(filtered_df, *args, **kwargs)
 
 # 통계 카드
 col1, col2, col3, col4 = st.columns(4)
@@ -614,17 +606,13 @@ with tab2:
     
     with col1:
         st.markdown("##### 매매가")
-        sale_df = filtered_df[filtered_df['매매가_억'] > 0].copy()
-        if not sale_df.empty:
-            sale_stats = sale_df.groupby('면적_m2').agg({
-                '매매가_억': ['count', 'mean', 'min', 'max']
-            }).round(1)
-            sale_stats.columns = ['매물수', '평균(억)', '최저(억)', '최고(억)']
-            st.dataframe(sale_stats, use_container_width=True)
+        # 투자금은 반올림 전 값으로 계산하고 표시할 때만 반올림
+        sale_stats = aggregate('area_price_stats', '매매가_억', rounded=False)
+        if not sale_stats.empty:
+            st.dataframe(sale_stats.round(1), use_container_width=True)
             
             # 아파트별 평균 가격 계산
-            sale_avg = sale_df.groupby(['아파트명', '면적_m2'])['매매가_억'].mean().reset_index()
-            sale_avg.columns = ['아파트명', '면적(m²)', '평균가격(억)']
+            sale_avg = aggregate('complex_area_averages', '매매가_억')
             
             # 59m² 차트
             sale_59 = sale_avg[(sale_avg['면적(m²)'] >= 56) & (sale_avg['면적(m²)'] <= 62)]
@@ -658,17 +646,12 @@ with tab2:
     
     with col2:
         st.markdown("##### 전세가")
-        lease_df = filtered_df[filtered_df['전세가_억'] > 0].copy()
-        if not lease_df.empty:
-            lease_stats = lease_df.groupby('면적_m2').agg({
-                '전세가_억': ['count', 'mean', 'min', 'max']
-            }).round(1)
-            lease_stats.columns = ['매물수', '평균(억)', '최저(억)', '최고(억)']
-            st.dataframe(lease_stats, use_container_width=True)
+        lease_stats = aggregate('area_price_stats', '전세가_억', rounded=False)
+        if not lease_stats.empty:
+            st.dataframe(lease_stats.round(1), use_container_width=True)
             
             # 아파트별 평균 가격 계산
-            lease_avg = lease_df.groupby(['아파트명', '면적_m2'])['전세가_억'].mean().reset_index()
-            lease_avg.columns = ['아파트명', '면적(m²)', '평균가격(억)']
+            lease_avg = aggregate('complex_area_averages', '전세가_억')
             
             # 59m² 차트
             lease_59 = lease_avg[(lease_avg['면적(m²)'] >= 56) & (lease_avg['면적(m²)'] <= 62)]
@@ -702,23 +685,17 @@ with tab2:
     
     with col3:
         st.markdown("##### 투자금 (매매가-전세가)")
-        # 면적별로 평균 매매가와 평균 전세가를 계산하여 투자금 산출
-        if not sale_df.empty and not lease_df.empty:
-            investment_data = []
-            for area in filtered_df['면적_m2'].unique():
-                area_sale = sale_df[sale_df['면적_m2'] == area]['매매가_억']
-                area_lease = lease_df[lease_df['면적_m2'] == area]['전세가_억']
-                
-                if not area_sale.empty and not area_lease.empty:
-                    investment_data.append({
-                        '면적(m²)': area,
-                        '평균투자금(억)': round(area_sale.mean() - area_lease.mean(), 1),
-                        '최소투자금(억)': round(area_sale.min() - area_lease.max(), 1),
-                        '최대투자금(억)': round(area_sale.max() - area_lease.min(), 1),
-                    })
+        # 면적별 매매/전세 통계를 맞춰 투자금 산출 (양쪽 모두 있는 면적만, 뺀 뒤 한 번만 반올림)
+        if not sale_stats.empty and not lease_stats.empty:
+            both = sale_stats.join(lease_stats, how='inner', lsuffix='_매매', rsuffix='_전세')
             
-            if investment_data:
-                investment_df = pd.DataFrame(investment_data).set_index('면적(m²)')
+            if not both.empty:
+                investment_df = pd.DataFrame({
+                    '평균투자금(억)': both['평균(억)_매매'] - both['평균(억)_전세'],
+                    '최소투자금(억)': both['최저(억)_매매'] - both['최고(억)_전세'],
+                    '최대투자금(억)': both['최고(억)_매매'] - both['최저(억)_전세'],
+                }).round(1)
+                investment_df.index.name = '면적(m²)'
                 st.dataframe(investment_df, use_container_width=True)
             else:
                 st.info("투자금 계산을 위한 데이터가 부족합니다.")
@@ -885,23 +862,19 @@ with tab4:
     st.subheader("🏢 아파트별 현황")
     
     # 아파트별 통계 테이블
-    apt_stats = filtered_df.groupby('아파트명').agg({
-        '세대수': 'first',
-        '연식': 'first',
-        '매매가_억': lambda x: f"{x[x>0].mean():.1f}" if (x>0).any() else "-",
-        '전세가_억': lambda x: f"{x[x>0].mean():.1f}" if (x>0).any() else "-",
-    }).reset_index()
+    apt_stats = aggregate('complex_stats')
     
-    apt_stats.columns = ['아파트명', '세대수', '연식', '평균매매가(억)', '평균전세가(억)']
+    for column in ['평균매매가(억)', '평균전세가(억)']:
+        apt_stats[column] = apt_stats[column].apply(lambda x: f"{x:.1f}" if pd.notna(x) else "-")
     
     st.dataframe(
-        apt_stats,
+        apt_stats.drop(columns=['매물수']),
         use_container_width=True,
         hide_index=True
     )
     
     # 아파트별 매물 수
-    apt_count = filtered_df.groupby('아파트명').size().reset_index(name='매물수')
+    apt_count = apt_stats[['아파트명', '매물수']]
     
     fig3 = px.bar(
         apt_count,
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+통계 탭 집계 벤치마크: pandas (현재 경로) vs DuckDB 집계 엔진
+
+임시 DB에 가상 매물을 채운 뒤 대시보드 한 번 재실행 시의 집계
+(면적별 통계 ×2, 아파트·면적별 평균 ×2, 아파트별 현황)를 두 경로로 측정
+
+사용법:
+    python benchmark_analytics.py --rows 1000000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src import analytics
+from src.database import RealEstateDB
+
+
+AREAS = [59.9, 74.8, 84.9, 101.2, 114.7]
+DIRECTIONS = ['남향', '남동향', '남서향', '동향', '서향']
+
+
+def populate(db, rows, complexes):
+    """latest_listings에 가상 매물 채우기"""
+    random.seed(42)
+    # 단지 속성 (세대수, 건축년도)은 단지마다 고정
+    attributes = [(random.randint(300, 3000), random.randint(1990, 2024)) for _ in range(complexes)]
+    batch = []
+    with db.conn:
+        for n in range(rows):
+            complex_no = str(100000 + n % complexes)
+            area = random.choice(AREAS)
+            is_sale = random.random() < 0.6
+            price = round(area * random.uniform(0.08, 0.25), 2)
+            batch.append((
+                f"{complex_no}|{n}", complex_no, f"테스트아파트{complex_no}", '서울특별시 강남구',
+                *attributes[n % complexes],
+                f"{int(area)}A", area, 'SALE' if is_sale else 'LEASE',
+                price if is_sale else 0, 0 if is_sale else round(price * 0.6, 2),
+                f"{random.randint(1, 30)}층", random.randint(1, 30), random.choice(DIRECTIONS),
+                '매매' if is_sale else '전세', '2026-01-16 09:00:00', 20260116,
+            ))
+            if len(batch) >= 50000:
+                db.conn.executemany(f"INSERT INTO latest_listings VALUES ({', '.join('?' * 17)})", batch)
+                batch = []
+        if batch:
+            db.conn.executemany(f"INSERT INTO latest_listings VALUES ({', '.join('?' * 17)})", batch)
+
+
+def run_pandas(db):
+    """현재 경로: 매물 전체를 DataFrame으로 불러와 groupby"""
+    df = db.get_listings()
+    for column in ['매매가_억', '전세가_억']:
+        analytics.area_price_stats(df, column)
+        analytics.complex_area_averages(df, column)
+    analytics.complex_stats(df)
+
+
+def run_duckdb(engine):
+    """DuckDB 경로: SQLite를 직접 집계해 결과만 받음"""
+    for column in ['매매가_억', '전세가_억']:
+        engine.area_price_stats(column)
+        engine.complex_area_averages(column)
+    engine.complex_stats()
+
+
+def measure(label, func, repeat):
+    """repeat회 실행 후 중앙값/최소값 출력 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"  {label:<8} 중앙값 {statistics.median(timings):>9,.1f} ms  (최소 {min(timings):,.1f} ms)")
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통계 탭 집계 벤치마크 (pandas vs DuckDB)")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="가상 매물 수")
+    parser.add_argument('--complexes', type=int, default=2000, help="가상 단지 수")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "benchmark.db")
+        db = RealEstateDB(db_path)
+
+        started = time.perf_counter()
+        populate(db, args.rows, args.complexes)
+        print(f"✓ 가상 매물 {args.rows:,}개 / 단지 {args.complexes:,}개 생성 ({time.perf_counter() - started:.1f}초)")
+
+        print(f"\n📊 대시보드 1회 재실행 집계 ({args.repeat}회 반복)")
+        pandas_ms = measure('pandas', lambda: run_pandas(db), args.repeat)
+
+        if analytics.is_available():
+            engine = analytics.AnalyticsEngine(db_path)
+            duckdb_ms = measure('duckdb', lambda: run_duckdb(engine), args.repeat)
+            engine.close()
+            print(f"\n  → DuckDB가 {pandas_ms / duckdb_ms:.1f}배 빠름" if duckdb_ms < pandas_ms
+                  else f"\n  → pandas가 {duckdb_ms / pandas_ms:.1f}배 빠름")
+        else:
+            print("  duckdb   미설치 (pip install duckdb 후 다시 실행)")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
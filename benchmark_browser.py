@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+브라우저 수집 프로필 벤치마크: full (모든 리소스 + networkidle) vs light (리소스 차단 + domcontentloaded)
+
+같은 단지들을 두 프로필로 수집해 단지당 처리 시간, 요청 허용/차단 수, 수신 바이트를 비교
+(config.yaml의 browser 설정을 바탕으로 프로필 항목만 바꾼 임시 설정 사용)
+
+사용법:
+    python benchmark_browser.py --complexes 12957 12965 180280 --contexts 1
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import yaml
+
+from src.browser_pool import BrowserPool
+from src.browser_scraper import scrape_complex
+from src.config import CONFIG_PATH
+
+
+PROFILES = {
+    'full': {'block_resources': [], 'block_hosts': [], 'wait_until': 'networkidle'},
+    'light': {},  # config.yaml 설정 그대로 (기본값: 경량 프로필)
+}
+
+
+def write_config(tmpdir: str, name: str, overrides: dict) -> str:
+    """config.yaml + 프로필 항목 → 임시 설정 파일"""
+    config = {}
+    if os.path.exists(CONFIG_PATH):
+        with open(CONFIG_PATH, encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    config['browser'] = {**(config.get('browser') or {}), **overrides}
+    path = os.path.join(tmpdir, f"{name}.yaml")
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(config, f, allow_unicode=True)
+    return path
+
+
+async def run_profile(name: str, config_path: str, complex_nos: list, contexts: int) -> dict:
+    """한 프로필로 단지 목록 수집 후 지표 반환"""
+    pool = BrowserPool(headless=True, contexts=contexts, config_path=config_path)
+    started = time.perf_counter()
+    listings = 0
+    async with pool:
+        for complex_no in complex_nos:
+            _, sale_df, lease_df = await scrape_complex(complex_no, pool=pool)
+            listings += len(sale_df) + len(lease_df)
+    return {
+        'name': name,
+        'seconds': time.perf_counter() - started,
+        'per_complex': pool.stats['busy_seconds'] / max(pool.stats['pages_served'], 1),
+        'listings': listings,
+        **pool.blocker.stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 수집 프로필 벤치마크 (full vs light)")
+    parser.add_argument('--complexes', nargs='+', default=['12957', '12965', '180280'], help="단지 번호")
+    parser.add_argument('--contexts', type=int, default=1, help="브라우저 컨텍스트 수")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, overrides in PROFILES.items():
+            print(f"\n🌐 {name} 프로필 수집 중...")
+            config_path = write_config(tmpdir, name, overrides)
+            results.append(asyncio.run(run_profile(name, config_path, args.complexes, args.contexts)))
+
+    print(f"\n📊 단지 {len(args.complexes)}개 수집 결과")
+    for r in results:
+        print(f"  {r['name']:<6} 단지당 {r['per_complex']:>5.1f}초  요청 허용 {r['allowed']:>5}개 / "
+              f"차단 {r['blocked']:>5}개  수신 {r['bytes'] / 1024 / 1024:>6.1f}MB  매물 {r['listings']}개")
+    full, light = results
+    if light['per_complex'] > 0 and full['bytes'] > 0:
+        print(f"\n  → light 프로필: {full['per_complex'] / light['per_complex']:.1f}배 빠름, "
+              f"수신량 {1 - light['bytes'] / full['bytes']:.0%} 감소")
+
+
+if __name__ == "__main__":
+    main()
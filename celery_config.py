@@ -28,6 +28,10 @@ app.conf.update(
     task_time_limit=30 * 60,  # 30분 타임아웃
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=50,
+    # DB 쓰기는 db_writer 큐 전용 단일 워커에서만 (그룹 커밋)
+    task_routes={
+        'worker.tasks.flush_ingest': {'queue': 'db_writer'},
+    },
 )
 
 # Celery Beat 스케줄 (주기적 작업)
@@ -36,6 +40,18 @@ app.conf.beat_schedule = {
         'task': 'worker.tasks.crawl_all_watchlist',
         'schedule': crontab(hour=2, minute=0),  # 매일 새벽 2시
     },
+    'summarize-prices-daily': {
+        'task': 'worker.tasks.summarize_prices_daily',
+        'schedule': crontab(hour=4, minute=0),  # 크롤링 이후 새벽 4시
+    },
+    'backup-database-daily': {
+        'task': 'worker.tasks.backup_database',
+        'schedule': crontab(hour=5, minute=0),  # 집계 이후 새벽 5시
+    },
+    'maintain-database-daily': {
+        'task': 'worker.tasks.maintain_database',
+        'schedule': crontab(hour=5, minute=30),  # 백업 이후 새벽 5시 30분
+    },
 }
 
 if __name__ == '__main__':
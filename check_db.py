@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
-import sqlite3
 import os
+from src.connection import DEFAULT_DB_PATH, get_pool
 
-db_path = 'data/real_estate.db'
+db_path = DEFAULT_DB_PATH
 
 if os.path.exists(db_path):
-    conn = sqlite3.connect(db_path)
+    pool = get_pool(db_path, readonly=True)
+    conn = pool.acquire()
     cursor = conn.cursor()
     
     # 1. complexes 테이블 데이터 확인
@@ -19,9 +20,9 @@ if os.path.exists(db_path):
         for row in cursor.fetchall():
             print(f"  {row[0]} | {row[1]}")
     
-    # 2. prices 테이블 데이터 확인
-    print("\n=== PRICES 테이블 ===")
-    cursor.execute("SELECT COUNT(*) FROM prices")
+    # 2. listings 테이블 데이터 확인 (매물별 현재 가격)
+    print("\n=== LISTINGS 테이블 ===")
+    cursor.execute("SELECT COUNT(*) FROM listings")
     count = cursor.fetchone()[0]
     print(f"매물 개수: {count}")
     
@@ -29,17 +30,20 @@ if os.path.exists(db_path):
         cursor.execute("""
             SELECT 
                 c.complex_name,
-                p.area_type,
-                p.transaction_type,
-                p.price,
-                p.deposit
-            FROM prices p
-            JOIN complexes c ON p.complex_no = c.complex_no
+                l.area_type,
+                l.transaction_type,
+                l.price,
+                l.deposit
+            FROM listings l
+            JOIN complexes c ON l.complex_no = c.complex_no
             LIMIT 20
         """)
         for row in cursor.fetchall():
             print(f"  {row}")
     
-    conn.close()
+    cursor.execute("SELECT COUNT(*) FROM prices")
+    print(f"가격 변경 이력: {cursor.fetchone()[0]}건")
+    
+    pool.release(conn)
 else:
     print("❌ 데이터베이스 파일 없음")
@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 import pandas as pd
 from src.database import RealEstateDB
+from src.connection import DEFAULT_DB_PATH
 import os # Added for os.path.isdir, os.path.isfile, os.path.join
 
 def parse_floor_str_to_num(floor_str):
@@ -171,13 +172,48 @@ def import_complex_data(complex_data, db):
     else:
         print("  - 전세 데이터 없음")
     
+    # 대시보드 현재 매물 스냅샷 갱신
+    db.refresh_latest_listings([complex_no])
+    
     print(f"\n🎉 {complex_name} 데이터 가져오기 완료!")
     print(f"   총 {len(sale_listings) + len(lease_listings)}개 매물")
     
     return True
 
 
-def import_directory(directory_path, db_path="data/real_estate.db"):
+def import_json_file(json_path, db_path=DEFAULT_DB_PATH):
+    """
+    JSON 파일 하나 가져오기
+    
+    지원 형식:
+    - {"metadata": {...}, "listings": [...]}
+    - {"metadata": {...}, "complexes": [{"metadata": {...}, "listings": [...]}]}
+    """
+    print(f"📄 {json_path}")
+    
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            json_data = json.load(f)
+    except Exception as e:
+        print(f"❌ JSON 파일 읽기 실패: {e}")
+        return False
+    
+    if isinstance(json_data.get('complexes'), list):
+        complexes_list = json_data['complexes']
+    else:
+        complexes_list = [json_data]
+    
+    db = RealEstateDB(db_path)
+    try:
+        for complex_data in complexes_list:
+            import_complex_data(complex_data, db)
+    finally:
+        db.close()
+    
+    return True
+
+
+def import_directory(directory_path, db_path=DEFAULT_DB_PATH):
     """
     디렉토리 내 모든 JSON 파일 가져오기
     """
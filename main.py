@@ -1,12 +1,37 @@
 from src.crawler import get_filtered_complexes, get_listings_api
+from src.async_crawler import crawl_listings
 from src.database import RealEstateDB
-from src.browser_scraper import scrape_complex
+from src.browser_scraper import scrape_complexes
+from src.browser_pool import BrowserPool
+from src.http_client import get_client
 import time
 import asyncio
 
 # === 설정 ===
 USE_BROWSER_SCRAPING = True   # ✅ 브라우저 자동화 활성화 (실제 네이버 데이터 수집)
 HEADLESS = False              # ✅ 브라우저 창 보이도록 설정
+REFRESH_METADATA = False      # True면 단지 목록/개요를 디스크 캐시 없이 새로 조회
+USE_ASYNC_API = False         # API 방식일 때 전체 단지를 비동기로 동시 수집 (config.yaml crawler.rate_limit 준수)
+
+def save_listings(db, c_no, *dfs):
+    """필터링 후 매물 저장 (빈 DataFrame은 건너뜀)"""
+    from src.filter import filter_listings
+    for df in dfs:
+        if not df.empty:
+            db.save_prices(filter_listings(df), c_no)
+
+
+async def scrape_with_browser(db, complexes):
+    """브라우저 컨텍스트 여러 개로 동시 수집, 끝나는 단지부터 바로 저장"""
+    names = dict(zip(complexes['단지번호'].astype(str), complexes['단지명']))
+    
+    def on_result(c_no, complex_info, df_sale, df_lease):
+        print(f"  ✓ {names.get(c_no, c_no)} ({c_no}): 매매 {len(df_sale)}개, 전세 {len(df_lease)}개")
+        save_listings(db, c_no, df_sale, df_lease)
+    
+    # 브라우저는 수집 전체에서 한 번만 실행 (단지마다 페이지 이동만)
+    async with BrowserPool(headless=HEADLESS) as pool:
+        return await scrape_complexes(list(names), pool, on_result=on_result)
 
 def job():
     # 1. DB 연결
@@ -14,79 +39,75 @@ def job():
 
     # 2. 단지 리스트 갱신 (필요 시)
     print(">>> 단지 리스트 갱신 중...")
-    complexes = get_filtered_complexes() 
+    complexes = get_filtered_complexes(refresh=REFRESH_METADATA)
     db.save_complexes(complexes)
 
     # 3. 가격 데이터 수집 (매매 + 전세)
     print(">>> 가격 데이터 수집 시작...")
     print("  필터링 기준: 4층 이상, 59m²/84m² 면적")
     
-    for idx, row in complexes.iterrows():
-        c_no = row['단지번호']
-        c_name = row['단지명']
-        
-        print(f"\n[{idx+1}/{len(complexes)}] {c_name} ({c_no})")
-        
-        if USE_BROWSER_SCRAPING:
-            # 브라우저 자동화 사용
-            print("  - 브라우저 자동화로 데이터 수집 중...")
+    if USE_BROWSER_SCRAPING:
+        # 브라우저 자동화 사용 (config.yaml browser.contexts개 동시, crawler.rate_limit 간격)
+        print("  - 브라우저 자동화로 데이터 수집 중...")
+        summary = asyncio.run(scrape_with_browser(db, complexes))
+        if summary['failed']:
+            print(f"  ❌ 브라우저 스크래핑 실패: {', '.join(summary['failed'])}")
+    else:
+        prefetched = {}
+        if USE_ASYNC_API:
             try:
-                complex_info, df_sale, df_lease = asyncio.run(
-                    scrape_complex(c_no, headless=HEADLESS)
-                )
-                
-                # 필터링 적용
-                from src.filter import filter_listings
-                if not df_sale.empty:
-                    df_sale = filter_listings(df_sale)
-                    db.save_prices(df_sale, c_no)
-                if not df_lease.empty:
-                    df_lease = filter_listings(df_lease)
-                    db.save_prices(df_lease, c_no)
-                
-                time.sleep(3)  # Rate limiting
-                
+                prefetched = crawl_listings(complexes['단지번호'].astype(str).tolist())
             except Exception as e:
-                print(f"  ❌ 브라우저 스크래핑 실패: {e}")
+                # 미리 수집하지 못한 단지는 아래 기존 방식으로 수집
+                print(f"  ⚠ 비동기 수집 실패 - 단지별 순차 수집으로 진행: {e}")
+        
+        for idx, row in complexes.iterrows():
+            c_no = row['단지번호']
+            c_name = row['단지명']
+            
+            print(f"\n[{idx+1}/{len(complexes)}] {c_name} ({c_no})")
+            
+            if str(c_no) in prefetched:
+                # 비동기 크롤러로 미리 수집한 매물
+                save_listings(db, c_no, *prefetched[str(c_no)])
                 continue
-        else:
+            
             # 기존 API/샘플 데이터 방식
             print("  - 매매 데이터 조회 중...")
-            df_sale = get_listings_api(c_no, transaction_type='SALE')
-            if not df_sale.empty:
-                from src.filter import filter_listings
-                df_sale = filter_listings(df_sale)
-                db.save_prices(df_sale, c_no)
+            save_listings(db, c_no, get_listings_api(c_no, transaction_type='SALE'))
             time.sleep(1)
             
             print("  - 전세 데이터 조회 중...")
-            df_lease = get_listings_api(c_no, transaction_type='LEASE')
-            if not df_lease.empty:
-                from src.filter import filter_listings
-                df_lease = filter_listings(df_lease)
-                db.save_prices(df_lease, c_no)
+            save_listings(db, c_no, get_listings_api(c_no, transaction_type='LEASE'))
             time.sleep(1)
-
+    
     print("\n>>> 수집 완료")
     
+    # 대시보드 현재 매물 스냅샷 재구성
+    db.refresh_latest_listings()
+    
     # 결과 요약
     print("\n=== 수집 결과 요약 ===")
     db.cursor.execute("SELECT COUNT(*) FROM complexes")
     complex_count = db.cursor.fetchone()[0]
     
-    db.cursor.execute("SELECT COUNT(*) FROM prices WHERE transaction_type='SALE'")
+    db.cursor.execute("SELECT COUNT(*) FROM listings WHERE transaction_type='SALE'")
     sale_count = db.cursor.fetchone()[0]
     
-    db.cursor.execute("SELECT COUNT(*) FROM prices WHERE transaction_type='LEASE'")
+    db.cursor.execute("SELECT COUNT(*) FROM listings WHERE transaction_type='LEASE'")
     lease_count = db.cursor.fetchone()[0]
     
-    db.cursor.execute("SELECT COUNT(DISTINCT area_type) FROM prices")
+    db.cursor.execute("SELECT COUNT(DISTINCT area_type) FROM listings")
     area_types = db.cursor.fetchone()[0]
     
     print(f"단지 수: {complex_count}개")
     print(f"매매 매물: {sale_count}개")
     print(f"전세 매물: {lease_count}개")
     print(f"면적 타입: {area_types}개")
+    if get_client().stats['requests']:
+        print(get_client().summary())
+    
+    db.close()
 
 if __name__ == "__main__":
     job()
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+대시보드 집계 엔진
+가격 분석 / 아파트별 통계 탭의 집계를 pandas 대신 DuckDB(내장 컬럼형 엔진)에서 실행
+
+- DuckDB가 SQLite 파일을 읽기 전용으로 ATTACH → 필터/집계를 벡터화된 SQL로 처리
+  (매물 행 전체를 pandas로 가져오지 않고 집계 결과만 받음)
+- Parquet 아카이브도 같은 엔진에서 바로 조회
+- duckdb가 설치된 경우에만 사용 가능 (선택 의존성)
+  미설치 시 같은 결과를 내는 pandas 함수(area_price_stats 등)를 사용
+"""
+
+import glob
+import os
+import pandas as pd
+
+from src.connection import DEFAULT_DB_PATH
+
+
+# 표시용 가격 컬럼 → latest_listings 컬럼
+PRICE_COLUMNS = {
+    '매매가_억': 'sale_eok',
+    '전세가_억': 'lease_eok',
+}
+
+AREA_STATS_COLUMNS = ['매물수', '평균(억)', '최저(억)', '최고(억)']
+COMPLEX_STATS_COLUMNS = ['아파트명', '세대수', '연식', '평균매매가(억)', '평균전세가(억)', '매물수']
+
+
+def is_available() -> bool:
+    """DuckDB 집계 엔진 사용 가능 여부 (duckdb 설치 확인)"""
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# ================================
+# pandas 집계 (duckdb 미설치 시 / 이미 불러온 DataFrame용)
+# ================================
+
+def area_price_stats(df: pd.DataFrame, column: str, rounded: bool = True) -> pd.DataFrame:
+    """
+    면적별 가격 통계 (가격 분석 탭)
+
+    Args:
+        df: get_listings() 결과 (필터 적용 후)
+        column: '매매가_억' 또는 '전세가_억'
+        rounded: False면 반올림하지 않은 값 (투자금처럼 다시 계산할 때 - 계산 후 한 번만 반올림)
+
+    Returns:
+        DataFrame: 면적_m2 인덱스, 매물수/평균/최저/최고 (가격 0 이하 제외)
+    """
+    rows = df[df[column] > 0]
+    stats = rows.groupby('면적_m2')[column].agg(['count', 'mean', 'min', 'max'])
+    if rounded:
+        stats = stats.round(1)
+    stats.columns = AREA_STATS_COLUMNS
+    return stats
+
+
+def complex_area_averages(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    아파트·면적별 평균 가격 (가격 분석 탭 차트)
+
+    Returns:
+        DataFrame: 아파트명, 면적(m²), 평균가격(억)
+    """
+    rows = df[df[column] > 0]
+    averages = rows.groupby(['아파트명', '면적_m2'])[column].mean().reset_index()
+    averages.columns = ['아파트명', '면적(m²)', '평균가격(억)']
+    return averages
+
+
+def complex_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    아파트별 현황 (아파트별 통계 탭)
+
+    Returns:
+        DataFrame: 아파트명, 세대수, 연식, 평균매매가(억), 평균전세가(억), 매물수
+                   (가격 평균은 0 초과 매물만, 없으면 NaN)
+    """
+    stats = df.groupby('아파트명').agg(
+        세대수=('세대수', 'first'),
+        연식=('연식', 'first'),
+        평균매매가=('매매가_억', lambda x: x[x > 0].mean()),
+        평균전세가=('전세가_억', lambda x: x[x > 0].mean()),
+        매물수=('아파트명', 'size'),
+    ).reset_index()
+    stats.columns = COMPLEX_STATS_COLUMNS
+    return stats
+
+
+# ================================
+# DuckDB 집계 엔진
+# ================================
+
+class AnalyticsEngine:
+    """SQLite 파일 + Parquet 아카이브를 ATTACH한 DuckDB 집계 엔진"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, archive_dir: str = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (읽기 전용으로 ATTACH)
+            archive_dir: Parquet 아카이브 디렉터리 (기본값: DB 파일 옆 archive/)
+        """
+        import duckdb
+
+        self.db_path = db_path
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(db_path), 'archive')
+        self.conn = duckdb.connect()
+        # sqlite 확장: 최초 1회 설치(다운로드) 후 로컬 캐시 사용
+        self.conn.execute("INSTALL sqlite")
+        self.conn.execute("LOAD sqlite")
+        path = os.path.abspath(db_path).replace("'", "''")
+        self.conn.execute(f"ATTACH '{path}' AS live (TYPE SQLITE, READ_ONLY)")
+
+    def query(self, sql: str, params: list = None) -> pd.DataFrame:
+        """DuckDB SQL 실행 (SQLite 테이블은 live.<테이블>로 참조)"""
+        # 커서마다 별도 연결 → Streamlit 세션(스레드) 간 엔진 공유 가능
+        cursor = self.conn.cursor()
+        try:
+            return cursor.execute(sql, params or []).df()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _where(complex_nos=None, transaction_type=None, area_range=None) -> tuple:
+        """대시보드 필터 → latest_listings WHERE 절과 파라미터"""
+        conditions = ['1 = 1']
+        params = []
+        if complex_nos is not None:
+            complex_nos = list(complex_nos)
+            if not complex_nos:
+                return '1 = 0', []
+            conditions.append(f"complex_no IN ({', '.join('?' * len(complex_nos))})")
+            params.extend(str(complex_no) for complex_no in complex_nos)
+        if transaction_type:
+            conditions.append('transaction_type = ?')
+            params.append(transaction_type)
+        if area_range:
+            conditions.append('exclusive_area BETWEEN ? AND ?')
+            params.extend(area_range)
+        return ' AND '.join(conditions), params
+
+    def area_price_stats(self, column: str, rounded: bool = True, **filters) -> pd.DataFrame:
+        """
+        면적별 가격 통계 (pandas area_price_stats와 같은 결과)
+
+        Args:
+            column: '매매가_억' 또는 '전세가_억'
+            rounded: False면 반올림하지 않은 값
+            **filters: complex_nos, transaction_type, area_range(최소, 최대)
+        """
+        price = PRICE_COLUMNS[column]
+        where, params = self._where(**filters)
+
+        def value(aggregate):
+            return f'ROUND({aggregate}, 1)' if rounded else aggregate
+
+        stats = self.query(f'''
+            SELECT
+                exclusive_area AS "면적_m2",
+                COUNT(*) AS "매물수",
+                {value(f'AVG({price})')} AS "평균(억)",
+                {value(f'MIN({price})')} AS "최저(억)",
+                {value(f'MAX({price})')} AS "최고(억)"
+            FROM live.latest_listings
+            WHERE {where} AND {price} > 0
+            GROUP BY exclusive_area
+            ORDER BY exclusive_area
+        ''', params)
+        return stats.set_index('면적_m2')
+
+    def complex_area_averages(self, column: str, **filters) -> pd.DataFrame:
+        """아파트·면적별 평균 가격 (pandas complex_area_averages와 같은 결과)"""
+        price = PRICE_COLUMNS[column]
+        where, params = self._where(**filters)
+        return self.query(f'''
+            SELECT
+                complex_name AS "아파트명",
+                exclusive_area AS "면적(m²)",
+                AVG({price}) AS "평균가격(억)"
+            FROM live.latest_listings
+            WHERE {where} AND {price} > 0
+            GROUP BY complex_name, exclusive_area
+            ORDER BY complex_name, exclusive_area
+        ''', params)
+
+    def complex_stats(self, **filters) -> pd.DataFrame:
+        """아파트별 현황 (pandas complex_stats와 같은 결과)"""
+        where, params = self._where(**filters)
+        return self.query(f'''
+            SELECT
+                complex_name AS "아파트명",
+                FIRST(total_households) AS "세대수",
+                FIRST(build_year) AS "연식",
+                AVG(sale_eok) FILTER (WHERE sale_eok > 0) AS "평균매매가(억)",
+                AVG(lease_eok) FILTER (WHERE lease_eok > 0) AS "평균전세가(억)",
+                COUNT(*) AS "매물수"
+            FROM live.latest_listings
+            WHERE {where}
+            GROUP BY complex_name
+            ORDER BY complex_name
+        ''', params)
+
+    def price_history(self, complex_no: str, start_day: int = None) -> pd.DataFrame:
+        """
+        가격 히스토리 (SQLite + Parquet 아카이브를 한 쿼리로 조회)
+
+        Args:
+            complex_no: 단지 번호
+            start_day: 시작 날짜 키 YYYYMMDD (선택)
+        """
+        columns = '''
+            complex_no, area_type, CAST(record_date AS VARCHAR) AS record_date, record_day,
+            sale_avg_price, lease_avg_price, gap_investment, lease_ratio
+        '''
+        sources = [f'SELECT {columns} FROM live.price_history']
+        pattern = os.path.join(self.archive_dir, 'price_history', '**', '*.parquet')
+        if glob.glob(pattern, recursive=True):
+            path = pattern.replace("'", "''")
+            sources.append(f"SELECT {columns} FROM read_parquet('{path}', hive_partitioning = true)")
+
+        return self.query(f'''
+            SELECT * FROM ({' UNION ALL '.join(sources)})
+            WHERE complex_no = ? AND record_day >= ?
+            ORDER BY area_type, record_day
+        ''', [str(complex_no), start_day or 0])
+
+    def close(self):
+        """DuckDB 연결 종료"""
+        self.conn.close()
@@ -0,0 +1,109 @@
+"""
+오래된 가격 데이터 Parquet 보관(아카이브) 계층
+보존 기간이 지난 데이터를 SQLite에서 빼내 월/지역별 압축 Parquet 파일로 저장
+
+디렉터리 구조 (Hive 파티션 형식):
+    {archive_dir}/{dataset}/month=YYYYMM/region=서울특별시_강남구/{name}.parquet
+
+pyarrow가 설치된 경우에만 사용 가능 (선택 의존성)
+"""
+
+import os
+import pandas as pd
+
+
+COMPRESSION = 'zstd'
+
+
+def is_available() -> bool:
+    """Parquet 읽기/쓰기 가능 여부 (pyarrow 설치 확인)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def region_of(address) -> str:
+    """주소 → 지역 파티션 키 (시/도 + 시/군/구, 예: '서울특별시_강남구')"""
+    parts = str(address or '').replace('/', ' ').replace('=', ' ').split()[:2]
+    return '_'.join(parts) if parts else 'unknown'
+
+
+def write_archive(df: pd.DataFrame, dataset: str, name: str, archive_dir: str, day_column: str,
+                  keys: list = None) -> list:
+    """
+    DataFrame을 월/지역 파티션별 Parquet 파일로 저장
+
+    같은 name의 파일이 이미 있으면 기존 행과 합쳐 다시 저장
+    (keys 기준 중복은 새 행으로 대체 → 재실행해도 중복/유실 없음)
+
+    Args:
+        df: 저장할 데이터 (address 컬럼이 있으면 지역 파티션 키로 사용)
+        dataset: 데이터셋 이름 ('prices', 'price_history')
+        name: 파일 이름 (확장자 제외, 예: 원본 파티션 이름)
+        archive_dir: 아카이브 루트 디렉터리
+        day_column: 날짜 키(YYYYMMDD) 컬럼 이름
+        keys: 행 식별 컬럼 목록 (기존 파일과 합칠 때 중복 판단용)
+
+    Returns:
+        list[str]: 저장된 파일 경로
+    """
+    if df is None or df.empty:
+        return []
+
+    addresses = df['address'] if 'address' in df.columns else pd.Series('', index=df.index)
+    df = df.drop(columns=['address'], errors='ignore').assign(
+        month=df[day_column] // 100,
+        region=addresses.map(region_of),
+    )
+
+    paths = []
+    for (month, region), group in df.groupby(['month', 'region'], sort=True):
+        directory = os.path.join(archive_dir, dataset, f"month={month}", f"region={region}")
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f"{name}.parquet")
+        group = group.drop(columns=['month', 'region'])
+        if os.path.exists(path):
+            group = pd.concat([pd.read_parquet(path), group], ignore_index=True)
+            group = group.drop_duplicates(subset=keys, keep='last')
+        group = group.sort_values(['complex_no', day_column])
+        group.to_parquet(path, compression=COMPRESSION, index=False)
+        paths.append(path)
+
+    return paths
+
+
+def read_archive(dataset: str, archive_dir: str, day_column: str,
+                 complex_no: str = None, start_day: int = None, end_day: int = None) -> pd.DataFrame:
+    """
+    아카이브 Parquet 조회 (월 파티션 디렉터리 + 컬럼 통계로 필요한 파일/행만 읽음)
+
+    Args:
+        dataset: 데이터셋 이름 ('prices', 'price_history')
+        archive_dir: 아카이브 루트 디렉터리
+        day_column: 날짜 키(YYYYMMDD) 컬럼 이름
+        complex_no: 단지 번호 (선택)
+        start_day: 시작 날짜 키 (선택, 포함)
+        end_day: 종료 날짜 키 (선택, 포함)
+
+    Returns:
+        DataFrame: 조회 결과 (아카이브가 없거나 pyarrow 미설치 시 빈 DataFrame)
+    """
+    path = os.path.join(archive_dir, dataset)
+    if not os.path.isdir(path) or not is_available():
+        return pd.DataFrame()
+
+    filters = []
+    if complex_no is not None:
+        filters.append(('complex_no', '==', str(complex_no)))
+    if start_day is not None:
+        filters.append(('month', '>=', start_day // 100))
+        filters.append((day_column, '>=', start_day))
+    if end_day is not None:
+        filters.append(('month', '<=', end_day // 100))
+        filters.append((day_column, '<=', end_day))
+
+    df = pd.read_parquet(path, filters=filters or None)
+    return df.drop(columns=['month', 'region'], errors='ignore')
@@ -0,0 +1,262 @@
+"""
+비동기 API 크롤러
+네이버 부동산 API를 asyncio + httpx로 여러 단지 동시에 호출
+
+- 요청마다 time.sleep으로 대기하던 동기 수집기(scraper.scrape_articles 등)와 달리
+  한 단지가 대기하는 동안 다른 단지의 요청이 진행됨
+- 모든 요청이 하나의 토큰 버킷(TokenBucket)을 공유 → 전체 요청 속도는 config.yaml의
+  crawler.rate_limit(요청 간격, 초)을 넘지 않음 (동시 실행 수와 무관)
+- 429 응답 시 버킷 전체에 대기 시간을 부과해 모든 요청이 함께 물러남 (지수 백오프)
+- 응답 파싱은 동기 수집기와 같은 함수(parse_overview, parse_articles, parse_listings) 사용
+- httpx가 설치된 경우에만 사용 가능 (선택 의존성)
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.config import CONFIG_PATH, load_section
+from src.crawler import listings_params, parse_listings
+from src.http_client import cache_key, get_client
+from src.scraper import BASE_URL, HEADERS, articles_params, parse_articles, parse_overview
+
+
+DEFAULT_SETTINGS = {
+    'rate_limit': 2.0,   # 요청 간격 (초) - 전체 요청 기준
+    'max_retries': 3,
+    'timeout': 30,       # 초
+    'concurrency': 8,    # 동시에 수집할 단지 수
+}
+
+# 429 응답 시 첫 대기 시간 (초) - 재시도마다 2배
+BACKOFF_BASE = 2.0
+
+
+def is_available() -> bool:
+    """비동기 크롤러 사용 가능 여부 (httpx 설치 확인)"""
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def load_settings(config_path: str = CONFIG_PATH) -> dict:
+    """config.yaml의 crawler 설정 (없는 항목은 기본값)"""
+    return load_section('crawler', DEFAULT_SETTINGS, config_path)
+
+
+class TokenBucket:
+    """asyncio 토큰 버킷 (모든 코루틴이 공유하는 요청 속도 제한)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (버스트)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.waited = 0.0  # 누적 대기 시간 (초)
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (대기 중인 코루틴은 도착 순서대로 통과)"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+                self.waited += wait
+                await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """seconds만큼 토큰을 미리 소진 → 이후 모든 요청이 그만큼 늦게 출발"""
+        self._refill()
+        self.tokens -= seconds * self.rate
+
+
+class AsyncCrawler:
+    """토큰 버킷을 공유하는 비동기 API 크롤러 (async with로 사용)"""
+
+    def __init__(self, rate_limit: float = None, max_retries: int = None, timeout: float = None,
+                 concurrency: int = None, config_path: str = CONFIG_PATH, **client_kwargs):
+        """
+        Args:
+            rate_limit: 요청 간격 (초, 기본값: config.yaml crawler.rate_limit)
+            max_retries: 429 응답 시 최대 재시도 횟수
+            timeout: 요청 타임아웃 (초)
+            concurrency: 동시에 수집할 단지 수
+            config_path: 설정 파일 경로
+            **client_kwargs: httpx.AsyncClient 추가 인자 (transport 등)
+        """
+        settings = load_settings(config_path)
+        self.rate_limit = rate_limit if rate_limit is not None else settings['rate_limit']
+        self.max_retries = max_retries if max_retries is not None else settings['max_retries']
+        self.timeout = timeout if timeout is not None else settings['timeout']
+        self.concurrency = concurrency or settings['concurrency']
+        self.client_kwargs = client_kwargs
+        self.bucket = TokenBucket(1 / self.rate_limit) if self.rate_limit > 0 else None
+        self.client = None
+        self.stats = {'requests': 0, 'retries': 0, 'errors': 0}
+
+    async def __aenter__(self):
+        import httpx
+        self.client = httpx.AsyncClient(headers=HEADERS, timeout=self.timeout, **self.client_kwargs)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.aclose()
+        self.client = None
+
+    async def fetch_json(self, path: str, params: dict) -> Optional[dict]:
+        """
+        API GET 요청 (토큰 버킷 대기 + 429 지수 백오프)
+
+        Returns:
+            dict: JSON 응답 (실패 시 None)
+        """
+        import httpx
+
+        for attempt in range(self.max_retries + 1):
+            if self.bucket:
+                await self.bucket.acquire()
+            self.stats['requests'] += 1
+            try:
+                response = await self.client.get(f"{BASE_URL}{path}", params=params)
+                if response.status_code == 429:
+                    if attempt >= self.max_retries:
+                        print("  ⚠ Rate limit 도달 - 최대 재시도 횟수 초과")
+                        break
+                    wait = BACKOFF_BASE * (2 ** attempt)
+                    print(f"  ⚠ Rate limit (429) - 전체 요청 {wait}초 대기 후 재시도...")
+                    self.stats['retries'] += 1
+                    if self.bucket:
+                        self.bucket.penalize(wait)
+                    else:
+                        await asyncio.sleep(wait)
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPError as e:
+                print(f"  ⚠ API 오류 ({path}): {e}")
+                break
+            except ValueError as e:
+                # 200 응답이지만 JSON이 아님 (차단/점검 페이지 등)
+                print(f"  ⚠ API 응답 파싱 실패 ({path}): {e}")
+                break
+
+        self.stats['errors'] += 1
+        return None
+
+    async def complex_overview(self, complex_no: str, refresh: bool = False) -> Dict:
+        """단지 개요 정보 (scraper.scrape_complex_overview와 같은 결과, 같은 디스크 캐시 사용)"""
+        path, params = f"/complexes/overview/{complex_no}", {'complexNo': complex_no}
+        client = get_client()
+        data = None if refresh else client.cached_json('complex_overview', f"{BASE_URL}{path}", params)
+        if data is None:
+            data = await self.fetch_json(path, params)
+            if data and client.cache:
+                client.cache.put('complex_overview', cache_key(f"{BASE_URL}{path}", params), data)
+        return parse_overview(data, complex_no) if data else {}
+
+    async def articles(self, complex_no: str, trade_type: str = 'A1', max_pages: int = 3) -> List[Dict]:
+        """매물 리스트 (scraper.scrape_articles와 같은 결과)"""
+        transaction_type = 'SALE' if trade_type == 'A1' else 'LEASE'
+        listings = []
+        for page in range(1, max_pages + 1):
+            data = await self.fetch_json(f"/articles/complex/{complex_no}",
+                                         articles_params(complex_no, trade_type, page))
+            articles = (data or {}).get('articleList', [])
+            if not articles:
+                break
+            listings.extend(parse_articles(articles, transaction_type))
+        return listings
+
+    async def listings(self, complex_no: str, transaction_type: str = 'SALE') -> pd.DataFrame:
+        """매물 DataFrame (crawler.get_listings_api 실제 API 경로와 같은 결과)"""
+        data = await self.fetch_json(f"/articles/complex/{complex_no}",
+                                     listings_params(complex_no, transaction_type))
+        return parse_listings((data or {}).get('articleList', []), transaction_type)
+
+    async def complex_full_data(self, complex_no: str, max_pages: int = 2) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
+        """단지 정보 + 매매 + 전세 (scraper.scrape_complex_full_data와 같은 결과)"""
+        complex_info, sale, lease = await asyncio.gather(
+            self.complex_overview(complex_no),
+            self.articles(complex_no, 'A1', max_pages),
+            self.articles(complex_no, 'B1', max_pages),
+        )
+        return complex_info, pd.DataFrame(sale), pd.DataFrame(lease)
+
+    async def _gather(self, complex_nos: List[str], fetch) -> Dict:
+        """
+        단지별 fetch를 최대 concurrency개씩 동시 실행 (입력 순서대로 반환)
+        한 단지의 예외가 다른 단지 수집을 중단하지 않도록 실패한 단지는 결과에서 제외
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(complex_no):
+            async with semaphore:
+                try:
+                    return complex_no, await fetch(complex_no)
+                except Exception as e:
+                    print(f"  ⚠ [{complex_no}] 비동기 수집 실패: {e}")
+                    return complex_no, None
+
+        results = await asyncio.gather(*(run(str(complex_no)) for complex_no in complex_nos))
+        return {complex_no: result for complex_no, result in results if result is not None}
+
+    async def crawl_complexes(self, complex_nos: List[str], max_pages: int = 2) -> Dict:
+        """
+        여러 단지의 전체 데이터 동시 수집
+
+        Returns:
+            dict: 단지 번호 → (complex_info, sale_df, lease_df) (실패한 단지는 제외)
+        """
+        return await self._gather(complex_nos, lambda c: self.complex_full_data(c, max_pages))
+
+    async def crawl_listings(self, complex_nos: List[str]) -> Dict:
+        """
+        여러 단지의 매매/전세 매물 동시 수집
+
+        Returns:
+            dict: 단지 번호 → (sale_df, lease_df) (실패한 단지는 제외)
+        """
+        async def fetch(complex_no):
+            return await asyncio.gather(self.listings(complex_no, 'SALE'), self.listings(complex_no, 'LEASE'))
+
+        return await self._gather(complex_nos, fetch)
+
+
+def crawl_listings(complex_nos: List[str], **kwargs) -> Dict:
+    """
+    동기 코드용: 여러 단지의 매매/전세 매물을 동시에 수집
+
+    Args:
+        complex_nos: 단지 번호 목록
+        **kwargs: AsyncCrawler 인자 (rate_limit, concurrency 등)
+
+    Returns:
+        dict: 단지 번호 → (sale_df, lease_df) (실패한 단지는 제외)
+    """
+    async def run():
+        async with AsyncCrawler(**kwargs) as crawler:
+            started = time.perf_counter()
+            results = await crawler.crawl_listings(complex_nos)
+            print(f"  ✓ 비동기 수집: 단지 {len(results)}개, 요청 {crawler.stats['requests']}회 "
+                  f"(재시도 {crawler.stats['retries']}, 실패 {crawler.stats['errors']}), "
+                  f"{time.perf_counter() - started:.1f}초")
+            return results
+
+    return asyncio.run(run())
@@ -0,0 +1,107 @@
+"""
+SQLite 온라인 백업
+SQLite 백업 API로 운영 중인 DB를 작은 페이지 단위로 복사해 gzip 스냅샷으로 보관
+
+- 페이지 묶음 사이에 잠금을 풀어 주므로 Celery 워커의 쓰기를 막지 않음
+- 파일 복사와 달리 쓰기 도중에도 일관된 스냅샷을 얻음 (WAL 포함)
+- 최근 N개 스냅샷만 유지 (오래된 파일부터 삭제)
+"""
+
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+
+from src.config import CONFIG_PATH, load_section
+from src.connection import DEFAULT_DB_PATH, connect
+
+
+# 백업 단계당 복사할 페이지 수 (기본 페이지 4KB → 약 4MB)
+BACKUP_PAGES = 1024
+
+# 백업 단계 사이 대기 시간 (초) - 이 동안 다른 연결이 쓰기 가능
+BACKUP_SLEEP = 0.005
+
+DEFAULT_SETTINGS = {
+    'path': DEFAULT_DB_PATH,
+    'backup_enabled': False,
+    'backup_dir': 'data/backups',
+    'backup_keep': 7,
+}
+
+
+def load_settings(config_path: str = CONFIG_PATH) -> dict:
+    """config.yaml의 database 설정 (없는 항목은 기본값)"""
+    return load_section('database', DEFAULT_SETTINGS, config_path)
+
+
+def list_backups(backup_dir: str, db_path: str = DEFAULT_DB_PATH) -> list:
+    """DB 파일의 백업 스냅샷 목록 (오래된 것부터)"""
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    return sorted(glob.glob(os.path.join(backup_dir, f"{stem}-*.db.gz")))
+
+
+def rotate_backups(backup_dir: str, db_path: str = DEFAULT_DB_PATH, keep: int = 7) -> list:
+    """
+    최근 keep개만 남기고 오래된 백업 삭제
+
+    Returns:
+        list[str]: 삭제된 파일 경로
+    """
+    backups = list_backups(backup_dir, db_path)
+    removed = backups[:-keep] if keep > 0 else backups
+    for path in removed:
+        os.remove(path)
+    return removed
+
+
+def backup_database(db_path: str = DEFAULT_DB_PATH, backup_dir: str = 'data/backups', keep: int = 7,
+                    pages: int = BACKUP_PAGES, sleep: float = BACKUP_SLEEP) -> dict:
+    """
+    운영 중인 DB를 온라인 백업 후 gzip 압축, 오래된 스냅샷 정리
+
+    Args:
+        db_path: 원본 SQLite 파일 경로
+        backup_dir: 스냅샷 저장 디렉터리
+        keep: 유지할 스냅샷 개수
+        pages: 백업 단계당 복사할 페이지 수
+        sleep: 백업 단계 사이 대기 시간 (초)
+
+    Returns:
+        dict: path, seconds, db_bytes(압축 전), backup_bytes(압축 후), removed(삭제된 스냅샷)
+    """
+    os.makedirs(backup_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    # 같은 초에 두 번 실행돼도 파일명이 겹치지 않도록 마이크로초까지 포함
+    name = f"{stem}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.db"
+    snapshot = os.path.join(backup_dir, name)
+    started = time.perf_counter()
+
+    try:
+        target = sqlite3.connect(snapshot)
+        try:
+            with connect(db_path, readonly=True) as source:
+                source.backup(target, pages=pages, sleep=sleep)
+            # 스냅샷은 -wal 파일 없이 단독으로 열 수 있도록 롤백 저널 모드로 전환
+            target.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            target.close()
+
+        db_bytes = os.path.getsize(snapshot)
+        with open(snapshot, 'rb') as src, gzip.open(snapshot + '.gz', 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+    finally:
+        if os.path.exists(snapshot):
+            os.remove(snapshot)
+
+    removed = rotate_backups(backup_dir, db_path, keep)
+    return {
+        'path': snapshot + '.gz',
+        'seconds': round(time.perf_counter() - started, 3),
+        'db_bytes': db_bytes,
+        'backup_bytes': os.path.getsize(snapshot + '.gz'),
+        'removed': removed,
+    }
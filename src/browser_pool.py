@@ -0,0 +1,256 @@
+"""
+Playwright 브라우저 풀
+단지마다 브라우저를 새로 띄우지 않고 하나의 브라우저 + 재사용 컨텍스트/페이지로 수집
+
+- Playwright 드라이버와 Chromium은 풀 생성 후 처음 한 번만 시작 (단지당 비용은 페이지 이동뿐)
+- 컨텍스트(쿠키/캐시가 분리된 세션)와 페이지를 슬롯 단위로 빌려주고 반납받아 재사용
+- 빌려주기 전 상태 점검: 브라우저 연결 끊김 → 재실행, 페이지 닫힘/응답 없음 → 컨텍스트 재생성
+- 컨텍스트마다 recycle_after개 단지를 처리하면 새 컨텍스트로 교체 (메모리 누적 방지)
+- close()에서 컨텍스트, 브라우저, Playwright 드라이버까지 모두 종료
+- 경량 프로필(ResourceBlocker): 이미지/폰트/미디어/스타일시트, 지도 타일, 분석 스크립트 요청을 차단하고
+  차단/허용 요청 수, 수신 바이트, 단지당 처리 시간을 집계
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from src.config import CONFIG_PATH, load_section
+
+
+DEFAULT_SETTINGS = {
+    'contexts': 1,          # 동시에 빌려줄 수 있는 컨텍스트(페이지) 수
+    'recycle_after': 50,    # 컨텍스트당 처리할 단지 수 (이후 새 컨텍스트)
+    'capture': 'xhr',       # 매물 수집 방식: xhr(API 응답 가로채기) 또는 dom(스크롤 후 DOM 추출)
+    'max_article_pages': 10,  # xhr 방식에서 단지당 조회할 최대 매물 목록 페이지 수
+    # 차단할 리소스 유형 (빈 목록이면 차단 안 함 - 모든 리소스 로드)
+    'block_resources': ['image', 'media', 'font', 'stylesheet'],
+    # 차단할 호스트 (하위 도메인 포함) - 지도 타일, 로그/분석 스크립트
+    'block_hosts': [
+        'map.pstatic.net', 'map.naver.net', 'wcs.naver.net', 'lcs.naver.com', 'nlog.naver.com',
+        'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    ],
+    # 페이지 이동 완료 기준: domcontentloaded(이후 선택자/응답으로 대기) 또는 networkidle
+    'wait_until': 'domcontentloaded',
+}
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# 상태 점검(page.evaluate) 제한 시간 (초)
+HEALTH_TIMEOUT = 5.0
+
+
+def load_settings(config_path: str = CONFIG_PATH) -> dict:
+    """config.yaml의 browser 설정 (없는 항목은 기본값)"""
+    return load_section('browser', DEFAULT_SETTINGS, config_path)
+
+
+class ResourceBlocker:
+    """컨텍스트(또는 페이지)의 요청을 가로채 불필요한 리소스를 차단하고 트래픽 집계"""
+
+    def __init__(self, block_resources=(), block_hosts=()):
+        """
+        Args:
+            block_resources: 차단할 Playwright resource_type (image, font, stylesheet 등)
+            block_hosts: 차단할 호스트 (하위 도메인 포함)
+        """
+        self.block_resources = set(block_resources or ())
+        self.block_hosts = tuple(block_hosts or ())
+        self.stats = {'allowed': 0, 'blocked': 0, 'bytes': 0, 'blocked_types': {}}
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """차단 대상 요청 여부"""
+        if resource_type in self.block_resources:
+            return True
+        host = urlparse(url).hostname or ''
+        return any(host == blocked or host.endswith('.' + blocked) for blocked in self.block_hosts)
+
+    async def attach(self, target):
+        """
+        BrowserContext 또는 Page에 적용
+        차단 대상이 없으면 라우팅 없이 트래픽만 집계 (라우팅은 브라우저 HTTP 캐시를 끔)
+        """
+        if self.block_resources or self.block_hosts:
+            await target.route('**/*', self._route)
+        target.on('response', self._on_response)
+
+    async def _route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.stats['blocked'] += 1
+            types = self.stats['blocked_types']
+            types[request.resource_type] = types.get(request.resource_type, 0) + 1
+            await route.abort()
+        else:
+            self.stats['allowed'] += 1
+            await route.continue_()
+
+    def _on_response(self, response):
+        length = response.headers.get('content-length', '')
+        if length.isdigit():
+            self.stats['bytes'] += int(length)
+
+    def summary(self) -> str:
+        """트래픽 한 줄 요약"""
+        types = ', '.join(f"{name} {count}" for name, count in sorted(self.stats['blocked_types'].items()))
+        return (f"요청 허용 {self.stats['allowed']}개 / 차단 {self.stats['blocked']}개"
+                + (f" ({types})" if types else '')
+                + f", 수신 {self.stats['bytes'] / 1024 / 1024:.1f}MB")
+
+
+class _Slot:
+    """풀이 빌려주는 컨텍스트 + 페이지 한 벌"""
+
+    def __init__(self):
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.used = 0
+
+
+class BrowserPool:
+    """하나의 Chromium을 공유하는 컨텍스트/페이지 풀 (async with로 사용 가능)"""
+
+    def __init__(self, headless: bool = True, contexts: int = None, recycle_after: int = None,
+                 config_path: str = CONFIG_PATH, **context_options):
+        """
+        Args:
+            headless: True면 브라우저 UI 없이 실행
+            contexts: 동시에 빌려줄 수 있는 컨텍스트 수 (기본값: config.yaml browser.contexts)
+            recycle_after: 컨텍스트당 처리할 단지 수 (기본값: config.yaml browser.recycle_after)
+            config_path: 설정 파일 경로
+            **context_options: browser.new_context 추가 인자 (viewport 등)
+        """
+        settings = load_settings(config_path)
+        self.config_path = config_path
+        self.headless = headless
+        self.size = contexts or settings['contexts']
+        self.recycle_after = recycle_after or settings['recycle_after']
+        self.context_options = {'extra_http_headers': {'User-Agent': USER_AGENT}, **context_options}
+        self.blocker = ResourceBlocker(settings['block_resources'], settings['block_hosts'])
+        self.playwright = None
+        self.browser = None
+        self.stats = {'launches': 0, 'contexts': 0, 'pages_served': 0, 'recycled': 0, 'unhealthy': 0,
+                      'busy_seconds': 0.0}
+        self._slots = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _start_driver(self):
+        from playwright.async_api import async_playwright
+        return await async_playwright().start()
+
+    async def _launch(self):
+        self.stats['launches'] += 1
+        return await self.playwright.chromium.launch(headless=self.headless)
+
+    async def start(self):
+        """드라이버 + 브라우저 시작 (이미 시작됐으면 무시)"""
+        async with self._lock:
+            if self.browser is not None:
+                return
+            self.playwright = await self._start_driver()
+            self.browser = await self._launch()
+            self._slots = asyncio.Queue()
+            for _ in range(self.size):
+                self._slots.put_nowait(_Slot())
+            print(f"✓ 브라우저 풀 시작됨 (컨텍스트 {self.size}개)")
+
+    async def _healthy(self, slot: _Slot) -> bool:
+        """슬롯의 페이지가 살아 있고 응답하는지 확인"""
+        if slot.page is None or slot.page.is_closed():
+            return False
+        try:
+            await asyncio.wait_for(slot.page.evaluate('1'), HEALTH_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    async def _discard(self, slot: _Slot):
+        """슬롯의 컨텍스트 종료 (브라우저가 이미 죽었으면 무시)"""
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        slot.browser = slot.context = slot.page = None
+        slot.used = 0
+
+    async def _prepare(self, slot: _Slot):
+        """빌려주기 전 상태 점검 후 필요하면 브라우저/컨텍스트 재생성"""
+        async with self._lock:
+            if not self.browser.is_connected():
+                print("⚠ 브라우저 연결 끊김 - 재실행")
+                self.browser = await self._launch()
+        # 재실행 전 브라우저의 컨텍스트이거나 페이지가 응답하지 않으면 새로 생성
+        if slot.context is not None and not (slot.browser is self.browser and await self._healthy(slot)):
+            self.stats['unhealthy'] += 1
+            await self._discard(slot)
+        if slot.context is None:
+            slot.browser = self.browser
+            slot.context = await self.browser.new_context(**self.context_options)
+            await self.blocker.attach(slot.context)
+            slot.page = await slot.context.new_page()
+            self.stats['contexts'] += 1
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        재사용 페이지 빌리기 (블록이 끝나면 반납)
+
+        사용 예:
+            async with pool.page() as page:
+                await page.goto(url)
+        """
+        await self.start()
+        slot = await self._slots.get()
+        failed = False
+        started = time.perf_counter()
+        try:
+            await self._prepare(slot)
+            self.stats['pages_served'] += 1
+            yield slot.page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.stats['busy_seconds'] += time.perf_counter() - started
+            slot.used += 1
+            if failed or slot.used >= self.recycle_after:
+                self.stats['recycled'] += int(not failed)
+                await self._discard(slot)
+            if self._slots is not None:  # 사용 중 close()된 경우 반납하지 않음
+                self._slots.put_nowait(slot)
+
+    async def close(self):
+        """모든 컨텍스트, 브라우저, Playwright 드라이버 종료"""
+        async with self._lock:
+            if self._slots is not None:
+                while not self._slots.empty():
+                    await self._discard(self._slots.get_nowait())
+                self._slots = None
+            if self.browser is not None:
+                try:
+                    await self.browser.close()
+                except Exception:
+                    pass
+                self.browser = None
+            if self.playwright is not None:
+                await self.playwright.stop()
+                self.playwright = None
+                print(f"✓ 브라우저 풀 종료됨 (단지 {self.stats['pages_served']}개, "
+                      f"브라우저 실행 {self.stats['launches']}회, 컨텍스트 생성 {self.stats['contexts']}회)")
+                print(f"  {self.summary()}")
+
+    def summary(self) -> str:
+        """단지당 평균 처리 시간 + 트래픽 요약 (경량 프로필 효과 비교용)"""
+        served = self.stats['pages_served']
+        average = self.stats['busy_seconds'] / served if served else 0.0
+        return f"단지당 평균 {average:.1f}초, {self.blocker.summary()}"
@@ -4,47 +4,289 @@ Tampermonkey 스크립트 로직을 Python으로 재구현
 """
 
 import asyncio
+import inspect
 import time
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pandas as pd
 
+from src.async_crawler import TokenBucket
+from src.async_crawler import load_settings as load_crawler_settings
+from src.config import CONFIG_PATH
+from src.browser_pool import USER_AGENT, BrowserPool, ResourceBlocker
+from src.browser_pool import load_settings as load_browser_settings
+
 
 # 네이버 부동산 기본 URL
 NAVER_REAL_ESTATE_URL = "https://new.land.naver.com"
 
+# 단지 페이지가 매물 목록을 불러오는 API (XHR 응답 가로채기 대상)
+ARTICLE_API_PATH = "/api/articles/complex/"
+
+# 페이지 이동 후 첫 매물 목록 응답을 기다리는 시간 (초) - 없으면 DOM 추출로 대체
+CAPTURE_TIMEOUT = 10.0
+
+# 매물 항목 선택자 (extract_listings와 동일)
+ARTICLE_ITEM_SELECTOR = '#articleListArea .article-item, #articleListArea > div'
+
+# 스크롤 후 새 매물을 기다리는 최대 시간 (초) - 이 동안 늘지 않으면 목록 끝으로 판단
+SCROLL_IDLE_TIMEOUT = 2.0
+
+# 매물 목록 API 한 페이지의 매물 수 - 처음 표시된 매물이 이보다 적으면 다음 페이지 없음
+# (목록 영역의 scrollHeight 비교는 스타일시트 차단 시 항상 "스크롤 불가"가 되므로 쓰지 않음)
+ARTICLE_PAGE_SIZE = 20
+
+# 표시된 매물 수
+ARTICLE_LIST_STATE_JS = '''
+    (selector) => document.querySelectorAll(selector).length
+'''
+
+# 목록 끝으로 스크롤 - 스타일시트가 차단되어 목록 영역에 overflow가 없어도 다음 페이지를 불러오도록
+# 마지막 매물을 화면에 보이게 하고 목록 영역에 scroll 이벤트를 직접 발생
+SCROLL_ARTICLE_LIST_JS = '''
+    (selector) => {
+        const listArea = document.querySelector('#articleListArea');
+        const items = document.querySelectorAll(selector);
+        if (items.length) {
+            items[items.length - 1].scrollIntoView({block: 'end'});
+        }
+        if (listArea) {
+            listArea.scrollTop = listArea.scrollHeight;
+            listArea.dispatchEvent(new Event('scroll'));
+        }
+    }
+'''
+
+# 거래 유형 표시명 → 코드
+TRADE_TYPES = {
+    '매매': 'SALE',
+    '전세': 'LEASE',
+    '월세': 'RENT',
+    '정보없음': 'SALE'  # 기본값
+}
+
+
+def area_type_of(area: float) -> str:
+    """전용면적 → 면적 타입 (59A, 84A 등)"""
+    if 56 <= area <= 62:
+        return '59A'
+    elif 72 <= area <= 78:
+        return '75A'
+    elif 81 <= area <= 87:
+        return '84A'
+    return f"{int(area)}A"
+
+
+def parse_price_text(price_text: str) -> int:
+    """가격 텍스트 → 만원 (예: "12억 5,000" → 125000, "9,000" → 9000)"""
+    text = str(price_text or '').replace(',', '')
+    if '억' in text:
+        eok, _, man = text.partition('억')
+        man = re.sub(r'[^0-9]', '', man)
+        return int(re.sub(r'[^0-9]', '', eok) or 0) * 10000 + int(man or 0)
+    digits = re.sub(r'[^0-9]', '', text)
+    return int(digits) if digits else 0
+
+
+def floor_number_of(floor: str) -> int:
+    """
+    층 텍스트 → 해당 층 (예: "7/15" → 7, "고/20층" → 15)
+    저/중/고층 표기는 crawler.parse_floor_number와 같은 대표값 사용
+    """
+    current = str(floor or '').split('/')[0]
+    match = re.search(r'(\d+)', current)
+    if match:
+        return int(match.group(1))
+    for label, number in (('저', 3), ('중', 9), ('고', 15)):
+        if label in current:
+            return number
+    return 0
+
+
+def make_listing(area: float, trade_type: str, floor: str, direction: str, price: int, spec: str,
+                 article_no: str = None) -> Dict:
+    """
+    매물 한 건 → DataFrame 행 (DOM 추출과 XHR 응답이 같은 컬럼을 갖도록)
+    article_no: 네이버 매물번호 (XHR 응답에만 있음, 저장 시 매물 식별 키로 사용)
+    """
+    trade_type = TRADE_TYPES.get(trade_type or '', 'SALE')
+    return {
+        '면적타입': area_type_of(area),
+        '전용면적': area,
+        '거래유형': trade_type,
+        '층': floor or '정보없음',
+        '층수': floor_number_of(floor),
+        '방향': direction or '',
+        '가격': price if trade_type == 'SALE' else 0,
+        '보증금': price if trade_type == 'LEASE' else 0,
+        'spec': spec or '',
+        '매물번호': article_no
+    }
+
+
+def parse_article_json(articles: List[Dict]) -> pd.DataFrame:
+    """
+    매물 목록 API 응답(articleList) → 매물 DataFrame (extract_listings와 같은 컬럼)
+    
+    Args:
+        articles: articleList 항목 (area2: 전용면적, floorInfo: "5/15", dealOrWarrantPrc: "12억 5,000")
+    """
+    rows = []
+    seen = set()
+    for article in articles:
+        # 같은 매물을 여러 중개사가 올린 경우 매물번호 기준으로 한 번만
+        article_no = article.get('articleNo')
+        if article_no is not None:
+            if article_no in seen:
+                continue
+            seen.add(article_no)
+        try:
+            area = float(article.get('area2') or article.get('area') or 0)
+        except (TypeError, ValueError):
+            continue
+        if not area:
+            continue
+        rows.append(make_listing(
+            area,
+            article.get('tradeTypeName', ''),
+            article.get('floorInfo', ''),
+            article.get('direction', ''),
+            parse_price_text(article.get('dealOrWarrantPrc', '')),
+            article.get('articleFeatureDesc', ''),
+            article_no,
+        ))
+    return pd.DataFrame(rows)
+
+
+class ArticleCapture:
+    """단지 페이지의 매물 목록 XHR 응답을 가로채 JSON으로 보관"""
+    
+    def __init__(self, page: Page):
+        self.page = page
+        self.pages: Dict[int, List[Dict]] = {}  # 페이지 번호 → articleList
+        self.more = False                       # 다음 페이지 존재 여부 (isMoreData)
+        self.request = None                     # 마지막으로 가로챈 요청 (다음 페이지 재요청용)
+        self._received = asyncio.Event()
+    
+    def start(self):
+        """응답 리스너 등록 (페이지 이동 전에 호출)"""
+        self.page.on('response', self._on_response)
+    
+    def stop(self):
+        """응답 리스너 해제"""
+        self.page.remove_listener('response', self._on_response)
+    
+    async def _on_response(self, response):
+        if ARTICLE_API_PATH not in response.url or not response.ok:
+            return
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        self._store(response.url, data)
+        self.request = response.request
+    
+    def _store(self, url: str, data: Dict):
+        query = parse_qs(urlparse(url).query)
+        page_no = int((query.get('page') or ['1'])[0])
+        self.pages[page_no] = data.get('articleList') or []
+        self.more = bool(data.get('isMoreData'))
+        self._received.set()
+    
+    async def wait(self, timeout: float = 10.0) -> bool:
+        """첫 매물 목록 응답까지 대기 (timeout 내에 없으면 False)"""
+        try:
+            await asyncio.wait_for(self._received.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def fetch_remaining(self, max_pages: int = 10, bucket: Optional[TokenBucket] = None):
+        """
+        스크롤 없이 다음 페이지들을 같은 요청(헤더/쿠키 포함)으로 직접 조회
+        실패하거나 JSON이 아닌 페이지에서 멈추고, 그때까지 받은 페이지는 유지
+        
+        Args:
+            max_pages: 최대 페이지 수 (첫 페이지 포함)
+            bucket: 요청마다 토큰을 얻을 속도 제한 (scrape_complexes가 페이지 이동과 공유)
+        """
+        if self.request is None:
+            return
+        headers = await self.request.all_headers()
+        headers = {k: v for k, v in headers.items() if not k.startswith(':')}
+        url = urlparse(self.request.url)
+        query = parse_qs(url.query)
+        while self.more and len(self.pages) < max_pages:
+            page_no = max(self.pages) + 1
+            query['page'] = [str(page_no)]
+            next_url = urlunparse(url._replace(query=urlencode(query, doseq=True)))
+            if bucket:
+                await bucket.acquire()
+            try:
+                response = await self.page.context.request.get(next_url, headers=headers)
+                if not response.ok:
+                    print(f"⚠ 매물 목록 {page_no}페이지 조회 실패 (HTTP {response.status})")
+                    break
+                data = await response.json()
+            except Exception as e:
+                print(f"⚠ 매물 목록 {page_no}페이지 조회 실패: {e}")
+                break
+            self._store(next_url, data)
+    
+    def articles(self) -> List[Dict]:
+        """가로챈 매물 전체 (페이지 순서대로)"""
+        return [article for page_no in sorted(self.pages) for article in self.pages[page_no]]
+
 
 class NaverRealEstateScraper:
     """네이버 부동산 브라우저 자동화 스크래퍼"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, page: Optional[Page] = None, wait_until: str = None,
+                 config_path: str = CONFIG_PATH):
         """
         Args:
             headless: True면 브라우저 UI 없이 실행
+            page: BrowserPool에서 빌린 페이지 (주어지면 start/close 불필요)
+            wait_until: 페이지 이동 완료 기준 (기본값: config.yaml browser.wait_until)
+            config_path: 설정 파일 경로 (browser 섹션)
         """
+        settings = load_browser_settings(config_path)
+        self.settings = settings
+        self.wait_until = wait_until or settings['wait_until']
+        self.blocker = None
+        self.navigation_seconds = 0.0
         self.headless = headless
+        self.playwright = None
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.page: Optional[Page] = page
     
     async def start(self):
-        """브라우저 시작"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=self.headless)
+        """브라우저 시작 (단독 실행용 - 여러 단지는 BrowserPool 사용)"""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
         self.page = await self.browser.new_page()
         
         # User Agent 설정
-        await self.page.set_extra_http_headers({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        await self.page.set_extra_http_headers({'User-Agent': USER_AGENT})
+        
+        # 경량 프로필 (풀 사용 시에는 풀이 컨텍스트에 적용)
+        self.blocker = ResourceBlocker(self.settings['block_resources'], self.settings['block_hosts'])
+        await self.blocker.attach(self.page)
         
         print("✓ 브라우저 시작됨")
     
     async def close(self):
-        """브라우저 종료"""
+        """브라우저 + Playwright 드라이버 종료 (start로 직접 띄운 경우만)"""
         if self.browser:
             await self.browser.close()
-            print("✓ 브라우저 종료됨")
+            self.browser = None
+            print("✓ 브라우저 종료됨" + (f" ({self.blocker.summary()})" if self.blocker else ''))
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
     
     async def navigate_to_complex(self, complex_no: str) -> bool:
         """
@@ -60,14 +302,17 @@ class NaverRealEstateScraper:
         
         try:
             print(f"📍 페이지 이동 중: {url}")
-            await self.page.goto(url, wait_until='networkidle', timeout=30000)
+            started = time.perf_counter()
+            # domcontentloaded: 지도 타일/분석 요청이 끝날 때까지 기다리지 않고 단지명 표시로 판단
+            await self.page.goto(url, wait_until=self.wait_until, timeout=30000)
             
             # 페이지 로드 대기
             await self.page.wait_for_selector('#complexTitle', timeout=10000)
+            self.navigation_seconds = time.perf_counter() - started
             
             # 단지명 확인
             complex_name = await self.page.locator('#complexTitle').inner_text()
-            print(f"✓ 단지 로드 완료: {complex_name}")
+            print(f"✓ 단지 로드 완료: {complex_name} ({self.navigation_seconds:.1f}초)")
             
             return True
             
@@ -75,37 +320,73 @@ class NaverRealEstateScraper:
             print(f"❌ 페이지 로드 실패: {e}")
             return False
     
-    async def scroll_article_list(self, max_scrolls: int = 10):
+    async def scroll_article_list(self, max_scrolls: int = 10, idle_timeout: float = SCROLL_IDLE_TIMEOUT) -> Dict:
         """
         매물 리스트 스크롤하여 모든 데이터 로드
         
+        고정 대기 없이 스크롤마다 새 매물이 붙을 때까지만 기다리고, 다음 경우 바로 종료
+        - 처음 표시된 매물이 한 페이지(ARTICLE_PAGE_SIZE) 미만 (모든 매물이 이미 표시됨)
+        - idle_timeout초 동안 매물 수가 늘지 않음
+        - 매물 목록 API 응답이 마지막 페이지(isMoreData: false)라고 알림
+        목록 영역의 CSS 레이아웃(스크롤 가능 여부)에는 의존하지 않음 (경량 프로필은 스타일시트 차단)
+        
         Args:
             max_scrolls: 최대 스크롤 횟수
+            idle_timeout: 스크롤 후 새 매물을 기다리는 최대 시간 (초)
+        
+        Returns:
+            dict: scrolls, items, seconds, saved_seconds(고정 1초 대기 × max_scrolls 대비 절약 시간)
         """
+        started = time.perf_counter()
+        result = {'scrolls': 0, 'items': 0, 'seconds': 0.0, 'saved_seconds': 0.0}
+        list_end = asyncio.Event()
+        
+        async def on_response(response):
+            if ARTICLE_API_PATH not in response.url or not response.ok:
+                return
+            try:
+                data = await response.json()
+            except Exception:
+                return
+            if not data.get('isMoreData'):
+                list_end.set()
+        
+        self.page.on('response', on_response)
         try:
             # 매물 리스트 영역 찾기
-            article_list_selector = '#articleListArea'
-            await self.page.wait_for_selector(article_list_selector, timeout=10000)
+            await self.page.wait_for_selector('#articleListArea', timeout=10000)
             
             print("📜 매물 리스트 스크롤 중...")
             
-            for i in range(max_scrolls):
+            count = await self.page.evaluate(ARTICLE_LIST_STATE_JS, ARTICLE_ITEM_SELECTOR)
+            while count >= ARTICLE_PAGE_SIZE and result['scrolls'] < max_scrolls and not list_end.is_set():
                 # 스크롤 실행
-                await self.page.evaluate('''
-                    () => {
-                        const listArea = document.querySelector('#articleListArea');
-                        if (listArea) {
-                            listArea.scrollTop = listArea.scrollHeight;
-                        }
-                    }
-                ''')
+                await self.page.evaluate(SCROLL_ARTICLE_LIST_JS, ARTICLE_ITEM_SELECTOR)
+                result['scrolls'] += 1
                 
-                await asyncio.sleep(1)  # 데이터 로드 대기
+                # 새 매물이 붙을 때까지 대기 (고정 sleep 대신 DOM 변화 감지)
+                try:
+                    await self.page.wait_for_function(
+                        '([selector, count]) => document.querySelectorAll(selector).length > count',
+                        arg=[ARTICLE_ITEM_SELECTOR, count], timeout=idle_timeout * 1000,
+                    )
+                except PlaywrightTimeoutError:
+                    break  # 더 이상 늘지 않음
+                count = await self.page.evaluate(ARTICLE_LIST_STATE_JS, ARTICLE_ITEM_SELECTOR)
             
-            print(f"✓ 스크롤 완료 ({max_scrolls}회)")
+            result['items'] = count
             
         except Exception as e:
             print(f"⚠ 스크롤 중 오류: {e}")
+        
+        finally:
+            self.page.remove_listener('response', on_response)
+        
+        result['seconds'] = round(time.perf_counter() - started, 2)
+        result['saved_seconds'] = round(max(max_scrolls * 1.0 - result['seconds'], 0.0), 2)
+        print(f"✓ 스크롤 완료 ({result['scrolls']}회, 매물 {result['items']}개, {result['seconds']:.1f}초 - "
+              f"고정 대기 대비 {result['saved_seconds']:.1f}초 절약)")
+        return result
     
     async def extract_listings(self) -> pd.DataFrame:
         """
@@ -281,41 +562,14 @@ class NaverRealEstateScraper:
                         skipped += 1
                         continue
                     
-                    # 층수 추출
-                    floor_match = re.search(r'(\d+)', item.get('floor', ''))
-                    floor_num = int(floor_match.group(1)) if floor_match else 0
-                    
-                    # 면적 타입 결정 (59A, 84A 등)
-                    area = item['exclusive_area']
-                    if 56 <= area <= 62:
-                        area_type = '59A'
-                    elif 72 <= area <= 78:
-                        area_type = '75A'
-                    elif 81 <= area <= 87:
-                        area_type = '84A'
-                    else:
-                        area_type = f"{int(area)}A"
-                    
-                    # 거래 유형 변환
-                    trade_type_map = {
-                        '매매': 'SALE',
-                        '전세': 'LEASE',
-                        '월세': 'RENT',
-                        '정보없음': 'SALE'  # 기본값
-                    }
-                    trade_type = trade_type_map.get(item.get('trade_type', ''), 'SALE')
-                    
-                    listing = {
-                        '면적타입': area_type,
-                        '전용면적': area,
-                        '거래유형': trade_type,
-                        '층': item.get('floor', '정보없음'),
-                        '층수': floor_num,
-                        '방향': item.get('direction', ''),
-                        '가격': item.get('price', 0) if trade_type == 'SALE' else 0,
-                        '보증금': item.get('price', 0) if trade_type == 'LEASE' else 0,
-                        'spec': item.get('spec', '')
-                    }
+                    listing = make_listing(
+                        item['exclusive_area'],
+                        item.get('trade_type', ''),
+                        item.get('floor', ''),
+                        item.get('direction', ''),
+                        item.get('price', 0),
+                        item.get('spec', ''),
+                    )
                     
                     df_list.append(listing)
                     
@@ -367,48 +621,6 @@ class NaverRealEstateScraper:
             return {}
 
 
-async def scrape_complex(complex_no: str, headless: bool = False) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
-    """
-    단지 전체 데이터 수집 (정보 + 매매 + 전세)
-    
-    Args:
-        complex_no: 단지 번호
-        headless: 브라우저 headless 모드
-    
-    Returns:
-        (complex_info, sale_df, lease_df)
-    """
-    scraper = NaverRealEstateScraper(headless=headless)
-    
-    try:
-        await scraper.start()
-        
-        # 단지 페이지 이동
-        success = await scraper.navigate_to_complex(complex_no)
-        if not success:
-            return {}, pd.DataFrame(), pd.DataFrame()
-        
-        # 스크롤하여 모든 매물 로드
-        await scraper.scroll_article_list(max_scrolls=10)
-        
-        # 단지 정보 추출
-        complex_info = await scraper.get_complex_info()
-        
-        # 매물 데이터 추출
-        all_listings = await scraper.extract_listings()
-        
-        # 매매/전세 분리
-        sale_df = all_listings[all_listings['거래유형'] == 'SALE'].copy() if not all_listings.empty else pd.DataFrame()
-        lease_df = all_listings[all_listings['거래유형'] == 'LEASE'].copy() if not all_listings.empty else pd.DataFrame()
-        
-        print(f"\n✓ 수집 완료: 매매 {len(sale_df)}개, 전세 {len(lease_df)}개")
-        
-        return complex_info, sale_df, lease_df
-        
-    finally:
-        await scraper.close()
-
-
 # 테스트 함수
 async def test_scraping():
     """브라우저 스크래핑 테스트"""
@@ -436,37 +648,82 @@ async def test_scraping():
         print(lease[['면적타입', '전용면적', '층수', '보증금', 'spec']].head(5))
 
 
-async def scrape_complex(complex_no: str, headless: bool = True) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
+async def scrape_complex(complex_no: str, headless: bool = True, pool: Optional[BrowserPool] = None,
+                         capture: str = None, bucket: Optional[TokenBucket] = None
+                         ) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
     """
     특정 단지의 브라우저 자동화 데이터 수집
     main.py에서 호출하는 래퍼 함수
     
     Args:
         complex_no: 단지 번호
-        headless: 헤드리스 모드 여부
+        headless: 헤드리스 모드 여부 (pool이 없을 때만 사용)
+        pool: 브라우저 풀 (주어지면 브라우저를 새로 띄우지 않고 풀의 페이지 재사용)
+        capture: 'xhr' (매물 목록 API 응답 가로채기) 또는 'dom' (스크롤 후 DOM 추출)
+                 기본값: config.yaml browser.capture
+        bucket: 매물 목록 추가 페이지 요청의 속도 제한
+                (기본값: config.yaml crawler.rate_limit 간격의 단지 전용 버킷)
     
     Returns:
         (complex_info, sale_df, lease_df)
     """
-    scraper = NaverRealEstateScraper(headless=headless)
+    if pool is not None:
+        async with pool.page() as page:
+            scraper = NaverRealEstateScraper(page=page, config_path=pool.config_path)
+            return await _scrape_page(scraper, complex_no, capture, bucket)
     
+    scraper = NaverRealEstateScraper(headless=headless)
     try:
         await scraper.start()
-        
+        return await _scrape_page(scraper, complex_no, capture, bucket)
+    except Exception as e:
+        print(f"❌ 브라우저 시작 실패: {e}")
+        return {}, pd.DataFrame(), pd.DataFrame()
+    finally:
+        await scraper.close()
+
+
+async def _scrape_page(scraper: NaverRealEstateScraper, complex_no: str, capture: str = None,
+                       bucket: Optional[TokenBucket] = None) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
+    """
+    준비된 페이지로 단지 하나 수집
+    xhr: 단지 이동 중 매물 목록 API 응답을 가로채 JSON으로 변환 (응답이 없으면 dom으로 대체)
+         추가 페이지 요청은 bucket에서 토큰을 얻은 뒤 전송
+    dom: 단지 이동 → 스크롤 → DOM에서 매물 추출
+    """
+    settings = scraper.settings
+    capture = capture or settings['capture']
+    if bucket is None:
+        rate_limit = load_crawler_settings()['rate_limit']
+        bucket = TokenBucket(1 / rate_limit) if rate_limit > 0 else None
+    
+    # 첫 페이지 응답을 놓치지 않도록 이동 전에 리스너 등록
+    articles = ArticleCapture(scraper.page) if capture == 'xhr' else None
+    if articles:
+        articles.start()
+    
+    try:
         # 단지 페이지 이동
         if not await scraper.navigate_to_complex(complex_no):
             print(f"❌ 단지 페이지 로드 실패: {complex_no}")
             return {}, pd.DataFrame(), pd.DataFrame()
         
-        # 매물 리스트 스크롤
-        await scraper.scroll_article_list(max_scrolls=10)
+        # 매물 데이터 추출
+        listings_df = None
+        if articles:
+            if await articles.wait(CAPTURE_TIMEOUT):
+                await articles.fetch_remaining(settings['max_article_pages'], bucket)
+                listings_df = parse_article_json(articles.articles())
+                print(f"✓ 매물 {len(listings_df)}개 추출 완료 (API 응답 {len(articles.pages)}페이지)")
+            else:
+                print("⚠ 매물 목록 API 응답 없음 - DOM 추출로 대체")
+        if listings_df is None:
+            await scraper.scroll_article_list(max_scrolls=10)
+            listings_df = await scraper.extract_listings()
         
         # 단지 정보 추출
         complex_info = await scraper.get_complex_info()
         
-        # 매물 데이터 추출
-        listings_df = await scraper.extract_listings()
-        
         if listings_df.empty:
             print(f"⚠ {complex_no}에서 추출된 매물 없음")
             return complex_info, pd.DataFrame(), pd.DataFrame()
@@ -484,7 +741,82 @@ async def scrape_complex(complex_no: str, headless: bool = True) -> Tuple[Dict,
         return {}, pd.DataFrame(), pd.DataFrame()
     
     finally:
-        await scraper.close()
+        if articles:
+            articles.stop()
+
+
+async def scrape_complexes(complex_nos: List[str], pool: BrowserPool, on_result: Callable = None,
+                           rate_limit: float = None) -> Dict:
+    """
+    여러 단지를 브라우저 컨텍스트 여러 개로 동시 수집
+    
+    - 동시 실행 수 = 풀의 컨텍스트 수 (config.yaml browser.contexts)
+    - 모든 컨텍스트가 토큰 버킷 하나를 공유 → 페이지 이동과 매물 목록 추가 페이지 요청을 합쳐
+      요청 간격은 rate_limit초 이상 (전체 기준)
+    - 끝나는 단지부터 on_result(complex_no, complex_info, sale_df, lease_df) 호출
+      (DB 저장 등, 코루틴 함수도 가능) → 전체 수집이 끝날 때까지 결과를 쌓아 두지 않음
+      일반 함수는 asyncio.to_thread로 실행 (SQLite 저장 중에도 다른 컨텍스트의 수집이 멈추지 않음)
+    - on_result가 실패한 단지는 failed에 기록하고 나머지 단지는 계속 수집
+    
+    Args:
+        complex_nos: 단지 번호 목록
+        pool: 브라우저 풀
+        on_result: 단지별 결과 콜백
+        rate_limit: 페이지 이동 간격 (초, 기본값: config.yaml crawler.rate_limit)
+    
+    Returns:
+        dict: complexes, succeeded, failed(단지 번호 목록), seconds
+    """
+    if rate_limit is None:
+        rate_limit = load_crawler_settings()['rate_limit']
+    bucket = TokenBucket(1 / rate_limit) if rate_limit > 0 else None
+    semaphore = asyncio.Semaphore(pool.size)
+    
+    async def run(complex_no):
+        # 컨텍스트 수만큼만 동시에 진행 (대기 중인 단지가 토큰을 미리 가져가지 않도록)
+        async with semaphore:
+            if bucket:
+                await bucket.acquire()
+            try:
+                return complex_no, await scrape_complex(complex_no, pool=pool, bucket=bucket)
+            except Exception as e:
+                print(f"❌ {complex_no} 스크래핑 실패: {e}")
+                return complex_no, None
+    
+    started = time.perf_counter()
+    summary = {'complexes': len(complex_nos), 'succeeded': 0, 'failed': [], 'seconds': 0.0}
+    tasks = [asyncio.create_task(run(str(complex_no))) for complex_no in complex_nos]
+    
+    try:
+        for done in asyncio.as_completed(tasks):
+            complex_no, result = await done
+            complex_info, sale_df, lease_df = result or ({}, pd.DataFrame(), pd.DataFrame())
+            succeeded = bool(complex_info) or not (sale_df.empty and lease_df.empty)
+            if on_result is not None:
+                try:
+                    if inspect.iscoroutinefunction(on_result):
+                        saved = on_result(complex_no, complex_info, sale_df, lease_df)
+                    else:
+                        saved = await asyncio.to_thread(on_result, complex_no, complex_info, sale_df, lease_df)
+                    if inspect.isawaitable(saved):
+                        await saved
+                except Exception as e:
+                    print(f"❌ {complex_no} 결과 처리 실패: {e}")
+                    succeeded = False
+            if succeeded:
+                summary['succeeded'] += 1
+            else:
+                summary['failed'].append(complex_no)
+    finally:
+        # 중간에 빠져나가도(취소 등) 남은 단지 작업을 정리하고 예외를 회수
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    summary['seconds'] = round(time.perf_counter() - started, 1)
+    print(f"\n✓ 브라우저 동시 수집 완료: {summary['succeeded']}/{summary['complexes']}개 단지, "
+          f"컨텍스트 {pool.size}개, {summary['seconds']}초")
+    return summary
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+"""
+config.yaml 설정 로드
+섹션별로 기본값 위에 config.yaml 값을 덮어써서 반환
+"""
+
+import os
+
+import yaml
+
+
+CONFIG_PATH = "config.yaml"
+
+
+def load_section(section: str, defaults: dict, config_path: str = CONFIG_PATH) -> dict:
+    """
+    config.yaml의 한 섹션 (없는 항목은 기본값)
+
+    Args:
+        section: 최상위 섹션 이름 ('database', 'crawler' 등)
+        defaults: 기본값
+        config_path: 설정 파일 경로 (없으면 기본값만 반환)
+    """
+    settings = dict(defaults)
+    if os.path.exists(config_path):
+        with open(config_path, encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+        settings.update(config.get(section) or {})
+    return settings
@@ -0,0 +1,137 @@
+"""
+SQLite 연결 관리 모듈
+WAL 모드 + 튜닝된 PRAGMA + 프로세스별 연결 풀
+
+Celery 워커, main.job, import_json.py, Streamlit 앱이 모두 이 모듈을 통해
+연결을 얻도록 하여 "database is locked" 오류와 읽기/쓰기 직렬화를 줄임
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from src.schema import ensure_schema
+
+
+DEFAULT_DB_PATH = "data/real_estate.db"
+
+# 잠금 대기 시간 (초) - 이 시간 동안은 "database is locked" 대신 재시도
+BUSY_TIMEOUT = 30.0
+
+# DB 파일/프로세스당 유지할 최대 유휴 연결 수
+POOL_SIZE = 5
+
+# 모든 연결에 적용하는 PRAGMA
+PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",     # WAL에서는 NORMAL로도 안전
+    "PRAGMA cache_size = -20000",      # 약 20MB 페이지 캐시
+    "PRAGMA mmap_size = 268435456",    # 256MB 메모리 맵 I/O
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class ConnectionPool:
+    """DB 파일 하나에 대한 연결 풀 (쓰기용 또는 읽기 전용)"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, readonly: bool = False, max_size: int = POOL_SIZE):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            readonly: True면 읽기 전용 연결 (대시보드용)
+            max_size: 유지할 최대 유휴 연결 수
+        """
+        self.db_path = db_path
+        self.readonly = readonly
+        self._idle = queue.LifoQueue(maxsize=max_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 적용"""
+        if self.readonly:
+            # 읽기 전용 연결은 스키마를 만들 수 없으므로 쓰기 풀에서 먼저 보장
+            with get_pool(self.db_path).connection():
+                pass
+            uri = f"file:{os.path.abspath(self.db_path)}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            # 새 DB는 빈 페이지를 나눠서 반환할 수 있도록 생성 (WAL 전환 전에 설정해야 적용,
+            # 기존 DB에는 영향 없음 → src/maintenance.py에서 전환)
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # WAL: 읽기가 쓰기에 막히지 않음 (DB 파일에 영구 저장되는 설정)
+            conn.execute("PRAGMA journal_mode = WAL")
+
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+
+        if not self.readonly:
+            ensure_schema(conn)
+
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """유휴 연결을 꺼내거나 새로 생성"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn: sqlite3.Connection):
+        """연결 반납 (풀이 가득 차면 닫음)"""
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @contextmanager
+    def connection(self):
+        """with 블록 동안 연결을 빌려줌"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """유휴 연결 모두 종료"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str = DEFAULT_DB_PATH, readonly: bool = False) -> ConnectionPool:
+    """
+    DB 파일별 연결 풀 조회
+
+    풀은 프로세스별로 관리됨 (Celery prefork 워커가 부모의 연결을 물려받지 않도록)
+    """
+    key = (os.getpid(), os.path.abspath(db_path), readonly)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_path, readonly=readonly)
+            _pools[key] = pool
+        return pool
+
+
+@contextmanager
+def connect(db_path: str = DEFAULT_DB_PATH, readonly: bool = False):
+    """
+    풀에서 연결을 빌려 쓰는 컨텍스트 매니저
+
+    Example:
+        with connect() as conn:
+            conn.execute("SELECT COUNT(*) FROM complexes")
+    """
+    with get_pool(db_path, readonly).connection() as conn:
+        yield conn
@@ -3,13 +3,13 @@
 API 호출 및 데이터 수집
 """
 
-import requests
 import pandas as pd
 import time
 import random
 import re
 from datetime import datetime
 from src.filter import filter_listings
+from src.http_client import get_client
 
 
 # API 기본 설정
@@ -57,6 +57,62 @@ def is_target_area(area, target_areas=TARGET_AREAS):
     return False
 
 
+def parse_listings(articles, transaction_type='SALE') -> pd.DataFrame:
+    """
+    매물 API 응답(articleList) → 매물 DataFrame (59m²/84m², 4층 이상만)
+    
+    Args:
+        articles: API 응답의 articleList
+        transaction_type: 'SALE' (매매) 또는 'LEASE' (전세)
+    """
+    listings = []
+    for article in articles:
+        area = float(article.get('area', 0))
+        
+        # 필터링: 59m² 또는 84m²
+        if not is_target_area(area):
+            continue
+        
+        floor_info = article.get('floorInfo', '')
+        floor_num = parse_floor_number(floor_info)
+        
+        # 필터링: 4층 이상
+        if floor_num < MIN_FLOOR:
+            continue
+        
+        area_type = "59A" if area < 70 else "84A"
+        price = int(article.get('dealOrWarrantPrc', 0))
+        
+        listing = {
+            '면적타입': area_type,
+            '전용면적': area,
+            '거래유형': transaction_type,
+            '층': floor_info,
+            '층수': floor_num,
+            '방향': article.get('direction', ''),
+            '가격': price if transaction_type == 'SALE' else 0,
+            '보증금': price if transaction_type == 'LEASE' else 0,
+            '매물번호': article.get('articleNo'),
+        }
+        
+        listings.append(listing)
+    
+    return pd.DataFrame(listings)
+
+
+def listings_params(complex_no: str, transaction_type='SALE', page=1) -> dict:
+    """매물 리스트 API 요청 파라미터"""
+    return {
+        'realEstateType': 'APT',
+        'tradeType': 'A1' if transaction_type == 'SALE' else 'B1',
+        'priceType': 'RETAIL',
+        'page': page,
+        'complexNo': complex_no,
+        'type': 'list',
+        'order': 'rank'
+    }
+
+
 def _generate_sample_complexes(city_code='1168000000', min_households=300) -> pd.DataFrame:
     """API 실패 시 샘플 데이터 생성"""
     print("  └ API 호출 실패. 샘플 데이터로 테스트합니다...")
@@ -175,14 +231,17 @@ def _generate_sample_listings(complex_no: str, transaction_type='SALE') -> pd.Da
     return filtered_df
 
 
-def get_filtered_complexes(city_code='1168000000', min_households=300, use_sample=True) -> pd.DataFrame:
+def get_filtered_complexes(city_code='1168000000', min_households=300, use_sample=True,
+                           refresh=False) -> pd.DataFrame:
     """
     네이버 부동산 API를 통해 특정 지역의 아파트 단지 리스트 조회
+    (디스크 캐시 TTL 안에서는 요청 없이 반환)
     
     Args:
         city_code: 지역코드 (기본값: 1168000000 강남구)
         min_households: 최소 세대수
         use_sample: True면 샘플 데이터 사용
+        refresh: True면 캐시를 건너뛰고 새로 조회
     
     Returns:
         DataFrame with columns: 단지번호, 단지명, 주소, 세대수, 면적
@@ -198,10 +257,8 @@ def get_filtered_complexes(city_code='1168000000', min_households=300, use_sampl
     }
     
     try:
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = get_client().get_json(url, params=params, headers=HEADERS, timeout=10,
+                                     endpoint='complex_list', refresh=refresh)
         complexes = []
         
         for item in data.get('complexList', []):
@@ -231,64 +288,20 @@ def get_listings_api(complex_no: str, transaction_type='SALE', use_sample=True)
         use_sample: True면 샘플 데이터 사용
     
     Returns:
-        DataFrame with columns: 면적타입, 전용면적, 거래유형, 층, 층수, 방향, 가격, 보증금
+        DataFrame with columns: 면적타입, 전용면적, 거래유형, 층, 층수, 방향, 가격, 보증금 (API 응답이면 매물번호 포함)
     """
     if use_sample:
         return _generate_sample_listings(complex_no, transaction_type)
     
     # 실제 API 호출 (현재 429 에러로 사용 불가)
-    trade_type_code = 'A1' if transaction_type == 'SALE' else 'B1'
+    # 여러 단지를 수집할 때는 src.async_crawler 사용 (요청 간 대기를 단지끼리 겹쳐서 처리)
     url = f"{BASE_URL}/articles/complex/{complex_no}"
-    params = {
-        'realEstateType': 'APT',
-        'tradeType': trade_type_code,
-        'priceType': 'RETAIL',
-        'page': 1,
-        'complexNo': complex_no,
-        'type': 'list',
-        'order': 'rank'
-    }
+    params = listings_params(complex_no, transaction_type)
     
     try:
         time.sleep(random.uniform(2.0, 4.0))  # Rate limiting
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        articles = data.get('articleList', [])
-        
-        listings = []
-        for article in articles:
-            area = float(article.get('area', 0))
-            
-            # 필터링: 59m² 또는 84m²
-            if not is_target_area(area):
-                continue
-            
-            floor_info = article.get('floorInfo', '')
-            floor_num = parse_floor_number(floor_info)
-            
-            # 필터링: 4층 이상
-            if floor_num < MIN_FLOOR:
-                continue
-            
-            area_type = "59A" if area < 70 else "84A"
-            price = int(article.get('dealOrWarrantPrc', 0))
-            
-            listing = {
-                '면적타입': area_type,
-                '전용면적': area,
-                '거래유형': transaction_type,
-                '층': floor_info,
-                '층수': floor_num,
-                '방향': article.get('direction', ''),
-                '가격': price if transaction_type == 'SALE' else 0,
-                '보증금': price if transaction_type == 'LEASE' else 0,
-            }
-            
-            listings.append(listing)
-        
-        return pd.DataFrame(listings)
+        data = get_client().get_json(url, params=params, headers=HEADERS, timeout=10)
+        return parse_listings(data.get('articleList', []), transaction_type)
     
     except Exception as e:
         print(f"  API 호출 실패, 샘플 데이터로 대체")
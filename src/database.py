@@ -1,214 +1,456 @@
+import os
 import sqlite3
+import time
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.archive import is_available as archive_available, read_archive, write_archive
+from src.connection import DEFAULT_DB_PATH, get_pool
+from src.schema import LATEST_LISTINGS_SQL
+from src.partitions import (
+    decoded_sql, drop_partitions, encode, ensure_partition, expired_partitions,
+    list_partitions, lookup_code, union_sql
+)
+
+
+def _column(df, name, default):
+    """DataFrame 컬럼 조회 (없으면 기본값으로 채운 Series 반환)"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index)
+
+
+def _to_manwon(values):
+    """
+    가격 컬럼을 만원 단위로 정규화 (벡터 연산)
+    
+    100만 초과 값은 원 단위로 간주하여 만원 단위로 변환
+    """
+    values = pd.to_numeric(values, errors='coerce').fillna(0)
+    return values.mask(values > 1000000, (values / 10000).astype('int64'))
+
+
+def _rate(count, elapsed):
+    """저장 속도 표시 문자열"""
+    if elapsed <= 0:
+        return f"{count:,} rows"
+    return f"{count / elapsed:,.0f} rows/s"
+
+
+def _day_key(value):
+    """날짜('YYYY-MM-DD' 또는 datetime) → 정수 날짜 키 YYYYMMDD"""
+    if isinstance(value, str):
+        value = datetime.strptime(value[:10], '%Y-%m-%d')
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def _text(values):
+    """식별 키용 문자열 컬럼 (결측값은 빈 문자열)"""
+    return values.fillna('').astype(str)
+
+
+def _article_numbers(df):
+    """
+    매물번호 → 식별 키용 문자열 (결측값은 빈 문자열)
+    
+    숫자 매물번호에 결측값이 섞이면 pandas가 float로 읽어 '2412345.0'이 되므로
+    정수 문자열로 맞춤 (같은 매물이 배치 구성에 따라 다른 키가 되지 않도록)
+    """
+    values = _column(df, '매물번호', None)
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64').astype(object)
+    return _text(values)
+
+
+def _listing_keys(complex_no, df, price, deposit):
+    """
+    매물 식별 키 생성 (벡터 연산)
+    
+    - 매물번호(네이버 articleNo)가 있으면 단지|거래유형|매물번호 형식
+      (가격이 바뀌거나 다른 매물이 들어오고 나가도 같은 매물은 같은 키)
+    - 없으면(DOM 추출, 샘플 데이터) 단지|거래유형|면적타입|전용면적|층|방향#순번 형식
+      속성이 모두 같은 매물은 배치 안에서 (가격, 보증금) 순으로 순번을 붙여 구분
+      (스키마 v5 백필 SQL과 같은 형식)
+    """
+    trade_type = _text(_column(df, '거래유형', 'SALE'))
+    article_no = _article_numbers(df)
+    keys = str(complex_no) + '|' + trade_type + '|' + article_no
+    
+    # 속성 키와 순번은 매물번호가 없는 매물만 계산 (매물번호 있는 매물의 출입이 순번을 밀지 않도록)
+    missing = article_no == ''
+    if not missing.any():
+        return keys
+    
+    rows = df[missing]
+    area = pd.to_numeric(_column(rows, '전용면적', 0.0), errors='coerce').fillna(0.0)
+    attributes = pd.DataFrame({
+        'trade_type': trade_type[missing],
+        'area_type': _text(_column(rows, '면적타입', '')),
+        'area': area.map('{:.2f}'.format),
+        'floor': _text(_column(rows, '층', '')),
+        'direction': _text(_column(rows, '방향', '')),
+    })
+    
+    # 속성 조합별로 한 번만 문자열 생성 (행마다 문자열을 이어 붙이지 않음)
+    group = attributes.groupby(list(attributes.columns), sort=False).ngroup().to_numpy()
+    names = [str(complex_no) + '|' + '|'.join(values) for values in attributes.drop_duplicates().itertuples(index=False)]
+    
+    frame = pd.DataFrame({'group': group, 'price': price[missing].to_numpy(), 'deposit': deposit[missing].to_numpy()})
+    ordered = frame.sort_values(['group', 'price', 'deposit'], kind='stable')
+    ordinal = ordered.groupby('group').cumcount().sort_index().tolist()
+    
+    keys = keys.to_numpy(dtype=object)
+    keys[missing.to_numpy()] = [f'{names[g]}#{n}' for g, n in zip(group.tolist(), ordinal)]
+    return pd.Series(keys, index=df.index)
+
+
+def _observed_listings_sql(partitions):
+    """
+    특정 날짜(:day_key)에 관측된 매물과 그날 기준 가격 조회 SQL
+    
+    - 관측 기간(first_seen_day ~ last_seen_day)에 포함된 매물
+    - 그날 이후 가격이 바뀐 매물만 변경 이력에서 당시 가격 조회
+      (뷰 대신 그날 이전 월 파티션만 직접 검색)
+    
+    Args:
+        partitions: 그날이 속한 월 이전의 prices 파티션 목록
+    """
+    def as_of(column):
+        if not partitions:
+            return 'NULL'
+        arms = union_sql(
+            partitions, f'{column}, collected_ts',
+            'listing_key = l.listing_key AND collected_day <= :day_key'
+        )
+        return f'(SELECT {column} FROM ({arms}) ORDER BY collected_ts DESC LIMIT 1)'
+    
+    return f'''
+        SELECT
+            l.complex_no,
+            l.area_type,
+            l.transaction_type,
+            CASE WHEN l.price_changed_day <= :day_key THEN l.price ELSE {as_of('price')} END AS price,
+            CASE WHEN l.price_changed_day <= :day_key THEN l.deposit ELSE {as_of('deposit')} END AS deposit
+        FROM listings l
+        WHERE l.last_seen_day >= :day_key AND l.first_seen_day <= :day_key
+    '''
+
+
+# (단지, 면적, 날짜) 버킷별 가격 요약 → price_history UPSERT
+# 전세가는 보증금(deposit) 컬럼 기준
+# 관측 매물은 MATERIALIZED로 한 번만 계산 (집계식마다 당시 가격 서브쿼리가 반복되지 않도록)
+_ROLLUP_SQL = '''
+    INSERT OR REPLACE INTO price_history 
+    (complex_no, area_type, record_date, record_day,
+     sale_min_price, sale_max_price, sale_avg_price, sale_count,
+     lease_min_price, lease_max_price, lease_avg_price, lease_count,
+     gap_investment, lease_ratio, created_at)
+    SELECT
+        complex_no, area_type, :record_date, :day_key,
+        sale_min, sale_max, sale_avg, sale_count,
+        lease_min, lease_max, lease_avg, lease_count,
+        CASE WHEN sale_min AND lease_max THEN sale_min - lease_max END,
+        CASE WHEN sale_avg > 0 AND lease_avg THEN ROUND(lease_avg * 100.0 / sale_avg, 1) END,
+        :created_at
+    FROM (
+        WITH observed AS MATERIALIZED ({observed})
+        SELECT
+            complex_no,
+            area_type,
+            MIN(CASE WHEN transaction_type = 'SALE' THEN price END) AS sale_min,
+            MAX(CASE WHEN transaction_type = 'SALE' THEN price END) AS sale_max,
+            CAST(AVG(CASE WHEN transaction_type = 'SALE' THEN price END) AS INTEGER) AS sale_avg,
+            SUM(transaction_type = 'SALE') AS sale_count,
+            MIN(CASE WHEN transaction_type = 'LEASE' THEN deposit END) AS lease_min,
+            MAX(CASE WHEN transaction_type = 'LEASE' THEN deposit END) AS lease_max,
+            CAST(AVG(CASE WHEN transaction_type = 'LEASE' THEN deposit END) AS INTEGER) AS lease_avg,
+            SUM(transaction_type = 'LEASE') AS lease_count
+        FROM observed
+        GROUP BY complex_no, area_type
+    )
+'''
+
+# 기간 내 (단지, 면적)별 첫날/마지막 날 가격 비교 → 상승/하락/갭 변동 상위 K개
+# get_price_change와 같은 기준 (양 끝 값이 없거나 0이면 변동 없음으로 처리)
+# 윈도 함수로 단지마다 조회하지 않고 한 번의 스캔으로 계산
+_PRICE_CHANGE_RANKING_SQL = '''
+    SELECT *
+    FROM (
+        SELECT
+            changes.*,
+            ROW_NUMBER() OVER (ORDER BY sale_change_pct IS NULL, sale_change_pct DESC) AS riser_rank,
+            ROW_NUMBER() OVER (ORDER BY sale_change_pct IS NULL, sale_change_pct ASC) AS faller_rank,
+            ROW_NUMBER() OVER (ORDER BY gap_change IS NULL, ABS(gap_change) DESC) AS gap_rank
+        FROM (
+            SELECT
+                complex_no, area_type, start_date, end_date,
+                sale_start, sale_current,
+                sale_current - sale_start AS sale_change,
+                ROUND((sale_current - sale_start) * 100.0 / sale_start, 2) AS sale_change_pct,
+                lease_start, lease_current,
+                lease_current - lease_start AS lease_change,
+                ROUND((lease_current - lease_start) * 100.0 / lease_start, 2) AS lease_change_pct,
+                gap_start, gap_current,
+                gap_current - gap_start AS gap_change
+            FROM (
+                SELECT DISTINCT
+                    complex_no,
+                    area_type,
+                    COUNT(*) OVER w AS days,
+                    FIRST_VALUE(record_date) OVER w AS start_date,
+                    LAST_VALUE(record_date) OVER w AS end_date,
+                    NULLIF(FIRST_VALUE(sale_avg_price) OVER w, 0) AS sale_start,
+                    NULLIF(LAST_VALUE(sale_avg_price) OVER w, 0) AS sale_current,
+                    NULLIF(FIRST_VALUE(lease_avg_price) OVER w, 0) AS lease_start,
+                    NULLIF(LAST_VALUE(lease_avg_price) OVER w, 0) AS lease_current,
+                    NULLIF(FIRST_VALUE(gap_investment) OVER w, 0) AS gap_start,
+                    NULLIF(LAST_VALUE(gap_investment) OVER w, 0) AS gap_current
+                FROM price_history
+                WHERE record_day >= :start_day {where}
+                WINDOW w AS (
+                    PARTITION BY complex_no, area_type ORDER BY record_day
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                )
+            )
+            WHERE days >= 2
+        ) changes
+    )
+    WHERE (riser_rank <= :top_k AND sale_change_pct > 0)
+       OR (faller_rank <= :top_k AND sale_change_pct < 0)
+       OR (gap_rank <= :top_k AND gap_change != 0)
+'''
 
 
 class RealEstateDB:
-    def __init__(self, db_path="data/real_estate.db"):
-        """SQLite 데이터베이스 초기화"""
+    def __init__(self, db_path=DEFAULT_DB_PATH, readonly=False, archive_dir=None):
+        """
+        SQLite 데이터베이스 연결 (연결 풀에서 획득)
+        
+        Args:
+            db_path: DB 파일 경로
+            readonly: True면 읽기 전용 연결 (대시보드 조회용)
+            archive_dir: Parquet 아카이브 디렉터리 (기본값: DB 파일 옆 archive/)
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.readonly = readonly
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(db_path), 'archive')
+        self._pool = get_pool(db_path, readonly=readonly)
+        self.conn = self._pool.acquire()
         self.cursor = self.conn.cursor()
-        self._init_tables()
-    
-    def _init_tables(self):
-        """데이터베이스 테이블 생성"""
-        # 아파트 단지 정보 테이블
-        # 기존 테이블 생성
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS complexes (
-                complex_no TEXT PRIMARY KEY,
-                complex_name TEXT,
-                address TEXT,
-                total_households INTEGER,
-                build_year INTEGER,
-                total_area REAL,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS prices (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                complex_no TEXT,
-                area_type TEXT,
-                exclusive_area REAL,
-                transaction_type TEXT,
-                price BIGINT,
-                deposit BIGINT,
-                floor TEXT,
-                floor_number INTEGER,
-                direction TEXT,
-                collected_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
-            )
-        ''')
-        
-        # 사용자 테이블 추가
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                plan TEXT DEFAULT 'free',
-                max_watchlist INTEGER DEFAULT 3,
-                email_notifications BOOLEAN DEFAULT 1,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # 관심 단지 테이블
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS watchlist (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                complex_no TEXT NOT NULL,
-                complex_name TEXT,
-                alert_price_drop REAL DEFAULT 5.0,
-                alert_gap_threshold BIGINT DEFAULT 50000000,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(user_id, complex_no),
-                FOREIGN KEY (user_id) REFERENCES users (id),
-                FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
-            )
-        ''')
-        
-        # 가격 히스토리 테이블 (일별 요약)
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS price_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                complex_no TEXT NOT NULL,
-                area_type TEXT NOT NULL,
-                record_date DATE NOT NULL,
-                
-                -- 매매 통계
-                sale_min_price BIGINT,
-                sale_max_price BIGINT,
-                sale_avg_price BIGINT,
-                sale_count INTEGER DEFAULT 0,
-                
-                -- 전세 통계
-                lease_min_price BIGINT,
-                lease_max_price BIGINT,
-                lease_avg_price BIGINT,
-                lease_count INTEGER DEFAULT 0,
-                
-                -- 계산 지표
-                gap_investment BIGINT,
-                lease_ratio REAL,
-                
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(complex_no, area_type, record_date),
-                FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
-            )
-        ''')
-        
-        # 인덱스 생성
-        self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_prices_complex_no 
-            ON prices(complex_no)
-        ''')
-        self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_prices_collected_at 
-            ON prices(collected_at)
-        ''')
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_prices_floor_number 
-            ON prices(floor_number)
-        ''')
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_prices_area_type 
-            ON prices(area_type)
-        ''')
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_prices_transaction_type 
-            ON prices(transaction_type)
-        ''')
-        # price_history 인덱스
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_price_history_complex_no 
-            ON price_history(complex_no)
-        ''')
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_price_history_date 
-            ON price_history(record_date)
-        ''')
-        
-        self.conn.commit()
-        print(f"✓ 데이터베이스 테이블 초기화 완료: {self.db_path}")
     
     def save_complexes(self, df):
-        """단지 정보를 데이터베이스에 저장 (UPSERT)"""
+        """단지 정보를 데이터베이스에 저장 (UPSERT, executemany 일괄 처리)"""
         if df is None or df.empty:
             print("⚠ 저장할 단지 데이터가 없습니다.")
             return
         
+        started = time.perf_counter()
         updated_at = datetime.now().isoformat()
         
-        for _, row in df.iterrows():
-            self.cursor.execute('''
+        rows = zip(
+            _column(df, '단지번호', '').tolist(),
+            _column(df, '단지명', '').tolist(),
+            _column(df, '주소', '').tolist(),
+            _column(df, '세대수', 0).tolist(),
+            _column(df, '건축년도', 2010).tolist(),
+            _column(df, '면적', 0.0).tolist(),
+            [updated_at] * len(df),
+        )
+        
+        with self.conn:
+            self.cursor.executemany('''
                 INSERT OR REPLACE INTO complexes 
                 (complex_no, complex_name, address, total_households, build_year, total_area, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                row.get('단지번호', ''),
-                row.get('단지명', ''),
-                row.get('주소', ''),
-                row.get('세대수', 0),
-                row.get('건축년도', 2010),
-                row.get('면적', 0.0),
-                updated_at
-            ))
-        
-        self.conn.commit()
-        print(f"✓ {len(df)}개 단지 정보 저장 완료")
+            ''', rows)
+        
+        elapsed = time.perf_counter() - started
+        print(f"✓ {len(df)}개 단지 정보 저장 완료 ({_rate(len(df), elapsed)})")
     
     def save_prices(self, df, complex_no):
         """
-        매물 가격 정보를 데이터베이스에 저장
+        매물 가격 정보를 데이터베이스에 저장 (당일 가격 히스토리도 함께 갱신)
         
         주의: 가격은 \"만원\" 단위로 저장됨
         - 매매가: '가격' 컬럼에 저장 (원 단위 → 만원 단위로 변환)
         - 전세가: '보증금' 컬럼에 저장 (원 단위 → 만원 단위로 변환)
+        
+        매물 식별 키 기준 스냅샷-델타 저장
+        - 새 매물: listings 추가 + prices(변경 이력)에 기록
+        - 가격 변경: listings 가격 갱신 + prices에 기록
+        - 변동 없음: listings의 last_seen만 갱신
+        
+        Returns:
+            dict: 저장 통계 (rows, new, changed, unchanged, seconds, rows_per_sec)
         """
         if df is None or df.empty:
             print(f"⚠ [{complex_no}] 저장할 매물 데이터가 없습니다.")
             return
         
-        collected_at = datetime.now().isoformat()
+        started = time.perf_counter()
+        now = datetime.now()
+        with self.conn:
+            stats, area_types = self._write_prices(df, complex_no, now)
+            self._refresh_price_history(complex_no, now.strftime('%Y-%m-%d'), area_types)
         
-        for _, row in df.iterrows():
-            # 가격을 원 단위 → 만원 단위로 변환
-            price = row.get('가격', 0)
-            deposit = row.get('보증금', 0)
-            
-            # 원 단위 검사 (100만 이상은 원 단위로 가정)
-            if price > 1000000:
-                price = int(price / 10000)  # 원 → 만원
-            if deposit > 1000000:
-                deposit = int(deposit / 10000)  # 원 → 만원
+        elapsed = time.perf_counter() - started
+        stats.update(seconds=elapsed, rows_per_sec=stats['rows'] / elapsed if elapsed > 0 else float(stats['rows']))
+        print(
+            f"✓ [{complex_no}] {stats['rows']}개 매물 정보 저장 완료 "
+            f"(신규 {stats['new']}, 가격 변경 {stats['changed']}, 유지 {stats['unchanged']}, {_rate(stats['rows'], elapsed)})"
+        )
+        
+        return stats
+    
+    def save_price_batches(self, batches):
+        """
+        여러 단지의 매물 배치를 하나의 트랜잭션으로 저장 (그룹 커밋)
+        
+        수집 워커들이 보낸 배치를 단일 writer가 모아 한 번에 커밋
+        → 단지마다 커밋할 때보다 쓰기 잠금 경합과 fsync 횟수가 줄어듦
+        배치별 처리는 save_prices와 같음 (같은 단지 배치가 여러 개여도 순서대로 반영)
+        
+        Args:
+            batches: (단지 번호, 매물 DataFrame) 목록
+        
+        Returns:
+            dict: 저장 통계 (batches, complexes, rows, new, changed, unchanged, seconds, rows_per_sec)
+        """
+        batches = [(complex_no, df) for complex_no, df in batches if df is not None and not df.empty]
+        stats = {'batches': len(batches), 'complexes': [], 'rows': 0, 'new': 0, 'changed': 0, 'unchanged': 0}
+        if not batches:
+            return stats
+        
+        started = time.perf_counter()
+        now = datetime.now()
+        touched = {}
+        with self.conn:
+            for complex_no, df in batches:
+                counts, area_types = self._write_prices(df, complex_no, now)
+                for name, value in counts.items():
+                    stats[name] += value
+                touched.setdefault(complex_no, set()).update(area_types)
             
-            self.cursor.execute('''
-                INSERT INTO prices 
-                (complex_no, collected_at, area_type, exclusive_area, 
-                 price, transaction_type, deposit, floor, floor_number, direction)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                complex_no,
-                collected_at,
-                row.get('면적타입', ''),
-                row.get('전용면적', 0.0),
-                price,  # 만원 단위
-                row.get('거래유형', 'SALE'),
-                deposit,  # 만원 단위
-                row.get('층', ''),
-                row.get('층수', 0),
-                row.get('방향', '')
-            ))
-        
-        self.conn.commit()
-        print(f"✓ [{complex_no}] {len(df)}개 매물 정보 저장 완료")
+            # 가격 히스토리는 배치마다가 아니라 단지마다 한 번만 재집계
+            for complex_no, area_types in touched.items():
+                self._refresh_price_history(complex_no, now.strftime('%Y-%m-%d'), sorted(area_types))
+        
+        elapsed = time.perf_counter() - started
+        stats['complexes'] = list(dict.fromkeys(complex_no for complex_no, _ in batches))
+        stats.update(seconds=elapsed, rows_per_sec=stats['rows'] / elapsed if elapsed > 0 else float(stats['rows']))
+        print(
+            f"✓ {len(batches)}개 배치 ({len(stats['complexes'])}개 단지) {stats['rows']}개 매물 일괄 저장 완료 "
+            f"(신규 {stats['new']}, 가격 변경 {stats['changed']}, 유지 {stats['unchanged']}, {_rate(stats['rows'], elapsed)})"
+        )
+        
+        return stats
+    
+    def _write_prices(self, df, complex_no, now):
+        """
+        매물 배치 하나를 listings + 변경 이력 파티션에 반영
+        (커밋과 가격 히스토리 재집계는 호출자가 담당 - 그룹 커밋에서 단지마다 한 번만 집계)
+        
+        Args:
+            df: 매물 DataFrame
+            complex_no: 단지 번호
+            now: 수집 시각
+        
+        Returns:
+            tuple: (배치 통계 dict(rows, new, changed, unchanged), 저장된 면적 타입 목록)
+        """
+        collected_at = now.isoformat()
+        collected_ts = int(now.timestamp())
+        collected_day = _day_key(now)
+        
+        # 가격을 원 단위 → 만원 단위로 변환 (100만 초과는 원 단위로 가정)
+        price = _to_manwon(_column(df, '가격', 0))
+        deposit = _to_manwon(_column(df, '보증금', 0))
+        keys = _listing_keys(complex_no, df, price, deposit)
+        
+        # 같은 매물번호가 배치에 두 번 있으면 마지막 것만 반영 (listings 키 중복으로 배치 전체가 실패하지 않도록)
+        latest = ~keys.duplicated(keep='last').to_numpy()
+        if not latest.all():
+            df, price, deposit, keys = df[latest], price[latest], deposit[latest], keys[latest]
+        count = len(df)
+        
+        # 이 단지의 기존 매물 상태와 비교해 신규/변경/유지 분류
+        self.cursor.execute(
+            'SELECT listing_key, price, deposit FROM listings WHERE complex_no = ?',
+            (complex_no,)
+        )
+        known = pd.DataFrame(self.cursor.fetchall(), columns=['listing_key', 'price', 'deposit'])
+        known = known.set_index('listing_key')
+        
+        is_new = ~keys.isin(known.index)
+        is_changed = ~is_new & (
+            (price != keys.map(known['price'])) | (deposit != keys.map(known['deposit']))
+        )
+        is_unchanged = ~is_new & ~is_changed
+        
+        area_type = _column(df, '면적타입', '')
+        exclusive_area = _column(df, '전용면적', 0.0)
+        transaction_type = _column(df, '거래유형', 'SALE')
+        floor = _column(df, '층', '')
+        floor_number = _column(df, '층수', 0)
+        direction = _column(df, '방향', '')
+        
+        def rows(mask, *columns):
+            return zip(*(column[mask].tolist() for column in columns))
+        
+        def constant(value):
+            return pd.Series(value, index=df.index)
+        
+        self.cursor.executemany('''
+            INSERT INTO listings 
+            (listing_key, complex_no, area_type, exclusive_area, transaction_type,
+             price, deposit, floor, floor_number, direction,
+             first_seen_ts, first_seen_day, last_seen_ts, last_seen_day, price_changed_day)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows(
+            is_new, keys, constant(complex_no), area_type, exclusive_area, transaction_type,
+            price, deposit, floor, floor_number, direction,
+            constant(collected_ts), constant(collected_day),
+            constant(collected_ts), constant(collected_day), constant(collected_day),
+        ))
+        
+        self.cursor.executemany('''
+            UPDATE listings
+            SET price = ?, deposit = ?, floor_number = ?, price_changed_day = ?,
+                last_seen_ts = ?, last_seen_day = ?
+            WHERE listing_key = ?
+        ''', rows(
+            is_changed, price, deposit, floor_number, constant(collected_day),
+            constant(collected_ts), constant(collected_day), keys,
+        ))
+        
+        self.cursor.executemany(
+            'UPDATE listings SET last_seen_ts = ?, last_seen_day = ? WHERE listing_key = ?',
+            rows(is_unchanged, constant(collected_ts), constant(collected_day), keys)
+        )
+        
+        # 변경 이력: 신규 + 가격 변경 매물만 해당 월 파티션에 기록 (범주형 컬럼은 사전 코드)
+        logged = is_new | is_changed
+        partition = ensure_partition(self.conn, collected_day)
+        self.cursor.executemany(f'''
+            INSERT INTO {partition} 
+            (complex_no, listing_key, collected_at, collected_ts, collected_day, area_type_code, exclusive_area, 
+             price, transaction_type_code, deposit, floor_code, floor_number, direction_code)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows(
+            logged, constant(complex_no), keys, constant(collected_at),
+            constant(collected_ts), constant(collected_day),
+            encode(self.conn, 'area_type', area_type), exclusive_area,
+            price, encode(self.conn, 'transaction_type', transaction_type), deposit,
+            encode(self.conn, 'floor', floor), floor_number,
+            encode(self.conn, 'direction', direction),
+        ))
+        
+        # 이번 배치가 영향을 준 면적 → 호출자가 (단지, 면적, 날짜) 버킷만 가격 히스토리 갱신
+        return {
+            'rows': count,
+            'new': int(is_new.sum()),
+            'changed': int(is_changed.sum()),
+            'unchanged': int(is_unchanged.sum()),
+        }, area_type.dropna().unique().tolist()
     
     def get_all_complex_numbers(self):
         """관리 중인 모든 단지 번호 조회"""
@@ -233,33 +475,259 @@ class RealEstateDB:
         return pd.read_sql_query(query, self.conn, params=params)
     
     def get_latest_prices(self, complex_no=None, limit=100):
-        """최신 매물 정보 조회"""
+        """최신 매물 정보 조회 (최근 관측 순)"""
         query = '''
-            SELECT p.*, c.complex_name, c.address
-            FROM prices p
-            LEFT JOIN complexes c ON p.complex_no = c.complex_no
+            SELECT l.*, c.complex_name, c.address
+            FROM listings l
+            LEFT JOIN complexes c ON l.complex_no = c.complex_no
         '''
         params = []
         
         if complex_no:
-            query += ' WHERE p.complex_no = ?'
+            query += ' WHERE l.complex_no = ?'
             params.append(complex_no)
         
-        query += ' ORDER BY p.collected_at DESC LIMIT ?'
+        query += ' ORDER BY l.last_seen_ts DESC LIMIT ?'
         params.append(limit)
         
         return pd.read_sql_query(query, self.conn, params=params)
     
+    def get_recent_prices(self, complex_no, transaction_type='SALE', limit=2):
+        """
+        특정 단지·거래유형의 최근 가격 변경 이력 조회 (가격 변동 감지용)
+        
+        최신 월 파티션부터 필요한 건수가 찰 때까지만 조회
+        
+        Returns:
+            list[dict]: collected_at, area_type, price, transaction_type (최신순)
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        rows = []
+        
+        type_code = lookup_code(self.conn, 'transaction_type', transaction_type)
+        if type_code is None:
+            return rows
+        
+        for partition in reversed(list_partitions(self.conn)):
+            cursor.execute(f'''
+                SELECT p.collected_at, a.value AS area_type, p.price, ? AS transaction_type
+                FROM {partition} p
+                LEFT JOIN price_codes a ON a.code = p.area_type_code
+                WHERE p.complex_no = ? AND p.transaction_type_code = ?
+                ORDER BY p.collected_ts DESC
+                LIMIT ?
+            ''', (transaction_type, complex_no, type_code, limit - len(rows)))
+            rows.extend(dict(row) for row in cursor.fetchall())
+            if len(rows) >= limit:
+                break
+        
+        return rows
+    
+    def get_listings(self, complex_no=None):
+        """
+        대시보드 표시용 현재 매물 목록 조회 (latest_listings 스냅샷)
+        
+        단지 정보 JOIN과 억 단위 변환은 refresh_latest_listings에서 미리 계산됨
+        
+        Args:
+            complex_no: 단지 번호 (선택, 없으면 전체)
+        
+        Returns:
+            DataFrame: 아파트명, 면적_m2, 매매가_억, 전세가_억, 타입 등 표시용 컬럼
+        """
+        query = '''
+        SELECT 
+            complex_no,
+            complex_name as 아파트명,
+            address as 주소,
+            total_households as 세대수,
+            build_year as 연식,
+            area_type as 면적타입,
+            exclusive_area as 면적_m2,
+            sale_eok as 매매가_억,
+            lease_eok as 전세가_억,
+            transaction_type as 거래유형,
+            floor,
+            floor_number as 층수,
+            direction as 방향,
+            collected_at,
+            type_label as 타입
+        FROM latest_listings
+        '''
+        params = []
+        
+        # 특정 단지 필터링
+        if complex_no:
+            query += " WHERE complex_no = ?"
+            params.append(complex_no)
+        
+        query += " ORDER BY complex_name, area_type, transaction_type"
+        
+        return pd.read_sql_query(query, self.conn, params=params)
+    
+    def refresh_latest_listings(self, complex_nos=None):
+        """
+        대시보드용 현재 매물 스냅샷(latest_listings) 재구성
+        
+        단지·거래유형별 마지막 수집일에 관측된 매물만 담음
+        하나의 트랜잭션에서 삭제 후 다시 채우므로 대시보드는 이전/이후 스냅샷 중 하나만 봄
+        (수집/가져오기가 끝날 때 호출)
+        
+        Args:
+            complex_nos: 재구성할 단지 번호 목록 (None이면 전체)
+        
+        Returns:
+            int: 스냅샷 매물 수
+        """
+        if complex_nos is None:
+            delete_sql = "DELETE FROM latest_listings"
+            insert_sql = LATEST_LISTINGS_SQL.format(where='1')
+            params = []
+        else:
+            complex_nos = list(complex_nos)
+            if not complex_nos:
+                return 0
+            placeholders = ', '.join('?' * len(complex_nos))
+            delete_sql = f"DELETE FROM latest_listings WHERE complex_no IN ({placeholders})"
+            insert_sql = LATEST_LISTINGS_SQL.format(where=f'l.complex_no IN ({placeholders})')
+            params = complex_nos
+        
+        with self.conn:
+            self.cursor.execute(delete_sql, params)
+            # 단지 조건이 서브쿼리와 바깥 쿼리에 한 번씩 들어감
+            self.cursor.execute(insert_sql, params * 2)
+            count = self.cursor.rowcount
+        
+        return count
+    
+    def reset_listings(self):
+        """매물/가격 변경 이력/단지 데이터 전체 삭제 (가격 히스토리는 유지)"""
+        with self.conn:
+            drop_partitions(self.conn, list_partitions(self.conn))
+            self.cursor.execute("DELETE FROM listings")
+            self.cursor.execute("DELETE FROM latest_listings")
+            self.cursor.execute("DELETE FROM complexes")
+    
+    def prune_prices(self, days=90, archive=True):
+        """
+        보존 기간이 지난 가격 데이터 정리
+        
+        - 가격 변경 이력: 기준일이 속한 월보다 오래된 월 파티션을 통째로 DROP
+          (행 단위 DELETE 없이 즉시 끝나며, 최대 한 달치가 더 보존됨)
+        - archive=True면 DROP 전에 Parquet 아카이브로 이동하고,
+          같은 기준 이전의 price_history 행도 아카이브로 옮김 (pyarrow 필요)
+        - listings: 보존 기간 동안 한 번도 관측되지 않은 매물 삭제
+        
+        Args:
+            days: 보존 일수 (기본 90일)
+            archive: 삭제 전 Parquet 아카이브 여부
+        
+        Returns:
+            dict: dropped_partitions, archived_files, archived_history, deleted_listings
+        """
+        cutoff_day = _day_key(datetime.now() - timedelta(days=days))
+        month_floor = cutoff_day // 100 * 100  # 기준 월 이전 (YYYYMM00 미만)
+        
+        if archive and not archive_available():
+            print("⚠ pyarrow가 설치되지 않아 아카이브 없이 정리합니다.")
+            archive = False
+        
+        archived_files = []
+        archived_history = 0
+        
+        # 파일 저장 중 오류가 나면 트랜잭션이 롤백되어 아무것도 삭제되지 않음
+        with self.conn:
+            expired = expired_partitions(self.conn, cutoff_day)
+            
+            if archive:
+                for partition in expired:
+                    rows = pd.read_sql_query(f'''
+                        SELECT p.*, c.address
+                        FROM ({decoded_sql(partition)}) p
+                        LEFT JOIN complexes c ON p.complex_no = c.complex_no
+                    ''', self.conn)
+                    archived_files += write_archive(
+                        rows, 'prices', partition, self.archive_dir, 'collected_day',
+                        keys=['listing_key', 'collected_ts']
+                    )
+                
+                history = pd.read_sql_query('''
+                    SELECT h.*, c.address
+                    FROM price_history h
+                    LEFT JOIN complexes c ON h.complex_no = c.complex_no
+                    WHERE h.record_day < ?
+                ''', self.conn, params=[month_floor])
+                for month, rows in history.groupby(history['record_day'] // 100):
+                    archived_files += write_archive(
+                        rows, 'price_history', f'price_history_{month}', self.archive_dir, 'record_day',
+                        keys=['complex_no', 'area_type', 'record_day']
+                    )
+                
+                self.cursor.execute("DELETE FROM price_history WHERE record_day < ?", (month_floor,))
+                archived_history = self.cursor.rowcount
+            
+            drop_partitions(self.conn, expired)
+            self.cursor.execute("DELETE FROM listings WHERE last_seen_day < ?", (cutoff_day,))
+            deleted_listings = self.cursor.rowcount
+            self.cursor.execute("DELETE FROM latest_listings WHERE last_seen_day < ?", (cutoff_day,))
+        
+        return {
+            'dropped_partitions': expired,
+            'archived_files': archived_files,
+            'archived_history': archived_history,
+            'deleted_listings': deleted_listings,
+        }
+    
     def get_complex_info(self, complex_no):
         """특정 단지 정보 조회"""
         query = 'SELECT * FROM complexes WHERE complex_no = ?'
         result = pd.read_sql_query(query, self.conn, params=[complex_no])
         return result.iloc[0] if not result.empty else None
     
+    def _refresh_price_history(self, complex_no, record_date, area_types=None):
+        """
+        (단지, 면적, 날짜) 버킷의 price_history 행을 그날 관측된 매물로 다시 집계
+        
+        listings (complex_no, area_type, last_seen_day) 인덱스 검색으로 해당 버킷의 매물만 읽음
+        커밋은 호출자가 담당
+        
+        Args:
+            complex_no: 단지 번호
+            record_date: 기록 날짜 ('YYYY-MM-DD')
+            area_types: 갱신할 면적 타입 목록 (None이면 해당 날짜의 모든 면적)
+        
+        Returns:
+            int: 갱신된 버킷 수
+        """
+        params = {
+            'complex_no': complex_no,
+            'record_date': record_date,
+            'day_key': _day_key(record_date),
+            'created_at': datetime.now().isoformat(),
+        }
+        partitions = list_partitions(self.conn, end_day=params['day_key'])
+        observed = _observed_listings_sql(partitions) + ' AND l.complex_no = :complex_no'
+        
+        if area_types is not None:
+            if not area_types:
+                return 0
+            placeholders = []
+            for i, area_type in enumerate(area_types):
+                params[f'area_{i}'] = area_type
+                placeholders.append(f':area_{i}')
+            observed += f" AND l.area_type IN ({', '.join(placeholders)})"
+        
+        self.cursor.execute(_ROLLUP_SQL.format(observed=observed), params)
+        return self.cursor.rowcount
+    
     def save_daily_summary(self, complex_no, record_date=None):
         """
         특정 단지의 당일 가격 데이터를 집계하여 price_history에 저장
         
+        save_prices가 저장 시점에 버킷을 갱신하므로, 평소에는 호출할 필요 없음
+        (과거 날짜 재집계 등 수동 복구용)
+        
         Args:
             complex_no: 단지 번호
             record_date: 기록 날짜 (기본값: 오늘)
@@ -267,79 +735,60 @@ class RealEstateDB:
         if record_date is None:
             record_date = datetime.now().strftime('%Y-%m-%d')
         
-        # 해당 날짜의 가격 데이터 집계
-        query = '''
-            SELECT 
-                area_type,
-                transaction_type,
-                MIN(price) as min_price,
-                MAX(price) as max_price,
-                AVG(price) as avg_price,
-                COUNT(*) as count
-            FROM prices
-            WHERE complex_no = ? AND DATE(collected_at) = ?
-            GROUP BY area_type, transaction_type
-        '''
-        
-        df = pd.read_sql_query(query, self.conn, params=[complex_no, record_date])
+        with self.conn:
+            area_count = self._refresh_price_history(complex_no, record_date)
         
-        if df.empty:
+        if area_count == 0:
             print(f"⚠ [{complex_no}] {record_date}에 집계할 데이터가 없습니다.")
             return
         
-        # 면적별로 집계
-        area_types = df['area_type'].unique()
+        print(f"✓ [{complex_no}] {record_date} 가격 히스토리 저장 완료 ({area_count}개 면적)")
+    
+    def summarize_day(self, record_date=None):
+        """
+        특정 날짜의 모든 단지 × 면적 가격 히스토리를 한 번에 집계
         
-        for area_type in area_types:
-            area_data = df[df['area_type'] == area_type]
-            
-            # 매매 데이터
-            sale_data = area_data[area_data['transaction_type'] == 'SALE']
-            sale_min = int(sale_data['min_price'].iloc[0]) if not sale_data.empty else None
-            sale_max = int(sale_data['max_price'].iloc[0]) if not sale_data.empty else None
-            sale_avg = int(sale_data['avg_price'].iloc[0]) if not sale_data.empty else None
-            sale_count = int(sale_data['count'].iloc[0]) if not sale_data.empty else 0
-            
-            # 전세 데이터
-            lease_data = area_data[area_data['transaction_type'] == 'LEASE']
-            lease_min = int(lease_data['min_price'].iloc[0]) if not lease_data.empty else None
-            lease_max = int(lease_data['max_price'].iloc[0]) if not lease_data.empty else None
-            lease_avg = int(lease_data['avg_price'].iloc[0]) if not lease_data.empty else None
-            lease_count = int(lease_data['count'].iloc[0]) if not lease_data.empty else 0
-            
-            # 갭 및 전세가율 계산
-            gap_investment = None
-            lease_ratio = None
-            
-            if sale_min and lease_max:
-                gap_investment = sale_min - lease_max
-            
-            if sale_avg and lease_avg and sale_avg > 0:
-                lease_ratio = round(lease_avg / sale_avg * 100, 1)
-            
-            # UPSERT (INSERT OR REPLACE)
-            self.cursor.execute('''
-                INSERT OR REPLACE INTO price_history 
-                (complex_no, area_type, record_date, 
-                 sale_min_price, sale_max_price, sale_avg_price, sale_count,
-                 lease_min_price, lease_max_price, lease_avg_price, lease_count,
-                 gap_investment, lease_ratio, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                complex_no, area_type, record_date,
-                sale_min, sale_max, sale_avg, sale_count,
-                lease_min, lease_max, lease_avg, lease_count,
-                gap_investment, lease_ratio,
-                datetime.now().isoformat()
-            ))
-        
-        self.conn.commit()
-        print(f"✓ [{complex_no}] {record_date} 가격 히스토리 저장 완료 ({len(area_types)}개 면적)")
+        단지별 반복 없이 GROUP BY 쿼리 하나로 price_history 전체 행을 UPSERT
+        (그날 관측된 매물 기준, last_seen_day 인덱스 검색)
+        
+        Args:
+            record_date: 기록 날짜 (기본값: 오늘)
+        
+        Returns:
+            int: 저장된 price_history 행 수
+        """
+        if record_date is None:
+            record_date = datetime.now().strftime('%Y-%m-%d')
+        
+        started = time.perf_counter()
+        day_key = _day_key(record_date)
+        
+        with self.conn:
+            partitions = list_partitions(self.conn, end_day=day_key)
+            self.cursor.execute(
+                _ROLLUP_SQL.format(observed=_observed_listings_sql(partitions)),
+                {
+                    'record_date': record_date,
+                    'day_key': day_key,
+                    'created_at': datetime.now().isoformat(),
+                }
+            )
+            row_count = self.cursor.rowcount
+        
+        elapsed = time.perf_counter() - started
+        if row_count == 0:
+            print(f"⚠ {record_date}에 집계할 데이터가 없습니다.")
+        else:
+            print(f"✓ {record_date} 가격 히스토리 일괄 집계 완료 ({row_count}개 단지×면적, {elapsed:.2f}초)")
+        
+        return row_count
     
     def get_price_history(self, complex_no, area_type=None, days=90):
         """
         특정 단지의 가격 히스토리 조회
         
+        보존 기간이 지나 아카이브로 옮겨진 기간은 Parquet 아카이브에서 함께 조회
+        
         Args:
             complex_no: 단지 번호
             area_type: 면적 타입 (선택)
@@ -348,21 +797,39 @@ class RealEstateDB:
         Returns:
             DataFrame: 가격 히스토리
         """
+        start_day = _day_key(datetime.now() - timedelta(days=days))
         query = '''
             SELECT *
             FROM price_history
             WHERE complex_no = ?
-              AND record_date >= DATE('now', ?)
+              AND record_day >= ?
         '''
-        params = [complex_no, f'-{days} days']
+        params = [complex_no, start_day]
         
         if area_type:
             query += ' AND area_type = ?'
             params.append(area_type)
         
-        query += ' ORDER BY record_date ASC'
+        query += ' ORDER BY record_day ASC'
         
-        return pd.read_sql_query(query, self.conn, params=params)
+        history = pd.read_sql_query(query, self.conn, params=params)
+        
+        # 조회 기간이 DB에 남은 가장 오래된 기록보다 앞서면 아카이브에서 보충
+        self.cursor.execute('SELECT MIN(record_day) FROM price_history WHERE complex_no = ?', (complex_no,))
+        oldest_day = self.cursor.fetchone()[0]
+        
+        if oldest_day is None or start_day < oldest_day:
+            archived = read_archive(
+                'price_history', self.archive_dir, 'record_day',
+                complex_no=complex_no, start_day=start_day,
+                end_day=oldest_day - 1 if oldest_day else None
+            )
+            if area_type and not archived.empty:
+                archived = archived[archived['area_type'] == area_type]
+            if not archived.empty:
+                history = pd.concat([archived[history.columns], history], ignore_index=True)
+        
+        return history
     
     def get_price_change(self, complex_no, area_type=None, compare_days=30):
         """
@@ -416,11 +883,55 @@ class RealEstateDB:
         
         return result
     
+    def get_price_change_ranking(self, compare_days=30, top_k=10, complex_nos=None):
+        """
+        여러 단지의 가격 변동 순위 (상승/하락/갭 변동 상위 K개)
+        
+        (단지, 면적)별로 기간 첫날과 마지막 날을 비교 (get_price_change와 같은 기준)
+        단지마다 get_price_change를 호출하지 않고 price_history 윈도 함수 쿼리 한 번으로 계산
+        (아카이브로 옮겨진 기간은 포함하지 않음)
+        
+        Args:
+            compare_days: 비교 기간 (기본 30일)
+            top_k: 순위별 최대 개수
+            complex_nos: 대상 단지 번호 목록 (None이면 전체, 예: 관심 단지)
+        
+        Returns:
+            dict: 'risers'(매매가 상승률 순), 'fallers'(하락률 순), 'gap_changes'(갭 변동폭 순) DataFrame
+        """
+        params = {
+            'start_day': _day_key(datetime.now() - timedelta(days=compare_days + 1)),
+            'top_k': top_k,
+        }
+        where = ''
+        if complex_nos is not None:
+            complex_nos = list(complex_nos)
+            names = [f'complex_{n}' for n in range(len(complex_nos))]
+            where = f"AND complex_no IN ({', '.join(':' + name for name in names)})"
+            params.update(zip(names, complex_nos))
+        
+        query = f'''
+            SELECT r.*, c.complex_name
+            FROM ({_PRICE_CHANGE_RANKING_SQL.format(where=where)}) r
+            LEFT JOIN complexes c ON r.complex_no = c.complex_no
+        '''
+        ranked = pd.read_sql_query(query, self.conn, params=params)
+        
+        def top(rank, condition):
+            rows = ranked[(ranked[rank] <= top_k) & condition].sort_values(rank)
+            return rows.drop(columns=['riser_rank', 'faller_rank', 'gap_rank']).reset_index(drop=True)
+        
+        return {
+            'risers': top('riser_rank', ranked['sale_change_pct'] > 0),
+            'fallers': top('faller_rank', ranked['sale_change_pct'] < 0),
+            'gap_changes': top('gap_rank', ranked['gap_change'].fillna(0) != 0),
+        }
+    
     def get_area_types(self, complex_no):
         """특정 단지의 면적 타입 목록 조회"""
         query = '''
             SELECT DISTINCT area_type 
-            FROM prices 
+            FROM listings 
             WHERE complex_no = ? AND area_type != ''
             ORDER BY area_type
         '''
@@ -428,6 +939,8 @@ class RealEstateDB:
         return df['area_type'].tolist()
     
     def close(self):
-        """데이터베이스 연결 종료"""
-        self.conn.close()
+        """데이터베이스 연결 반납 (풀에 반환)"""
+        if self.conn is not None:
+            self._pool.release(self.conn)
+            self.conn = None
         print("✓ 데이터베이스 연결 종료")
\ No newline at end of file
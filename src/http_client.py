@@ -0,0 +1,196 @@
+"""
+공유 HTTP 클라이언트
+crawler.py / scraper.py의 API 호출이 함께 쓰는 requests.Session
+
+- 연결 풀 + HTTP keep-alive: 같은 호스트 요청은 TCP/TLS 연결을 재사용
+- 조건부 요청: 이전 응답의 ETag / Last-Modified를 If-None-Match / If-Modified-Since로 보내
+  변경 없는 단지 개요·매물 페이지는 본문 없는 304로 받고 저장해 둔 JSON 재사용
+- 디스크 캐시(src/response_cache.py): 단지 개요 등 메타데이터는 TTL 안에서는 요청 자체를 생략,
+  재검증 정보도 본문과 함께 저장하므로 TTL 만료 후나 다음 실행(매일 밤 수집)에서도 304 재검증
+  (디스크 캐시가 없으면 재검증 정보는 프로세스 메모리에만 보관)
+- 요청 수 / 304 재검증·디스크 캐시 적중률 / 새로 연 연결 수 통계
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.response_cache import ResponseCache
+
+
+# 호스트별 유지할 연결 수
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# 디스크 캐시가 없을 때 메모리에 재검증 정보를 보관할 최대 URL 수 (초과 시 오래 안 쓴 것부터 삭제)
+MAX_VALIDATORS = 5000
+
+
+def cache_key(url: str, params: dict = None) -> str:
+    """URL + 쿼리 파라미터 → 캐시 키 (파라미터 순서 무관)"""
+    if not params:
+        return url
+    return f"{url}?{json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)}"
+
+
+class HttpClient:
+    """연결 풀 + 조건부 재검증 HTTP 클라이언트"""
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 max_validators: int = MAX_VALIDATORS, cache: ResponseCache = None):
+        """
+        Args:
+            pool_connections: 연결 풀을 유지할 호스트 수
+            pool_maxsize: 호스트당 최대 연결 수
+            max_validators: 디스크 캐시가 없을 때 ETag/Last-Modified를 메모리에 보관할 최대 URL 수
+            cache: 엔드포인트별 TTL 디스크 캐시 (None이면 사용 안 함, 재검증 정보도 여기에 저장)
+        """
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self.max_validators = max_validators
+        self.cache = cache
+        # 디스크 캐시가 없을 때만 사용: 캐시 키 → {'etag', 'last_modified', 'data'}
+        self.validators = OrderedDict()
+        self.stats = {'requests': 0, 'conditional': 0, 'not_modified': 0, 'cache_hits': 0}
+        self._lock = threading.Lock()
+
+    def cached_json(self, endpoint: str, url: str, params: dict = None):
+        """
+        디스크 캐시에서만 조회 (네트워크 요청 없음)
+        캐시에 없을 때만 rate limiting 대기를 하려는 호출부에서 사용
+
+        Returns:
+            JSON 응답 (캐시 미사용/없음/만료/bypass면 None)
+        """
+        if not (endpoint and self.cache):
+            return None
+        data = self.cache.get(endpoint, cache_key(url, params))
+        if data is not None:
+            with self._lock:
+                self.stats['cache_hits'] += 1
+        return data
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        if self.cache:
+            return self.cache.validators(key)
+        with self._lock:
+            entry = self.validators.get(key)
+            if entry is not None:
+                self.validators.move_to_end(key)
+            return entry
+
+    def _remember(self, endpoint: Optional[str], key: str, etag: Optional[str],
+                  last_modified: Optional[str], data):
+        if self.cache:
+            # TTL 엔드포인트는 본문 캐시를, 나머지는 재검증 정보만 갱신
+            self.cache.put(endpoint, key, data, etag=etag, last_modified=last_modified)
+            return
+        with self._lock:
+            if not (etag or last_modified):
+                self.validators.pop(key, None)
+                return
+            self.validators[key] = {'etag': etag, 'last_modified': last_modified, 'data': data}
+            self.validators.move_to_end(key)
+            while len(self.validators) > self.max_validators:
+                self.validators.popitem(last=False)
+
+    def get_json(self, url: str, params: dict = None, headers: dict = None, timeout: float = 10,
+                 endpoint: str = None, refresh: bool = False):
+        """
+        GET 요청 → JSON (변경 없으면 304로 재검증 후 저장된 JSON 반환)
+        디스크 캐시가 TTL 만료됐어도 저장된 ETag/Last-Modified로 조건부 요청을 보내고,
+        304면 저장된 본문을 재사용하며 TTL을 다시 연장
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            headers: 요청 헤더
+            timeout: 타임아웃 (초)
+            endpoint: 디스크 캐시 TTL 이름 ('complex_overview' 등, None이면 캐시 안 함)
+            refresh: True면 디스크 캐시를 건너뛰고 새로 받아 덮어씀
+
+        Returns:
+            dict: JSON 응답
+
+        Raises:
+            requests.HTTPError: 4xx/5xx 응답 (e.response.status_code로 429 등 확인)
+        """
+        key = cache_key(url, params)
+        if not refresh:
+            data = self.cached_json(endpoint, url, params)
+            if data is not None:
+                return data
+
+        entry = self._lookup(key)
+        headers = dict(headers or {})
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['conditional'] += int(entry is not None)
+            not_modified = response.status_code == 304 and entry is not None
+            self.stats['not_modified'] += int(not_modified)
+
+        if not_modified:
+            data = entry['data']
+            # 304에 새 검증자가 오면 그것을, 없으면 기존 것을 유지
+            etag = response.headers.get('ETag') or entry['etag']
+            last_modified = response.headers.get('Last-Modified') or entry['last_modified']
+        else:
+            response.raise_for_status()
+            data = response.json()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        self._remember(endpoint, key, etag, last_modified, data)
+        return data
+
+    def connections_opened(self) -> int:
+        """지금까지 새로 연 TCP 연결 수 (요청 수보다 적으면 keep-alive 재사용)"""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def hit_rate(self) -> float:
+        """전체 요청 중 304로 재검증된 비율 (0~1)"""
+        return self.stats['not_modified'] / self.stats['requests'] if self.stats['requests'] else 0.0
+
+    def cache_hit_rate(self) -> float:
+        """전체 조회 중 디스크 캐시로 처리된(네트워크 요청 없음) 비율 (0~1)"""
+        lookups = self.stats['requests'] + self.stats['cache_hits']
+        return self.stats['cache_hits'] / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """통계 한 줄 요약"""
+        return (f"HTTP 요청 {self.stats['requests']}회, 조건부 {self.stats['conditional']}회, "
+                f"304 재사용 {self.stats['not_modified']}회 (적중률 {self.hit_rate():.0%}), "
+                f"디스크 캐시 {self.stats['cache_hits']}회 (적중률 {self.cache_hit_rate():.0%}), "
+                f"새 연결 {self.connections_opened()}개")
+
+    def close(self):
+        """연결 풀 + 디스크 캐시 종료"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """프로세스 공용 HttpClient (최초 호출 시 생성)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(cache=ResponseCache.from_config())
+        return _client
@@ -0,0 +1,237 @@
+"""
+매물 배치 수집 버퍼 (write-behind 큐)
+여러 Celery 수집 워커가 보낸 매물 배치를 Redis 리스트에 쌓아 두고
+단일 writer(db_writer 큐 전용 워커)가 모아서 한 트랜잭션으로 저장 (그룹 커밋)
+
+- 수집 워커는 DB에 직접 쓰지 않으므로 SQLite 쓰기 잠금 경합이 없음
+- 버퍼가 MAX_PENDING개 이상 밀리면 push가 대기 후 IngestBackpressure 발생 → 수집 속도 조절
+- 꺼낸 배치는 커밋 전까지 처리 중 리스트(PROCESSING_KEY)에 남아 writer가 죽어도 유실되지 않음
+- 일시적 오류(잠금 등)면 배치를 버퍼 앞쪽에 되돌리고, 계속 실패하는 배치는 dead-letter 리스트로 격리
+"""
+
+import json
+import sqlite3
+import time
+
+import pandas as pd
+
+
+QUEUE_KEY = 'ingest:listings'
+
+# writer가 꺼내 저장 중인 배치 (커밋 후 제거, writer가 죽으면 다음 drain이 버퍼로 되돌림)
+PROCESSING_KEY = 'ingest:processing'
+
+# 단독으로 저장해도 실패하는 배치 (버퍼를 막지 않도록 격리, 수동 확인용)
+DEAD_KEY = 'ingest:dead'
+
+# writer 작업이 이미 예약되어 있는지 표시하는 키 (중복 예약 방지)
+FLUSH_KEY = 'ingest:flush_scheduled'
+FLUSH_TTL = 300  # 초 - writer가 죽어도 이 시간 뒤에는 다시 예약 가능
+
+# 버퍼에 쌓일 수 있는 최대 배치 수 (초과 시 backpressure)
+MAX_PENDING = 200
+
+# 한 트랜잭션으로 묶을 최대 배치 수
+GROUP_BATCHES = 50
+
+
+class IngestBackpressure(RuntimeError):
+    """writer가 밀려 버퍼가 가득 찬 상태 (잠시 후 재시도)"""
+
+    def __init__(self, message: str, schedule_flush: bool = False):
+        super().__init__(message)
+        # True면 예약 표시를 이 push가 다시 걸었으므로 호출자가 writer를 예약해야 함
+        self.schedule_flush = schedule_flush
+
+
+class IngestQueue:
+    """Redis 리스트 기반 매물 배치 버퍼"""
+
+    def __init__(self, client, max_pending: int = MAX_PENDING):
+        """
+        Args:
+            client: redis.Redis 클라이언트
+            max_pending: 버퍼에 쌓일 수 있는 최대 배치 수
+        """
+        self.client = client
+        self.max_pending = max_pending
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs):
+        """Redis URL로 생성 (Celery 브로커와 같은 Redis 사용)"""
+        import redis
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def pending(self) -> int:
+        """버퍼에 쌓인 배치 수"""
+        return self.client.llen(QUEUE_KEY)
+
+    def push(self, complex_no: str, df: pd.DataFrame, timeout: float = 30.0, poll: float = 0.5) -> bool:
+        """
+        매물 배치를 버퍼에 추가 (가득 차 있으면 timeout까지 대기)
+
+        Args:
+            complex_no: 단지 번호
+            df: 매물 DataFrame (수집기 컬럼 그대로)
+            timeout: 버퍼에 자리가 날 때까지 기다릴 최대 시간 (초)
+            poll: 대기 중 확인 간격 (초)
+
+        Returns:
+            bool: writer 작업을 새로 예약해야 하면 True
+
+        Raises:
+            IngestBackpressure: timeout 동안 버퍼가 비지 않음
+                (writer가 예약되어 있지 않으면 예약 표시를 걸고 schedule_flush=True로 알림)
+        """
+        deadline = time.monotonic() + timeout
+        while self.pending() >= self.max_pending:
+            if time.monotonic() >= deadline:
+                # writer가 실패로 끝나 예약 표시가 풀린 채 버퍼가 가득 찼으면
+                # 아무도 writer를 다시 예약하지 못하므로 여기서 예약 표시를 다시 건다
+                raise IngestBackpressure(
+                    f"수집 버퍼 포화 ({self.max_pending}개 배치 대기 중)",
+                    schedule_flush=self.arm_flush(),
+                )
+            time.sleep(poll)
+
+        payload = json.dumps({
+            'complex_no': str(complex_no),
+            'records': df.to_json(orient='records', force_ascii=False),
+        }, ensure_ascii=False)
+        self.client.rpush(QUEUE_KEY, payload)
+        return self.arm_flush()
+
+    def arm_flush(self) -> bool:
+        """writer 예약 표시를 걺 (이미 걸려 있으면 False → 예약된 writer가 함께 저장)"""
+        return bool(self.client.set(FLUSH_KEY, 1, nx=True, ex=FLUSH_TTL))
+
+    def pop(self, count: int = GROUP_BATCHES) -> list:
+        """
+        버퍼 앞쪽에서 배치를 최대 count개 꺼내 처리 중 리스트로 옮김 (LMOVE)
+        커밋 후 ack()로 제거 - 그 전에 writer가 죽어도 배치는 처리 중 리스트에 남음
+        해석할 수 없는 payload는 바로 dead-letter로 보냄
+
+        Returns:
+            list[tuple]: (단지 번호, 매물 DataFrame, 원본 payload)
+        """
+        pipe = self.client.pipeline()
+        for _ in range(count):
+            pipe.lmove(QUEUE_KEY, PROCESSING_KEY, 'LEFT', 'RIGHT')
+        payloads = [payload for payload in pipe.execute() if payload is not None]
+
+        batches = []
+        for payload in payloads:
+            try:
+                item = json.loads(payload)
+                df = pd.DataFrame(json.loads(item['records']))
+            except (ValueError, KeyError, TypeError):
+                self.dead_letter([payload])
+                continue
+            batches.append((item['complex_no'], df, payload))
+        return batches
+
+    def ack(self, payloads: list):
+        """커밋된 배치를 처리 중 리스트에서 제거"""
+        if payloads:
+            pipe = self.client.pipeline()
+            for payload in payloads:
+                pipe.lrem(PROCESSING_KEY, 1, payload)
+            pipe.execute()
+
+    def dead_letter(self, payloads: list):
+        """저장할 수 없는 배치를 처리 중 리스트에서 dead-letter 리스트로 옮김"""
+        if payloads:
+            pipe = self.client.pipeline()
+            for payload in payloads:
+                pipe.rpush(DEAD_KEY, payload)
+                pipe.lrem(PROCESSING_KEY, 1, payload)
+            pipe.execute()
+
+    def dead_count(self) -> int:
+        """dead-letter 리스트에 격리된 배치 수"""
+        return self.client.llen(DEAD_KEY)
+
+    def requeue(self) -> int:
+        """
+        처리 중 리스트에 남은 배치를 순서 그대로 버퍼 앞쪽에 되돌림
+        (저장 실패 또는 이전 writer가 커밋 전에 죽은 경우)
+
+        Returns:
+            int: 되돌린 배치 수
+        """
+        moved = 0
+        while self.client.lmove(PROCESSING_KEY, QUEUE_KEY, 'RIGHT', 'LEFT') is not None:
+            moved += 1
+        return moved
+
+    def clear_flush(self):
+        """writer 예약 표시 해제 (이후 push가 writer를 다시 예약)"""
+        self.client.delete(FLUSH_KEY)
+
+
+def drain(queue: IngestQueue, db, group: int = GROUP_BATCHES) -> dict:
+    """
+    버퍼가 빌 때까지 최대 group개씩 꺼내 한 트랜잭션으로 저장
+    커밋마다 저장된 단지의 대시보드 스냅샷(latest_listings)도 한 번에 갱신
+
+    Args:
+        queue: 수집 버퍼
+        db: RealEstateDB (쓰기 연결)
+        group: 트랜잭션당 최대 배치 수
+
+    Returns:
+        dict: commits(트랜잭션 수), batches, rows, complexes(저장된 단지 번호),
+            recovered(이전 writer가 남긴 배치 수), dead(dead-letter로 보낸 배치 수)
+
+    Raises:
+        sqlite3.OperationalError: 잠금 등 일시적 오류 (꺼낸 배치는 버퍼 앞쪽에 되돌려짐)
+    """
+    # 꺼내기 전에 예약 표시를 지워야 drain 도중 들어온 배치도 다음 writer가 처리
+    queue.clear_flush()
+
+    # writer는 하나뿐이므로 처리 중 리스트에 남은 배치는 이전 writer가 커밋 전에 죽은 것
+    result = {'commits': 0, 'batches': 0, 'rows': 0, 'complexes': [], 'recovered': queue.requeue(), 'dead': 0}
+    while True:
+        batches = queue.pop(group)
+        if not batches:
+            break
+        try:
+            stats = db.save_price_batches([(complex_no, df) for complex_no, df, _ in batches])
+        except sqlite3.OperationalError:
+            queue.requeue()
+            raise
+        except Exception:
+            # 배치 하나가 그룹 전체를 실패시켰을 수 있으므로 하나씩 저장해 불량 배치만 격리
+            stats = _save_each(queue, db, batches, result)
+        else:
+            queue.ack([payload for _, _, payload in batches])
+        db.refresh_latest_listings(stats['complexes'])
+
+        result['commits'] += 1
+        result['batches'] += stats['batches']
+        result['rows'] += stats['rows']
+        result['complexes'].extend(stats['complexes'])
+
+    result['complexes'] = list(dict.fromkeys(result['complexes']))
+    return result
+
+
+def _save_each(queue: IngestQueue, db, batches: list, result: dict) -> dict:
+    """그룹 저장이 실패했을 때 배치를 하나씩 저장하고, 단독으로도 실패하는 배치는 dead-letter로 보냄"""
+    stats = {'batches': 0, 'rows': 0, 'complexes': []}
+    for complex_no, df, payload in batches:
+        try:
+            saved = db.save_price_batches([(complex_no, df)])
+        except sqlite3.OperationalError:
+            queue.requeue()
+            raise
+        except Exception as e:
+            print(f"⚠️ 단지 {complex_no} 배치 저장 실패 → dead-letter: {e}")
+            queue.dead_letter([payload])
+            result['dead'] += 1
+            continue
+        queue.ack([payload])
+        stats['batches'] += 1
+        stats['rows'] += saved['rows']
+        stats['complexes'].extend(saved['complexes'])
+    return stats
@@ -0,0 +1,91 @@
+"""
+SQLite 정기 유지보수
+대량 삭제(보존 기간 정리, 데이터베이스 초기화) 뒤 남는 빈 페이지와 오래된 통계를 정리
+
+- incremental_vacuum: 실행마다 최대 N페이지만 반환 (전체 VACUUM처럼 오래 잠그지 않음)
+- ANALYZE (analysis_limit로 표본 크기 제한) + PRAGMA optimize: 쿼리 플래너 통계 갱신
+- wal_checkpoint(TRUNCATE): WAL 파일 크기 정리
+"""
+
+import os
+import time
+
+from src.connection import DEFAULT_DB_PATH, connect
+
+
+# PRAGMA auto_vacuum 값 (0: NONE, 1: FULL, 2: INCREMENTAL)
+AUTO_VACUUM_INCREMENTAL = 2
+
+# 실행당 반환할 최대 빈 페이지 수 (기본 페이지 4KB → 약 40MB)
+VACUUM_PAGES = 10000
+
+# ANALYZE가 인덱스마다 읽을 대략적인 최대 행 수
+ANALYSIS_LIMIT = 1000
+
+
+def storage_stats(conn, db_path: str = DEFAULT_DB_PATH) -> dict:
+    """
+    DB 파일 크기와 페이지 사용 현황
+
+    Returns:
+        dict: file_bytes(DB + WAL), page_size, page_count, freelist_count
+    """
+    file_bytes = sum(
+        os.path.getsize(path) for path in (db_path, db_path + '-wal') if os.path.exists(path)
+    )
+    return {
+        'file_bytes': file_bytes,
+        'page_size': conn.execute('PRAGMA page_size').fetchone()[0],
+        'page_count': conn.execute('PRAGMA page_count').fetchone()[0],
+        'freelist_count': conn.execute('PRAGMA freelist_count').fetchone()[0],
+    }
+
+
+def run_maintenance(db_path: str = DEFAULT_DB_PATH, max_pages: int = VACUUM_PAGES,
+                    analysis_limit: int = ANALYSIS_LIMIT) -> dict:
+    """
+    빈 페이지 일부 반환 + 통계 갱신 + WAL 정리
+
+    auto_vacuum이 INCREMENTAL이 아닌 기존 DB는 처음 한 번만 전체 VACUUM으로 전환
+    (새 DB는 연결 시 INCREMENTAL로 생성됨)
+
+    Args:
+        db_path: SQLite 파일 경로
+        max_pages: 이번 실행에서 반환할 최대 빈 페이지 수
+        analysis_limit: ANALYZE 표본 크기 제한 (0이면 전체 스캔)
+
+    Returns:
+        dict: before/after(storage_stats), reclaimed_pages, converted(전체 VACUUM 여부), seconds
+    """
+    started = time.perf_counter()
+
+    with connect(db_path) as conn:
+        if conn.in_transaction:
+            conn.commit()
+        before = storage_stats(conn, db_path)
+
+        converted = conn.execute('PRAGMA auto_vacuum').fetchone()[0] != AUTO_VACUUM_INCREMENTAL
+        if converted:
+            # auto_vacuum 모드 변경은 VACUUM으로 파일을 다시 써야 적용됨 (최초 1회)
+            conn.execute(f'PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}')
+            conn.execute('VACUUM')
+        elif before['freelist_count']:
+            # 한 단계(step)에 한 페이지씩 반환하므로 끝까지 실행되는 executescript 사용
+            # (execute는 첫 단계만 실행 → 한 페이지만 반환됨)
+            conn.executescript(f'PRAGMA incremental_vacuum({int(max_pages)})')
+
+        conn.execute(f'PRAGMA analysis_limit = {int(analysis_limit)}')
+        conn.execute('ANALYZE')
+        conn.execute('PRAGMA optimize')
+        conn.commit()
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+        after = storage_stats(conn, db_path)
+
+    return {
+        'before': before,
+        'after': after,
+        'reclaimed_pages': before['page_count'] - after['page_count'],
+        'converted': converted,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
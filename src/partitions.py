@@ -0,0 +1,204 @@
+"""
+prices 월별 파티션 관리
+가격 변경 이력을 prices_YYYYMM 테이블로 나누고 prices 뷰(UNION ALL)로 통합 조회
+
+- 보존 기간 정리: 오래된 월 파티션을 DROP TABLE (행 단위 DELETE 없음)
+- 기간 한정 조회: 해당 기간의 파티션만 골라 쿼리 구성
+- 범주형 컬럼(면적타입, 거래유형, 층, 방향)은 price_codes 사전의 정수 코드로 저장하고
+  prices 뷰에서 문자열로 복원 (기존 쿼리 호환)
+"""
+
+import pandas as pd
+
+PARTITION_PREFIX = 'prices_'
+PARTITION_GLOB = PARTITION_PREFIX + '[0-9][0-9][0-9][0-9][0-9][0-9]'
+
+# 정수 코드로 저장하는 범주형 컬럼 (파티션 컬럼명: {field}_code)
+CODED_FIELDS = ('area_type', 'transaction_type', 'floor', 'direction')
+
+# prices 뷰 컬럼 순서
+PRICE_COLUMNS = (
+    'id', 'complex_no', 'listing_key', 'area_type', 'exclusive_area', 'transaction_type',
+    'price', 'deposit', 'floor', 'floor_number', 'direction',
+    'collected_at', 'collected_ts', 'collected_day',
+)
+
+_PARTITION_DDL = '''
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY,
+        complex_no TEXT,
+        listing_key TEXT,
+        area_type_code INTEGER,
+        exclusive_area REAL,
+        transaction_type_code INTEGER,
+        price BIGINT,
+        deposit BIGINT,
+        floor_code INTEGER,
+        floor_number INTEGER,
+        direction_code INTEGER,
+        collected_at TEXT,
+        collected_ts INTEGER,
+        collected_day INTEGER
+    )
+'''
+
+
+def partition_name(day_key: int) -> str:
+    """날짜 키(YYYYMMDD) → 파티션 테이블 이름 (prices_YYYYMM)"""
+    return f"{PARTITION_PREFIX}{day_key // 100}"
+
+
+def _month(name: str) -> int:
+    return int(name[len(PARTITION_PREFIX):])
+
+
+def list_partitions(conn, start_day: int = None, end_day: int = None) -> list:
+    """
+    파티션 테이블 목록 (오래된 월부터)
+
+    Args:
+        conn: sqlite3 연결
+        start_day: 이 날짜(YYYYMMDD)가 속한 월 이후만
+        end_day: 이 날짜(YYYYMMDD)가 속한 월 이전만
+
+    Returns:
+        list[str]: 파티션 테이블 이름
+    """
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+        (PARTITION_GLOB,)
+    ).fetchall()
+    names = sorted(row[0] for row in rows)
+
+    if start_day is not None:
+        names = [name for name in names if _month(name) >= start_day // 100]
+    if end_day is not None:
+        names = [name for name in names if _month(name) <= end_day // 100]
+    return names
+
+
+def decoded_sql(name: str) -> str:
+    """파티션 하나를 prices 뷰와 같은 컬럼(범주형은 문자열)으로 조회하는 SELECT"""
+    columns = []
+    joins = []
+    for column in PRICE_COLUMNS:
+        if column in CODED_FIELDS:
+            columns.append(f"c_{column}.value AS {column}")
+            joins.append(f"LEFT JOIN price_codes c_{column} ON c_{column}.code = p.{column}_code")
+        else:
+            columns.append(f"p.{column}")
+    return f"SELECT {', '.join(columns)} FROM {name} p {' '.join(joins)}"
+
+
+def rebuild_view(conn, partitions: list = None):
+    """prices 통합 뷰를 현재 파티션 목록으로 다시 생성"""
+    if partitions is None:
+        partitions = list_partitions(conn)
+
+    if partitions:
+        body = ' UNION ALL '.join(decoded_sql(name) for name in partitions)
+    else:
+        # 파티션이 없어도 컬럼 구성이 같은 빈 뷰 유지
+        body = 'SELECT ' + ', '.join(f"NULL AS {column}" for column in PRICE_COLUMNS) + ' WHERE 0'
+
+    conn.execute('DROP VIEW IF EXISTS prices')
+    conn.execute(f'CREATE VIEW prices AS {body}')
+
+
+def create_partition(conn, name: str):
+    """파티션 테이블 + 인덱스 생성 (뷰 갱신은 호출자가 담당)"""
+    conn.execute(_PARTITION_DDL.format(name=name))
+    # 당시 가격 조회 (매물 키, 수집시각)
+    conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{name}_listing_ts ON {name}(listing_key, collected_ts)')
+    # 최근 가격 변동 감지 (단지, 수집시각, 거래유형)
+    conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{name}_complex_ts ON {name}(complex_no, collected_ts, transaction_type_code)')
+
+
+def ensure_partition(conn, day_key: int) -> str:
+    """
+    날짜가 속한 월 파티션이 없으면 생성하고 뷰를 갱신
+
+    Args:
+        conn: sqlite3 연결 (쓰기 트랜잭션 안에서 호출)
+        day_key: 날짜 키 (YYYYMMDD)
+
+    Returns:
+        str: 파티션 테이블 이름
+    """
+    name = partition_name(day_key)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone()
+
+    if not exists:
+        create_partition(conn, name)
+        rebuild_view(conn)
+    return name
+
+
+def drop_partitions(conn, partitions: list) -> list:
+    """파티션 테이블 삭제 후 뷰 갱신"""
+    for name in partitions:
+        conn.execute(f'DROP TABLE IF EXISTS {name}')
+    if partitions:
+        rebuild_view(conn)
+    return partitions
+
+
+def expired_partitions(conn, day_key: int) -> list:
+    """날짜가 속한 월보다 이전 월의 파티션 목록 (보존 기간 정리 대상)"""
+    return [name for name in list_partitions(conn) if _month(name) < day_key // 100]
+
+
+def union_sql(partitions: list, select: str, where: str = '') -> str:
+    """
+    파티션별 SELECT를 UNION ALL로 연결 (조건은 각 파티션 쿼리에 직접 적용)
+
+    Args:
+        partitions: 파티션 테이블 이름 목록
+        select: SELECT 절 컬럼
+        where: 각 파티션에 적용할 WHERE 조건 (선택)
+    """
+    clause = f" WHERE {where}" if where else ''
+    return ' UNION ALL '.join(f"SELECT {select} FROM {name}{clause}" for name in partitions)
+
+
+def encode(conn, field: str, values: pd.Series) -> pd.Series:
+    """
+    범주형 값 → price_codes 정수 코드 (사전에 없는 값은 새 코드 등록)
+
+    Args:
+        conn: sqlite3 연결 (쓰기 트랜잭션 안에서 호출)
+        field: 컬럼 이름 (CODED_FIELDS 중 하나)
+        values: 값 Series (문자열로 저장, 결측값은 NULL 코드)
+
+    Returns:
+        Series: 정수 코드 (결측값은 None)
+    """
+    # 고유값만 문자열로 변환해 코드 조회 (행마다 결측 검사/변환하지 않음)
+    labels = {value: str(value) for value in values.dropna().unique().tolist()}
+    distinct = list(dict.fromkeys(labels.values()))
+    conn.executemany(
+        'INSERT OR IGNORE INTO price_codes (field, value) VALUES (?, ?)',
+        [(field, value) for value in distinct]
+    )
+
+    codes = {}
+    for start in range(0, len(distinct), 500):  # SQLite 바인딩 변수 개수 제한
+        chunk = distinct[start:start + 500]
+        placeholders = ', '.join('?' * len(chunk))
+        codes.update(conn.execute(
+            f'SELECT value, code FROM price_codes WHERE field = ? AND value IN ({placeholders})',
+            [field, *chunk]
+        ).fetchall())
+
+    mapping = {value: codes.get(label) for value, label in labels.items()}
+    return pd.Series([mapping.get(value) for value in values.tolist()], index=values.index, dtype=object)
+
+
+def lookup_code(conn, field: str, value):
+    """범주형 값의 정수 코드 조회 (사전에 없으면 None)"""
+    row = conn.execute(
+        'SELECT code FROM price_codes WHERE field = ? AND value = ?', (field, value)
+    ).fetchone()
+    return row[0] if row else None
@@ -0,0 +1,197 @@
+"""
+API 응답 디스크 캐시
+자주 바뀌지 않는 메타데이터(단지 개요, 지역 단지 목록) 응답을 SQLite 파일에 보관
+
+- URL + 쿼리 파라미터별로 저장, 엔드포인트마다 TTL(유효 시간) 지정
+- 유효 기간 안의 응답은 네트워크 요청 없이 반환 (매일 밤 수집 시 변경 없는 단지는 0회 왕복)
+- ETag / Last-Modified도 본문과 함께 저장: TTL이 지났거나 TTL이 없는 엔드포인트(매물 페이지)도
+  프로세스를 새로 띄운 뒤 조건부 요청으로 재검증 (변경 없으면 304 → 저장된 본문 재사용)
+- 전체 크기가 max_mb를 넘으면 가장 오래 안 쓴 응답부터 삭제 (LRU)
+- bypass: 캐시를 읽지 않고 새로 받아 덮어씀 (강제 갱신)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from src.config import CONFIG_PATH, load_section
+
+
+DEFAULT_SETTINGS = {
+    'enabled': True,
+    'path': 'data/http_cache.db',
+    'max_mb': 50,
+    'bypass': False,
+    # 엔드포인트 → TTL (초)
+    'ttl': {
+        'complex_overview': 7 * 24 * 3600,
+        'complex_list': 24 * 3600,
+    },
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+def load_settings(config_path: str = CONFIG_PATH) -> dict:
+    """config.yaml의 cache 설정 (없는 항목은 기본값, ttl은 엔드포인트별로 병합)"""
+    settings = load_section('cache', DEFAULT_SETTINGS, config_path)
+    settings['ttl'] = {**DEFAULT_SETTINGS['ttl'], **(settings.get('ttl') or {})}
+    return settings
+
+
+class ResponseCache:
+    """SQLite 기반 TTL + LRU 응답 캐시"""
+
+    def __init__(self, path: str = DEFAULT_SETTINGS['path'], max_mb: float = DEFAULT_SETTINGS['max_mb'],
+                 ttl: dict = None, bypass: bool = False):
+        """
+        Args:
+            path: 캐시 SQLite 파일 경로
+            max_mb: 최대 캐시 크기 (MB, 응답 본문 기준)
+            ttl: 엔드포인트 → TTL(초) (없는 엔드포인트는 캐시하지 않음)
+            bypass: True면 읽기 없이 항상 새로 받아 저장
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.ttl = dict(DEFAULT_SETTINGS['ttl'] if ttl is None else ttl)
+        self.bypass = bypass
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._add_validator_columns()
+
+    def _add_validator_columns(self):
+        """재검증 컬럼이 없는 이전 캐시 파일에 etag / last_modified 컬럼 추가"""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(responses)")}
+        with self.conn:
+            for column in ('etag', 'last_modified'):
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+
+    @classmethod
+    def from_config(cls, config_path: str = CONFIG_PATH) -> Optional['ResponseCache']:
+        """config.yaml 설정으로 생성 (cache.enabled가 false면 None)"""
+        settings = load_settings(config_path)
+        if not settings['enabled']:
+            return None
+        return cls(settings['path'], settings['max_mb'], settings['ttl'], settings['bypass'])
+
+    def get(self, endpoint: str, key: str):
+        """
+        유효한 캐시 응답 조회
+
+        Returns:
+            JSON 응답 (없거나 만료됐거나 bypass면 None)
+        """
+        if self.bypass or endpoint not in self.ttl:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.stats['hits'] += 1
+        return json.loads(row[0])
+
+    def validators(self, key: str) -> Optional[dict]:
+        """
+        조건부 요청용 재검증 정보 조회 (만료 여부와 무관)
+
+        Returns:
+            dict: etag, last_modified, data (재검증 정보가 없거나 bypass면 None)
+        """
+        if self.bypass:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, body FROM responses "
+                "WHERE key = ? AND (etag IS NOT NULL OR last_modified IS NOT NULL)", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'etag': row[0], 'last_modified': row[1], 'data': json.loads(row[2])}
+
+    def put(self, endpoint: str, key: str, data, etag: str = None, last_modified: str = None):
+        """
+        응답 저장 후 크기 초과분 LRU 삭제
+        TTL이 없는 엔드포인트는 재검증 정보(etag / last_modified)가 있을 때만 만료 상태로 저장
+        (get으로는 반환하지 않고 다음 요청의 조건부 재검증에만 사용)
+        """
+        ttl = self.ttl.get(endpoint) or 0
+        if not (ttl or etag or last_modified):
+            return
+        body = json.dumps(data, ensure_ascii=False)
+        size = len(body.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, body, size, expires_at, accessed_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint or '', body, size, now + ttl, now, etag, last_modified),
+            )
+            self.stats['stores'] += 1
+            self._evict()
+
+    def _evict(self):
+        """
+        재검증할 수 없는 만료 응답 삭제 후 max_bytes 이하가 될 때까지 오래 안 쓴 응답부터 삭제
+        (재검증 정보가 있는 만료 응답은 조건부 요청용으로 남겨 둠)
+        """
+        self.conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL AND last_modified IS NULL",
+            (time.time(),),
+        )
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        removed = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            removed.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", removed)
+        self.stats['evictions'] += len(removed)
+
+    def size_bytes(self) -> int:
+        """저장된 응답 본문 크기 합계"""
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """캐시 파일 연결 종료"""
+        self.conn.close()
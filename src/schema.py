@@ -0,0 +1,557 @@
+"""
+데이터베이스 스키마 버전 관리 및 마이그레이션
+DDL은 DB 파일당 한 번만 실행하고, 이후 연결 시에는 버전만 확인
+"""
+
+import sqlite3
+from datetime import datetime
+
+from src.partitions import (
+    create_partition, list_partitions, partition_name, rebuild_view, CODED_FIELDS, PRICE_COLUMNS
+)
+
+
+def _migrate_v1(conn):
+    """초기 스키마 (complexes, prices, users, watchlist, price_history)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS complexes (
+            complex_no TEXT PRIMARY KEY,
+            complex_name TEXT,
+            address TEXT,
+            total_households INTEGER,
+            build_year INTEGER,
+            total_area REAL,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS prices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            complex_no TEXT,
+            area_type TEXT,
+            exclusive_area REAL,
+            transaction_type TEXT,
+            price BIGINT,
+            deposit BIGINT,
+            floor TEXT,
+            floor_number INTEGER,
+            direction TEXT,
+            collected_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
+        )
+    ''')
+
+    # 사용자 테이블
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            plan TEXT DEFAULT 'free',
+            max_watchlist INTEGER DEFAULT 3,
+            email_notifications BOOLEAN DEFAULT 1,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # 관심 단지 테이블
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS watchlist (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            complex_no TEXT NOT NULL,
+            complex_name TEXT,
+            alert_price_drop REAL DEFAULT 5.0,
+            alert_gap_threshold BIGINT DEFAULT 50000000,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, complex_no),
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
+        )
+    ''')
+
+    # 가격 히스토리 테이블 (일별 요약)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS price_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            complex_no TEXT NOT NULL,
+            area_type TEXT NOT NULL,
+            record_date DATE NOT NULL,
+
+            -- 매매 통계
+            sale_min_price BIGINT,
+            sale_max_price BIGINT,
+            sale_avg_price BIGINT,
+            sale_count INTEGER DEFAULT 0,
+
+            -- 전세 통계
+            lease_min_price BIGINT,
+            lease_max_price BIGINT,
+            lease_avg_price BIGINT,
+            lease_count INTEGER DEFAULT 0,
+
+            -- 계산 지표
+            gap_investment BIGINT,
+            lease_ratio REAL,
+
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(complex_no, area_type, record_date),
+            FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
+        )
+    ''')
+
+    # 인덱스 생성
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_complex_no ON prices(complex_no)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_collected_at ON prices(collected_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_floor_number ON prices(floor_number)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_area_type ON prices(area_type)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_transaction_type ON prices(transaction_type)')
+
+    # price_history 인덱스
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_price_history_complex_no ON price_history(complex_no)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_price_history_date ON price_history(record_date)')
+
+
+def _migrate_v2(conn):
+    """저장 시점 가격 히스토리 갱신용 (단지, 수집시각) 복합 인덱스"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_complex_collected ON prices(complex_no, collected_at)')
+
+
+def _migrate_v3(conn):
+    """
+    정수 시간 키 추가 및 백필
+
+    - prices.collected_ts: 수집 시각 (Unix epoch 초)
+    - prices.collected_day: 수집 날짜 키 (YYYYMMDD 정수)
+    - price_history.record_day: 기록 날짜 키 (YYYYMMDD 정수)
+
+    DATE(collected_at) 같은 함수 호출 없이 인덱스 범위 검색이 가능하도록 함
+    """
+    conn.execute('ALTER TABLE prices ADD COLUMN collected_ts INTEGER')
+    conn.execute('ALTER TABLE prices ADD COLUMN collected_day INTEGER')
+    conn.execute('ALTER TABLE price_history ADD COLUMN record_day INTEGER')
+
+    # collected_at은 로컬 시각 ISO 문자열 → 'utc' 수식어로 epoch 변환
+    conn.execute('''
+        UPDATE prices SET
+            collected_ts = CAST(strftime('%s', collected_at, 'utc') AS INTEGER),
+            collected_day = CAST(strftime('%Y%m%d', collected_at) AS INTEGER)
+    ''')
+    conn.execute("UPDATE price_history SET record_day = CAST(strftime('%Y%m%d', record_date) AS INTEGER)")
+
+    conn.execute('DROP INDEX IF EXISTS idx_prices_complex_collected')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_complex_day ON prices(complex_no, collected_day)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_day ON prices(collected_day)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_ts ON prices(collected_ts)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_price_history_complex_day ON price_history(complex_no, record_day)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_price_history_day ON price_history(record_day)')
+
+
+def _migrate_v4(conn):
+    """
+    실제 쿼리 패턴 기반 인덱스 재구성 (EXPLAIN QUERY PLAN 점검 결과)
+
+    - 단일 컬럼/저선택도 인덱스 제거 (쓰기 비용만 증가)
+    - (단지, 면적, 거래유형) 면적 목록/대시보드 조회용
+    - (단지, 수집시각, 거래유형) 최근 가격/가격 변동 감지/단지별 삭제용
+    - (날짜, 단지, 면적, ...) 가격 히스토리 집계용 커버링 인덱스
+      (버킷 갱신과 날짜 단위 일괄 집계 모두 테이블 접근 없이 처리)
+    """
+    for index in (
+        'idx_prices_complex_no',          # 아래 복합 인덱스의 접두어로 대체
+        'idx_prices_collected_at',        # collected_ts 인덱스로 대체
+        'idx_prices_floor_number',        # 사용하는 쿼리 없음
+        'idx_prices_area_type',           # 저선택도
+        'idx_prices_transaction_type',    # 저선택도 (SALE/LEASE)
+        'idx_prices_complex_day',         # idx_prices_day_cover로 대체
+        'idx_prices_day',                 # idx_prices_day_cover로 대체
+        'idx_price_history_complex_no',   # idx_price_history_complex_day 접두어로 대체
+        'idx_price_history_date',         # record_day 인덱스로 대체
+    ):
+        conn.execute(f'DROP INDEX IF EXISTS {index}')
+
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prices_complex_area_type
+        ON prices(complex_no, area_type, transaction_type)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prices_complex_ts
+        ON prices(complex_no, collected_ts, transaction_type)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prices_day_cover
+        ON prices(collected_day, complex_no, area_type, transaction_type, price, deposit)
+    ''')
+
+
+# 매물 식별 키: 단지|거래유형|면적타입|전용면적|층|방향#순번
+# (속성이 모두 같은 매물은 한 수집 배치 안에서 가격, 보증금 순으로 순번 부여)
+# src.database._listing_keys의 매물번호가 없을 때 형식과 같아야 함
+# (기존 행에는 매물번호가 저장되어 있지 않으므로 백필은 항상 이 형식)
+_LISTING_IDENTITY_SQL = '''
+    COALESCE(complex_no, '') || '|' || COALESCE(transaction_type, '') || '|' ||
+    COALESCE(area_type, '') || '|' || printf('%.2f', COALESCE(exclusive_area, 0)) || '|' ||
+    COALESCE(floor, '') || '|' || COALESCE(direction, '')
+'''
+
+
+def _migrate_v5(conn):
+    """
+    매물 식별(스냅샷-델타) 모델
+
+    - listings: 매물별 1행 (식별 키, 현재 가격, first_seen/last_seen, 가격 변경일)
+    - prices: 매물이 처음 보였거나 가격이 바뀐 시점만 기록하는 변경 이력
+      (listing_key 컬럼 추가, 기존 행은 키를 백필한 뒤 직전과 가격이 같은 행 제거)
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS listings (
+            listing_key TEXT PRIMARY KEY,
+            complex_no TEXT NOT NULL,
+            area_type TEXT,
+            exclusive_area REAL,
+            transaction_type TEXT,
+            price BIGINT,
+            deposit BIGINT,
+            floor TEXT,
+            floor_number INTEGER,
+            direction TEXT,
+            first_seen_ts INTEGER,
+            first_seen_day INTEGER,
+            last_seen_ts INTEGER,
+            last_seen_day INTEGER,
+            price_changed_day INTEGER,
+            FOREIGN KEY (complex_no) REFERENCES complexes (complex_no)
+        )
+    ''')
+    conn.execute('ALTER TABLE prices ADD COLUMN listing_key TEXT')
+
+    # 기존 수집 배치(collected_at 단위)마다 식별 키 + 순번 부여
+    conn.execute(f'''
+        UPDATE prices SET listing_key = keyed.listing_key
+        FROM (
+            SELECT
+                id,
+                {_LISTING_IDENTITY_SQL} || '#' || (ROW_NUMBER() OVER (
+                    PARTITION BY complex_no, transaction_type, area_type,
+                                 printf('%.2f', COALESCE(exclusive_area, 0)), floor, direction, collected_at
+                    ORDER BY price, deposit, id
+                ) - 1) AS listing_key
+            FROM prices
+        ) AS keyed
+        WHERE prices.id = keyed.id
+    ''')
+
+    # 매물별 최신 상태 + 최초/최종 관측 시각
+    conn.execute('''
+        INSERT OR REPLACE INTO listings
+        (listing_key, complex_no, area_type, exclusive_area, transaction_type,
+         price, deposit, floor, floor_number, direction,
+         first_seen_ts, first_seen_day, last_seen_ts, last_seen_day, price_changed_day)
+        SELECT
+            listing_key, complex_no, area_type, exclusive_area, transaction_type,
+            price, deposit, floor, floor_number, direction,
+            first_seen_ts, first_seen_day, last_seen_ts, last_seen_day, NULL
+        FROM (
+            SELECT
+                p.*,
+                ROW_NUMBER() OVER (PARTITION BY listing_key ORDER BY collected_ts DESC, id DESC) AS recency,
+                MIN(collected_ts) OVER (PARTITION BY listing_key) AS first_seen_ts,
+                MIN(collected_day) OVER (PARTITION BY listing_key) AS first_seen_day
+            FROM prices p
+        ) AS latest
+        JOIN (
+            SELECT listing_key AS seen_key, MAX(collected_ts) AS last_seen_ts, MAX(collected_day) AS last_seen_day
+            FROM prices GROUP BY listing_key
+        ) AS seen ON seen.seen_key = latest.listing_key
+        WHERE recency = 1
+    ''')
+
+    # 직전 관측과 가격/보증금이 같은 행 제거 → 변경 이력만 남김
+    conn.execute('''
+        DELETE FROM prices WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id, price, deposit,
+                    LAG(price) OVER w AS prev_price,
+                    LAG(deposit) OVER w AS prev_deposit,
+                    ROW_NUMBER() OVER w AS seq
+                FROM prices
+                WINDOW w AS (PARTITION BY listing_key ORDER BY collected_ts, id)
+            )
+            WHERE seq > 1 AND price IS prev_price AND deposit IS prev_deposit
+        )
+    ''')
+
+    conn.execute('''
+        UPDATE listings SET price_changed_day = (
+            SELECT MAX(collected_day) FROM prices WHERE prices.listing_key = listings.listing_key
+        )
+    ''')
+
+    # 집계/조회는 listings 기준으로 이동 → prices의 집계·목록용 인덱스 제거
+    conn.execute('DROP INDEX IF EXISTS idx_prices_day_cover')
+    conn.execute('DROP INDEX IF EXISTS idx_prices_complex_area_type')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_prices_listing_ts ON prices(listing_key, collected_ts)')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_listings_complex_area
+        ON listings(complex_no, area_type, last_seen_day)
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_listings_last_seen ON listings(last_seen_day)')
+
+
+# v6 시점의 파티션 형식 (범주형 컬럼을 문자열로 저장) - v8에서 코드 컬럼으로 변환
+_V6_PARTITION_DDL = '''
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY,
+        complex_no TEXT,
+        listing_key TEXT,
+        area_type TEXT,
+        exclusive_area REAL,
+        transaction_type TEXT,
+        price BIGINT,
+        deposit BIGINT,
+        floor TEXT,
+        floor_number INTEGER,
+        direction TEXT,
+        collected_at TEXT,
+        collected_ts INTEGER,
+        collected_day INTEGER
+    )
+'''
+
+
+def _migrate_v6(conn):
+    """
+    prices 테이블을 월별 파티션(prices_YYYYMM) + 통합 뷰(prices)로 전환
+
+    보존 기간 정리는 파티션 DROP으로, 기간 조회는 해당 월 파티션만 읽도록 함
+    """
+    columns = ', '.join(PRICE_COLUMNS)
+    months = [
+        row[0] for row in
+        conn.execute('SELECT DISTINCT collected_day / 100 FROM prices WHERE collected_day IS NOT NULL')
+    ]
+
+    partitions = []
+    for month in sorted(months):
+        name = partition_name(month * 100 + 1)
+        conn.execute(_V6_PARTITION_DDL.format(name=name))
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{name}_listing_ts ON {name}(listing_key, collected_ts)')
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{name}_complex_ts ON {name}(complex_no, collected_ts, transaction_type)')
+        conn.execute(
+            f'INSERT INTO {name} ({columns}) SELECT {columns} FROM prices WHERE collected_day / 100 = ?',
+            (month,)
+        )
+        partitions.append(name)
+
+    conn.execute('DROP TABLE prices')
+
+    if partitions:
+        body = ' UNION ALL '.join(f"SELECT {columns} FROM {name}" for name in partitions)
+    else:
+        body = 'SELECT ' + ', '.join(f"NULL AS {column}" for column in PRICE_COLUMNS) + ' WHERE 0'
+    conn.execute(f'CREATE VIEW prices AS {body}')
+
+
+# latest_listings 정의 (구체화 뷰): 단지·거래유형별 마지막 수집일에 관측된 매물
+# {where}: listings(l) 조건 (단지 단위 부분 재구성용, 없으면 '1')
+LATEST_LISTINGS_SQL = '''
+    INSERT INTO latest_listings
+    (listing_key, complex_no, complex_name, address, total_households, build_year,
+     area_type, exclusive_area, transaction_type, sale_eok, lease_eok,
+     floor, floor_number, direction, type_label, collected_at, last_seen_day)
+    SELECT
+        l.listing_key,
+        l.complex_no,
+        c.complex_name,
+        c.address,
+        c.total_households,
+        c.build_year,
+        l.area_type,
+        l.exclusive_area,
+        l.transaction_type,
+        CASE WHEN l.transaction_type = 'SALE' THEN ROUND(l.price / 10000.0, 2) ELSE 0 END,
+        CASE WHEN l.transaction_type = 'LEASE' THEN ROUND(l.deposit / 10000.0, 2) ELSE 0 END,
+        l.floor,
+        l.floor_number,
+        l.direction,
+        CASE l.transaction_type WHEN 'SALE' THEN '매매' WHEN 'LEASE' THEN '전세' ELSE '기타' END,
+        datetime(l.last_seen_ts, 'unixepoch', 'localtime'),
+        l.last_seen_day
+    FROM listings l
+    JOIN complexes c ON l.complex_no = c.complex_no
+    JOIN (
+        SELECT complex_no, transaction_type, MAX(last_seen_day) AS last_day
+        FROM listings l
+        WHERE {where}
+        GROUP BY complex_no, transaction_type
+    ) AS crawl
+      ON crawl.complex_no = l.complex_no
+     AND crawl.transaction_type = l.transaction_type
+     AND crawl.last_day = l.last_seen_day
+    WHERE {where}
+'''
+
+
+def _migrate_v7(conn):
+    """
+    대시보드용 현재 매물 스냅샷 테이블 (latest_listings)
+
+    단지 정보 JOIN, 억 단위 변환, 타입 라벨을 미리 계산해 두고
+    수집/가져오기가 끝날 때마다 RealEstateDB.refresh_latest_listings로 재구성
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS latest_listings (
+            listing_key TEXT PRIMARY KEY,
+            complex_no TEXT NOT NULL,
+            complex_name TEXT,
+            address TEXT,
+            total_households INTEGER,
+            build_year INTEGER,
+            area_type TEXT,
+            exclusive_area REAL,
+            transaction_type TEXT,
+            sale_eok REAL,
+            lease_eok REAL,
+            floor TEXT,
+            floor_number INTEGER,
+            direction TEXT,
+            type_label TEXT,
+            collected_at TEXT,
+            last_seen_day INTEGER
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_latest_listings_complex ON latest_listings(complex_no)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_latest_listings_day ON latest_listings(last_seen_day)')
+    # 대시보드 정렬 순서 (단지명, 면적, 거래유형)
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_latest_listings_order
+        ON latest_listings(complex_name, area_type, transaction_type)
+    ''')
+    conn.execute(LATEST_LISTINGS_SQL.format(where='1'))
+
+
+def _migrate_v8(conn):
+    """
+    prices 파티션의 범주형 컬럼을 사전 코드로 변환
+
+    - price_codes: (컬럼, 값) → 작은 정수 코드 사전
+    - 파티션: area_type, transaction_type, floor, direction → *_code INTEGER
+    - prices 뷰가 코드를 문자열로 복원하므로 뷰를 읽는 기존 쿼리는 그대로 동작
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS price_codes (
+            code INTEGER PRIMARY KEY,
+            field TEXT NOT NULL,
+            value TEXT NOT NULL,
+            UNIQUE (field, value)
+        )
+    ''')
+
+    partitions = list_partitions(conn)
+    conn.execute('DROP VIEW IF EXISTS prices')
+
+    plain = [column for column in PRICE_COLUMNS if column not in CODED_FIELDS]
+    for name in partitions:
+        for field in CODED_FIELDS:
+            conn.execute(
+                f'INSERT OR IGNORE INTO price_codes (field, value) '
+                f'SELECT DISTINCT ?, {field} FROM {name} WHERE {field} IS NOT NULL',
+                (field,)
+            )
+
+        legacy = f'{name}_text'
+        conn.execute(f'DROP INDEX IF EXISTS idx_{name}_listing_ts')
+        conn.execute(f'DROP INDEX IF EXISTS idx_{name}_complex_ts')
+        conn.execute(f'ALTER TABLE {name} RENAME TO {legacy}')
+        create_partition(conn, name)
+
+        codes = [
+            f"(SELECT code FROM price_codes WHERE field = '{field}' AND value = p.{field})"
+            for field in CODED_FIELDS
+        ]
+        conn.execute(f'''
+            INSERT INTO {name} ({', '.join(plain + [f'{field}_code' for field in CODED_FIELDS])})
+            SELECT {', '.join([f'p.{column}' for column in plain] + codes)}
+            FROM {legacy} p
+        ''')
+        conn.execute(f'DROP TABLE {legacy}')
+
+    rebuild_view(conn, partitions)
+
+
+# (버전, 설명, 마이그레이션 함수) - 버전 순서대로 추가만 할 것
+MIGRATIONS = [
+    (1, '초기 스키마', _migrate_v1),
+    (2, '가격 히스토리 버킷 갱신용 인덱스', _migrate_v2),
+    (3, '정수 시간 키 (collected_ts, collected_day, record_day)', _migrate_v3),
+    (4, '쿼리 패턴 기반 복합/커버링 인덱스 재구성', _migrate_v4),
+    (5, '매물 식별 모델 (listings + 가격 변경 이력)', _migrate_v5),
+    (6, 'prices 월별 파티션 + 통합 뷰', _migrate_v6),
+    (7, '대시보드용 현재 매물 스냅샷 (latest_listings)', _migrate_v7),
+    (8, '가격 변경 이력 범주형 컬럼 사전 코드화 (price_codes)', _migrate_v8),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    """현재 DB 파일의 스키마 버전 조회 (버전 테이블이 없으면 0)"""
+    try:
+        row = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
+
+
+def ensure_schema(conn) -> int:
+    """
+    스키마를 최신 버전으로 맞춤
+
+    최신 버전이면 버전 조회 쿼리 한 번으로 끝나고,
+    미적용 마이그레이션이 있을 때만 DDL을 실행
+
+    Args:
+        conn: sqlite3 연결
+
+    Returns:
+        int: 적용 후 스키마 버전
+    """
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return SCHEMA_VERSION
+
+    if conn.in_transaction:
+        conn.commit()
+
+    # 다른 프로세스와 동시에 마이그레이션하지 않도록 쓰기 잠금 후 버전 재확인
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TEXT
+            )
+        ''')
+        current = get_schema_version(conn)
+
+        for version, description, migrate in MIGRATIONS:
+            if version <= current:
+                continue
+            migrate(conn)
+            conn.execute(
+                'INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                (version, description, datetime.now().isoformat())
+            )
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    if current < SCHEMA_VERSION:
+        print(f"✓ 스키마 마이그레이션 완료: v{current} → v{SCHEMA_VERSION}")
+
+    return SCHEMA_VERSION
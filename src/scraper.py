@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import random
 
+from src.http_client import get_client
+
 
 # 네이버 API 기본 설정
 BASE_URL = "https://new.land.naver.com/api"
@@ -42,28 +44,96 @@ def parse_floor_number(floor_info: str) -> int:
     return 0
 
 
-def scrape_complex_overview(complex_no: str) -> Dict:
+def parse_overview(data: Dict, complex_no: str) -> Dict:
+    """단지 개요 API 응답 → 단지 정보 dict"""
+    return {
+        'complex_no': complex_no,
+        'complex_name': data.get('complexName', ''),
+        'address': f"{data.get('cortarAddress', '')} {data.get('dealAddress', '')}".strip(),
+        'households': data.get('totalHouseholdCount', 0),
+        'build_year': int(data.get('useApproveYmd', '2010')[:4]),  # YYYYMMDD 형식
+    }
+
+
+def parse_articles(articles: List[Dict], transaction_type: str) -> List[Dict]:
+    """
+    매물 API 응답(articleList) → 매물 목록 (59m²/84m² ±3m², 4층 이상만)
+
+    Args:
+        articles: API 응답의 articleList
+        transaction_type: 'SALE' 또는 'LEASE'
+    """
+    listings = []
+    for article in articles:
+        # 면적 확인
+        area = float(article.get('area', 0))
+        
+        # 59m² 또는 84m² 필터링 (±3m²)
+        if not (56 <= area <= 62 or 81 <= area <= 87):
+            continue
+        
+        # 층수 확인
+        floor_info = article.get('floorInfo', '')
+        floor_num = parse_floor_number(floor_info)
+        
+        # 4층 이상만
+        if floor_num < 4:
+            continue
+        
+        # 가격
+        price = parse_price_number(article.get('dealOrWarrantPrc', 0))
+        
+        # 면적타입
+        area_type = "59A" if area < 70 else "84A"
+        
+        listings.append({
+            '면적타입': area_type,
+            '전용면적': area,
+            '거래유형': transaction_type,
+            '층': floor_info,
+            '층수': floor_num,
+            '방향': article.get('direction', ''),
+            '가격': price if transaction_type == 'SALE' else 0,
+            '보증금': price if transaction_type == 'LEASE' else 0,
+            '매물번호': article.get('articleNo'),
+        })
+    
+    return listings
+
+
+def articles_params(complex_no: str, trade_type: str, page: int) -> Dict:
+    """매물 리스트 API 요청 파라미터"""
+    return {
+        'realEstateType': 'APT',
+        'tradeType': trade_type,
+        'priceType': 'RETAIL',
+        'page': page,
+        'complexNo': complex_no,
+        'type': 'list',
+        'order': 'rank'
+    }
+
+
+def scrape_complex_overview(complex_no: str, refresh: bool = False) -> Dict:
     """
-    단지 개요 정보 조회
+    단지 개요 정보 조회 (디스크 캐시 TTL 안에서는 요청 없이 반환)
     API: /api/complexes/overview/{complex_no}
+    
+    Args:
+        complex_no: 단지번호
+        refresh: True면 캐시를 건너뛰고 새로 조회
     """
     url = f"{BASE_URL}/complexes/overview/{complex_no}"
     params = {'complexNo': complex_no}
+    client = get_client()
     
     try:
-        time.sleep(random.uniform(0.5, 1.5))  # Rate limiting
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        return {
-            'complex_no': complex_no,
-            'complex_name': data.get('complexName', ''),
-            'address': f"{data.get('cortarAddress', '')} {data.get('dealAddress', '')}".strip(),
-            'households': data.get('totalHouseholdCount', 0),
-            'build_year': int(data.get('useApproveYmd', '2010')[:4]),  # YYYYMMDD 형식
-        }
+        data = None if refresh else client.cached_json('complex_overview', url, params)
+        if data is None:
+            time.sleep(random.uniform(0.5, 1.5))  # Rate limiting
+            data = client.get_json(url, params=params, headers=HEADERS, timeout=10,
+                                   endpoint='complex_overview', refresh=True)
+        return parse_overview(data, complex_no)
     
     except Exception as e:
         print(f"  ⚠ 단지 정보 조회 실패 ({complex_no}): {e}")
@@ -91,63 +161,19 @@ def scrape_articles(complex_no: str, trade_type: str = 'A1', max_pages: int = 3)
     
     for page in range(1, max_pages + 1):
         url = f"{BASE_URL}/articles/complex/{complex_no}"
-        params = {
-            'realEstateType': 'APT',
-            'tradeType': trade_type,
-            'priceType': 'RETAIL',
-            'page': page,
-            'complexNo': complex_no,
-            'type': 'list',
-            'order': 'rank'
-        }
+        params = articles_params(complex_no, trade_type, page)
         
         while retry_count < max_retries:
             try:
                 wait_time = base_wait * (2 ** retry_count)  # 지수 백오프
                 time.sleep(random.uniform(wait_time - 0.5, wait_time + 0.5))  # Rate limiting
-                response = requests.get(url, params=params, headers=HEADERS, timeout=10)
-                response.raise_for_status()
-                
-                data = response.json()
+                data = get_client().get_json(url, params=params, headers=HEADERS, timeout=10)
                 articles = data.get('articleList', [])
                 
                 if not articles:
                     break  # 더 이상 데이터 없음
                 
-                for article in articles:
-                    # 면적 확인
-                    area = float(article.get('area', 0))
-                    
-                    # 59m² 또는 84m² 필터링 (±3m²)
-                    if not (56 <= area <= 62 or 81 <= area <= 87):
-                        continue
-                    
-                    # 층수 확인
-                    floor_info = article.get('floorInfo', '')
-                    floor_num = parse_floor_number(floor_info)
-                    
-                    # 4층 이상만
-                    if floor_num < 4:
-                        continue
-                    
-                    # 가격
-                    price = parse_price_number(article.get('dealOrWarrantPrc', 0))
-                    
-                    # 면적타입
-                    area_type = "59A" if area < 70 else "84A"
-                    
-                    listing = {
-                        '면적타입': area_type,
-                        '전용면적': area,
-                        '거래유형': transaction_type,
-                        '층': floor_info,
-                        '층수': floor_num,
-                        '방향': article.get('direction', ''),
-                        '가격': price if transaction_type == 'SALE' else 0,
-                        '보증금': price if transaction_type == 'LEASE' else 0,
-                    }
-                    
-                    all_listings.append(listing)
+                all_listings.extend(parse_articles(articles, transaction_type))
                 
                 retry_count = 0  # 성공 시 리트라이 카운트 리셋
                 break  # 루프 탈출
@@ -175,17 +201,21 @@ def scrape_articles(complex_no: str, trade_type: str = 'A1', max_pages: int = 3)
     return all_listings
 
 
-def scrape_complex_full_data(complex_no: str) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
+def scrape_complex_full_data(complex_no: str, refresh: bool = False) -> Tuple[Dict, pd.DataFrame, pd.DataFrame]:
     """
     단지의 전체 데이터 수집 (정보 + 매매 + 전세)
     
+    Args:
+        complex_no: 단지번호
+        refresh: True면 단지 정보를 캐시 없이 새로 조회
+    
     Returns:
         (complex_info, sale_df, lease_df)
     """
     print(f"\n[{complex_no}] 데이터 수집 중...")
     
     # 1. 단지 정보
-    complex_info = scrape_complex_overview(complex_no)
+    complex_info = scrape_complex_overview(complex_no, refresh=refresh)
     if complex_info:
         print(f"  ✓ {complex_info.get('complex_name', 'Unknown')}")
     
@@ -232,6 +262,7 @@ def test_api_scraping():
     print(f"\n전세 {len(lease)}개:")
     if not lease.empty:
         print(lease[['면적타입', '전용면적', '층수', '보증금']].head(10))
+    print(f"\n{get_client().summary()}")
 
 
 if __name__ == "__main__":
@@ -205,6 +205,1831 @@ def test_database():
         return False
 
 
+def test_price_history():
+    """가격 히스토리 (저장 시점 집계) 테스트"""
+    print("\n" + "="*60)
+    print("📈 [TEST] database.py - 가격 히스토리 집계")
+    print("="*60)
+    
+    try:
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_history.db"))
+            
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 130000, '보증금': 0, '층': '7층', '층수': 7, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'LEASE', '가격': 0, '보증금': 90000, '층': '8층', '층수': 8, '방향': '남향'},
+                {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'SALE', '가격': 170000, '보증금': 0, '층': '6층', '층수': 6, '방향': '동향'},
+            ])
+            
+            # 1. 저장 즉시 버킷 생성
+            print("\n✓ 저장 시점 집계 테스트:")
+            db.save_prices(price_df, '12345')
+            history = db.get_price_history('12345', '59A')
+            row = history.iloc[0]
+            print(f"  59A: 매매 {row['sale_count']}건 평균 {row['sale_avg_price']}, 전세 {row['lease_count']}건 {row['lease_avg_price']}")
+            print(f"  갭: {row['gap_investment']}, 전세가율: {row['lease_ratio']}")
+            assert len(db.get_price_history('12345')) == 2
+            assert row['sale_count'] == 2 and row['sale_avg_price'] == 125000
+            assert row['lease_avg_price'] == 90000 and row['gap_investment'] == 30000
+            assert row['lease_ratio'] == 72.0
+            
+            # 2. 같은 날 추가 저장 → 영향받은 버킷만 갱신 (같은 매물은 중복 집계하지 않음)
+            print("\n✓ 추가 배치 갱신 테스트:")
+            db.save_prices(price_df.iloc[[0]], '12345')
+            new_listing = price_df.iloc[[0]].assign(층='12층', 층수=12)
+            db.save_prices(new_listing, '12345')
+            history = db.get_price_history('12345')
+            counts = dict(zip(history['area_type'], history['sale_count']))
+            print(f"  면적별 매매 건수: {counts}")
+            assert counts == {'59A': 3, '84A': 1}
+            
+            # 3. 날짜 단위 일괄 집계 (모든 단지)
+            print("\n✓ summarize_day() 일괄 집계 테스트:")
+            db.save_prices(price_df, '67890')
+            db.conn.execute("DELETE FROM price_history")
+            db.conn.commit()
+            row_count = db.summarize_day()
+            print(f"  집계된 행: {row_count}개 (2개 단지 × 2개 면적)")
+            assert row_count == 4
+            assert db.get_price_history('67890', '59A').iloc[0]['sale_count'] == 2
+            
+            # 4. 여러 단지 가격 변동 순위 (윈도 함수 쿼리 한 번)
+            print("\n✓ get_price_change_ranking() 테스트:")
+            from datetime import datetime, timedelta
+            start = (datetime.now() - timedelta(days=20)).strftime('%Y-%m-%d')
+            db.conn.executemany("""
+                INSERT OR REPLACE INTO price_history
+                (complex_no, area_type, record_date, record_day, sale_avg_price, lease_avg_price, gap_investment)
+                VALUES (?, ?, ?, CAST(strftime('%Y%m%d', ?) AS INTEGER), ?, ?, ?)
+            """, [
+                ('12345', '59A', start, start, 100000, 80000, 20000),
+                ('12345', '84A', start, start, 200000, None, None),
+                ('67890', '59A', start, start, 100000, 80000, 25000),
+                ('67890', '84A', start, start, 150000, None, None),
+            ])
+            db.conn.commit()
+            ranking = db.get_price_change_ranking(top_k=1)
+            risers, fallers, gaps = ranking['risers'], ranking['fallers'], ranking['gap_changes']
+            print(f"  상승: {risers[['complex_no', 'area_type', 'sale_change_pct']].values.tolist()}")
+            print(f"  하락: {fallers[['complex_no', 'area_type', 'sale_change_pct']].values.tolist()}")
+            print(f"  갭 변동: {gaps[['complex_no', 'area_type', 'gap_change']].values.tolist()}")
+            assert risers[['complex_no', 'area_type', 'sale_change_pct']].values.tolist() == [['67890', '59A', 25.0]]
+            assert fallers[['complex_no', 'area_type', 'sale_change_pct']].values.tolist() == [['12345', '84A', -15.0]]
+            assert gaps[['complex_no', 'area_type', 'gap_change']].values.tolist() == [['12345', '59A', 10000]]
+            assert len(db.get_price_change_ranking(top_k=10)['risers']) == 3
+            assert db.get_price_change_ranking(complex_nos=['12345'])['risers']['complex_no'].tolist() == ['12345']
+            
+            db.close()
+        
+        print("\n✅ 가격 히스토리 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_snapshot_delta():
+    """매물 식별 키 기반 스냅샷-델타 저장 테스트"""
+    print("\n" + "="*60)
+    print("🧮 [TEST] database.py - 스냅샷-델타 저장")
+    print("="*60)
+    
+    try:
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_delta.db"))
+            
+            # 속성이 같은 매물 2개 포함 (순번으로 구분)
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '고층', '층수': 15, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 125000, '보증금': 0, '층': '고층', '층수': 15, '방향': '남향'},
+                {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'LEASE', '가격': 0, '보증금': 90000, '층': '8층', '층수': 8, '방향': '남향'},
+            ])
+            
+            def count(table):
+                return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            
+            # 1. 최초 수집 → 모두 신규
+            print("\n✓ 최초 수집 테스트:")
+            stats = db.save_prices(price_df, '12345')
+            print(f"  {stats['new']}개 신규, listings {count('listings')}행, prices {count('prices')}행")
+            assert stats['new'] == 3 and count('listings') == 3 and count('prices') == 3
+            
+            # 2. 변동 없는 재수집 → last_seen만 갱신
+            print("\n✓ 변동 없는 재수집 테스트:")
+            db.conn.execute("UPDATE listings SET last_seen_ts = last_seen_ts - 3600")
+            db.conn.commit()
+            stats = db.save_prices(price_df, '12345')
+            stale = db.conn.execute(
+                "SELECT COUNT(*) FROM listings WHERE last_seen_ts < first_seen_ts"
+            ).fetchone()[0]
+            print(f"  유지 {stats['unchanged']}개, prices {count('prices')}행, last_seen 미갱신 {stale}개")
+            assert stats['unchanged'] == 3 and count('prices') == 3 and stale == 0
+            
+            # 3. 가격 변경 → 변경 이력 1행 추가
+            print("\n✓ 가격 변경 테스트:")
+            changed_df = price_df.copy()
+            changed_df.loc[2, '보증금'] = 95000
+            stats = db.save_prices(changed_df, '12345')
+            lease = db.conn.execute(
+                "SELECT deposit FROM listings WHERE transaction_type = 'LEASE'"
+            ).fetchone()[0]
+            print(f"  변경 {stats['changed']}개, prices {count('prices')}행, 현재 보증금 {lease}")
+            assert stats['changed'] == 1 and count('prices') == 4 and lease == 95000
+            assert db.get_price_history('12345', '84A').iloc[0]['lease_avg_price'] == 95000
+            
+            # 4. 여러 단지 배치 그룹 커밋 → 한 트랜잭션에서 배치 순서대로 반영
+            print("\n✓ 그룹 커밋 테스트:")
+            other_df = price_df.iloc[:1].copy()
+            stats = db.save_price_batches([
+                ('67890', other_df),
+                ('12345', price_df),
+                ('67890', other_df.assign(가격=118000)),
+                ('99999', pd.DataFrame()),
+            ])
+            other = db.conn.execute(
+                "SELECT price FROM listings WHERE complex_no = '67890'"
+            ).fetchone()[0]
+            print(f"  {stats['batches']}개 배치, 단지 {stats['complexes']}, 신규 {stats['new']} 변경 {stats['changed']}, 현재 가격 {other}")
+            assert stats['batches'] == 3 and stats['complexes'] == ['67890', '12345']
+            assert (stats['new'], stats['changed'], stats['unchanged']) == (1, 2, 2) and other == 118000
+            
+            # 5. 매물번호가 있으면 그것이 식별 키 → 속성이 같은 매물끼리 가격 순서가 바뀌어도 변경 1건
+            print("\n✓ 매물번호 식별 키 테스트:")
+            same = {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'SALE', '보증금': 0, '층': '고/15', '층수': 15, '방향': '남향'}
+            keyed_df = pd.DataFrame([{**same, '가격': 100000, '매물번호': 'A1'}, {**same, '가격': 120000, '매물번호': 'A2'}])
+            db.save_prices(keyed_df, '55555')
+            keyed_df.loc[0, '가격'] = 130000
+            stats = db.save_prices(keyed_df, '55555')
+            keys = [row[0] for row in db.conn.execute(
+                "SELECT listing_key FROM listings WHERE complex_no = '55555' ORDER BY listing_key"
+            )]
+            print(f"  변경 {stats['changed']}개, 유지 {stats['unchanged']}개, 키 {keys}")
+            assert (stats['new'], stats['changed'], stats['unchanged']) == (0, 1, 1)
+            assert keys == ['55555|SALE|A1', '55555|SALE|A2']
+
+            # 6. 같은 매물번호가 배치에 두 번 → 마지막 행만 반영 (키 중복으로 배치 전체가 실패하지 않음)
+            print("\n✓ 매물번호 중복 배치 테스트:")
+            duplicated_df = pd.DataFrame([{**same, '가격': 140000, '매물번호': 'A1'}, {**same, '가격': 150000, '매물번호': 'A1'}])
+            stats = db.save_prices(duplicated_df, '55555')
+            price = db.conn.execute(
+                "SELECT price FROM listings WHERE listing_key = '55555|SALE|A1'"
+            ).fetchone()[0]
+            print(f"  {stats['rows']}개 반영, 변경 {stats['changed']}개, 현재 가격 {price}")
+            assert stats['rows'] == 1 and stats['changed'] == 1 and price == 150000
+
+            # 7. 숫자 매물번호에 결측값이 섞여 float가 되어도 같은 키 ('2412345.0'이 아닌 '2412345')
+            print("\n✓ 숫자 매물번호 키 테스트:")
+            db.save_prices(pd.DataFrame([{**same, '가격': 100000, '매물번호': 2412345}]), '77777')
+            mixed_df = pd.DataFrame([{**same, '가격': 100000, '매물번호': 2412345}, {**same, '가격': 90000, '매물번호': None}])
+            stats = db.save_prices(mixed_df, '77777')
+            keys = [row[0] for row in db.conn.execute(
+                "SELECT listing_key FROM listings WHERE complex_no = '77777' ORDER BY listing_key"
+            )]
+            print(f"  매물번호 컬럼 {mixed_df['매물번호'].dtype}, 신규 {stats['new']}개, 유지 {stats['unchanged']}개, 키 {keys}")
+            assert (stats['new'], stats['unchanged']) == (1, 1)
+            assert keys == ['77777|SALE|2412345', '77777|SALE|84A|84.30|고/15|남향#0']
+
+            db.close()
+        
+        print("\n✅ 스냅샷-델타 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_latest_listings():
+    """대시보드용 현재 매물 스냅샷 테스트"""
+    print("\n" + "="*60)
+    print("🖥️ [TEST] database.py - 현재 매물 스냅샷 (latest_listings)")
+    print("="*60)
+    
+    try:
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_latest.db"))
+            db.save_complexes(pd.DataFrame([{'단지번호': '12345', '단지명': '테스트아파트'}]))
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 130000, '보증금': 0, '층': '7층', '층수': 7, '방향': '남향'},
+                {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'LEASE', '가격': 0, '보증금': 90000, '층': '8층', '층수': 8, '방향': '남향'},
+            ])
+            db.save_prices(price_df, '12345')
+            
+            # 1. 어제 수집한 것으로 되돌린 뒤, 오늘 매매 1건만 다시 수집
+            print("\n✓ 마지막 수집분만 표시 테스트:")
+            db.conn.execute("UPDATE listings SET last_seen_day = last_seen_day - 1")
+            db.conn.commit()
+            db.save_prices(price_df.iloc[[0]], '12345')
+            count = db.refresh_latest_listings()
+            listings = db.get_listings()
+            print(f"  스냅샷 {count}개: {listings[['타입', '매매가_억', '전세가_억']].values.tolist()}")
+            # 매매는 오늘 수집분 1건, 전세는 마지막 수집분(어제) 1건
+            assert count == 2 and len(listings) == 2
+            assert listings['매매가_억'].max() == 12.0 and listings['전세가_억'].max() == 9.0
+            assert listings['아파트명'].iloc[0] == '테스트아파트'
+            
+            # 2. 단지 단위 재구성 → 다른 단지 스냅샷은 유지
+            print("\n✓ 단지 단위 재구성 테스트:")
+            db.save_prices(price_df, '67890')
+            db.save_complexes(pd.DataFrame([{'단지번호': '67890', '단지명': '다른아파트'}]))
+            db.refresh_latest_listings(['67890'])
+            counts = db.get_listings()['complex_no'].value_counts().to_dict()
+            print(f"  단지별 매물 수: {counts}")
+            assert counts == {'67890': 3, '12345': 2}
+            
+            db.close()
+        
+        print("\n✅ 현재 매물 스냅샷 테스트 완료!")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_ingest_queue():
+    """ingest.py 테스트 (Redis 대신 인메모리 가짜 클라이언트 사용)"""
+    print("\n" + "="*60)
+    print("📥 [TEST] ingest.py - 수집 버퍼 (write-behind 큐)")
+    print("="*60)
+
+    try:
+        import json
+        import sqlite3
+        from src.database import RealEstateDB
+        from src.ingest import (
+            DEAD_KEY, PROCESSING_KEY, QUEUE_KEY, IngestBackpressure, IngestQueue, drain
+        )
+
+        class FakePipeline:
+            """명령을 모았다가 execute()에서 순서대로 실행"""
+
+            def __init__(self, client):
+                self.client = client
+                self.calls = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+            def execute(self):
+                return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+        class FakeRedis:
+            """IngestQueue가 쓰는 명령만 구현한 인메모리 Redis (값은 bytes로 저장)"""
+
+            def __init__(self):
+                self.lists = {}
+                self.values = {}
+
+            def llen(self, key):
+                return len(self.lists.get(key, []))
+
+            def rpush(self, key, value):
+                items = self.lists.setdefault(key, [])
+                items.append(value.encode() if isinstance(value, str) else value)
+                return len(items)
+
+            def lmove(self, source, destination, source_side, destination_side):
+                items = self.lists.get(source)
+                if not items:
+                    return None
+                value = items.pop(0 if source_side == 'LEFT' else -1)
+                target = self.lists.setdefault(destination, [])
+                target.insert(0 if destination_side == 'LEFT' else len(target), value)
+                return value
+
+            def lrem(self, key, count, value):
+                items = self.lists.get(key, [])
+                if value not in items:
+                    return 0
+                items.remove(value)
+                return 1
+
+            def set(self, key, value, nx=False, ex=None):
+                if nx and key in self.values:
+                    return None
+                self.values[key] = value
+                return True
+
+            def delete(self, key):
+                self.values.pop(key, None)
+                self.lists.pop(key, None)
+
+            def pipeline(self):
+                return FakePipeline(self)
+
+        class FlakyDB(RealEstateDB):
+            """잠금 오류 / 불량 배치를 흉내 내는 DB"""
+            locked = False
+
+            def save_price_batches(self, batches):
+                if self.locked:
+                    raise sqlite3.OperationalError("database is locked")
+                if any(complex_no == 'bad' for complex_no, _ in batches):
+                    raise ValueError("불량 배치")
+                return super().save_price_batches(batches)
+
+        listing = {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'}
+
+        def batch(*prices):
+            return pd.DataFrame([{**listing, '가격': price, '매물번호': str(price)} for price in prices])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = FlakyDB(os.path.join(tmpdir, "test_ingest.db"))
+            client = FakeRedis()
+            queue = IngestQueue(client)
+
+            # 1. 여러 배치 → 한 트랜잭션으로 저장 (writer 예약은 첫 push만)
+            print("\n✓ 그룹 커밋 테스트:")
+            scheduled = [
+                queue.push('111', batch(120000, 125000)),
+                queue.push('222', batch(90000)),
+                queue.push('111', batch(120000, 125000, 130000)),
+            ]
+            result = drain(queue, db)
+            listed = db.conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+            print(f"  예약 {scheduled}, 커밋 {result['commits']}회, 배치 {result['batches']}개, 매물 {result['rows']}행, 단지 {result['complexes']}")
+            assert scheduled == [True, False, False]
+            assert (result['commits'], result['batches'], result['rows']) == (1, 3, 6)
+            assert result['complexes'] == ['111', '222'] and listed == 4
+            assert queue.pending() == 0 and client.llen(PROCESSING_KEY) == 0
+            assert queue.push('222', batch(95000)) is True  # drain이 예약 표시를 지웠으므로 다시 예약
+            drain(queue, db)
+
+            # 2. 잠금 오류 → 꺼낸 배치를 순서 그대로 버퍼 앞쪽에 되돌리고 예외 전달
+            print("\n✓ 잠금 오류 재시도 테스트:")
+            queue.push('111', batch(140000))
+            queue.push('222', batch(100000))
+            db.locked = True
+            try:
+                drain(queue, db)
+                raise AssertionError("OperationalError가 전달되지 않음")
+            except sqlite3.OperationalError:
+                pass
+            order = [json.loads(payload)['complex_no'] for payload in client.lists[QUEUE_KEY]]
+            print(f"  버퍼 {queue.pending()}개 {order}, 처리 중 {client.llen(PROCESSING_KEY)}개")
+            assert order == ['111', '222'] and client.llen(PROCESSING_KEY) == 0
+            db.locked = False
+            result = drain(queue, db)
+            assert result['batches'] == 2 and queue.pending() == 0
+
+            # 3. writer가 커밋 전에 죽음 → 다음 drain이 처리 중 리스트의 배치를 복구
+            print("\n✓ 처리 중 배치 복구 테스트:")
+            queue.push('111', batch(150000))
+            queue.pop(1)
+            result = drain(queue, db)
+            print(f"  복구 {result['recovered']}개, 저장 {result['batches']}개")
+            assert result['recovered'] == 1 and result['batches'] == 1
+
+            # 4. 해석할 수 없는 payload → 바로 dead-letter
+            print("\n✓ 잘못된 payload 테스트:")
+            client.rpush(QUEUE_KEY, 'not json')
+            queue.push('222', batch(105000))
+            result = drain(queue, db)
+            print(f"  저장 {result['batches']}개, dead-letter {queue.dead_count()}개")
+            assert result['batches'] == 1 and queue.dead_count() == 1
+            assert client.lists[DEAD_KEY] == [b'not json']
+
+            # 5. 그룹 안의 불량 배치 → 그 배치만 dead-letter, 나머지는 저장
+            print("\n✓ 불량 배치 격리 테스트:")
+            queue.push('111', batch(160000))
+            queue.push('bad', batch(1))
+            queue.push('222', batch(110000))
+            result = drain(queue, db)
+            print(f"  저장 {result['batches']}개 {result['complexes']}, dead {result['dead']}개, dead-letter 총 {queue.dead_count()}개")
+            assert (result['batches'], result['dead']) == (2, 1) and result['complexes'] == ['111', '222']
+            assert queue.dead_count() == 2 and client.llen(PROCESSING_KEY) == 0
+
+            # 6. 버퍼 포화 → IngestBackpressure, 예약 표시가 풀려 있으면 이 push가 다시 걺
+            print("\n✓ backpressure 테스트:")
+            full = IngestQueue(client, max_pending=2)
+            full.push('111', batch(170000))
+            full.push('222', batch(120000))
+            full.clear_flush()  # 예약된 writer가 실패로 끝나 표시가 풀린 상태
+            flags = []
+            for _ in range(2):
+                try:
+                    full.push('333', batch(1), timeout=0)
+                    raise AssertionError("IngestBackpressure가 발생하지 않음")
+                except IngestBackpressure as e:
+                    flags.append(e.schedule_flush)
+            print(f"  대기 {full.pending()}개, schedule_flush {flags}")
+            assert flags == [True, False] and full.pending() == 2
+
+            db.close()
+
+        print("\n✅ 수집 버퍼 테스트 완료!")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_price_partitions():
+    """prices 월별 파티션 테스트"""
+    print("\n" + "="*60)
+    print("🗂️ [TEST] partitions.py - 월별 파티션 / 보존 기간 정리")
+    print("="*60)
+    
+    try:
+        from src.database import RealEstateDB
+        from src.partitions import encode, ensure_partition, list_partitions
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_partitions.db"))
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'},
+            ])
+            db.save_prices(price_df, '12345')
+            
+            # 1. 오래된 월 파티션에 직접 기록 (1년 전 수집분)
+            print("\n✓ 파티션 생성 및 통합 뷰 테스트:")
+            with db.conn:
+                old = ensure_partition(db.conn, 20240115)
+                sale = encode(db.conn, 'transaction_type', pd.Series(['SALE']))[0]
+                db.conn.execute(f"""
+                    INSERT INTO {old} (complex_no, listing_key, transaction_type_code, price, collected_at, collected_ts, collected_day)
+                    VALUES ('12345', 'old', ?, 110000, '2024-01-15T09:00:00', 1705276800, 20240115)
+                """, (sale,))
+            partitions = list_partitions(db.conn)
+            total = db.conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+            print(f"  파티션: {partitions}, 뷰 행 수: {total}")
+            assert len(partitions) == 2 and partitions[0] == 'prices_202401' and total == 2
+            
+            # 범주형 컬럼은 정수 코드로 저장되고 뷰에서 문자열로 복원
+            print("\n✓ 범주형 컬럼 사전 코드화 테스트:")
+            codes = encode(db.conn, 'direction', pd.Series(['남향', None, '남향'], index=[3, 5, 7]))
+            stored = db.conn.execute(f"SELECT direction_code FROM {partitions[1]}").fetchone()[0]
+            decoded = db.conn.execute(
+                "SELECT area_type, transaction_type, floor, direction FROM prices WHERE listing_key != 'old'"
+            ).fetchone()
+            print(f"  코드: {codes.tolist()}, 저장값: {stored}, 복원: {tuple(decoded)}")
+            assert codes[3] == codes[7] == stored and codes[5] is None
+            assert tuple(decoded) == ('59A', 'SALE', '5층', '남향')
+            
+            # 2. 최신 파티션부터 조회 → 여러 파티션에 걸친 최근 가격
+            recent = db.get_recent_prices('12345', limit=2)
+            print(f"  최근 가격: {[row['price'] for row in recent]}")
+            assert [row["price"] for row in recent] == [120000, 110000]
+            
+            # 3. 보존 기간 정리 → 오래된 파티션 DROP
+            print("\n✓ 보존 기간 정리 테스트:")
+            result = db.prune_prices(days=90)
+            total = db.conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+            print(f"  삭제된 파티션: {result['dropped_partitions']}, 남은 행: {total}")
+            assert result['dropped_partitions'] == ['prices_202401'] and total == 1
+            
+            # 4. 전체 초기화 → 파티션이 없어도 뷰 조회 가능
+            db.reset_listings()
+            total = db.conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+            print(f"  초기화 후 파티션: {list_partitions(db.conn)}, 뷰 행 수: {total}")
+            assert total == 0
+            
+            db.close()
+        
+        print("\n✅ partitions.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_archive():
+    """archive.py 테스트"""
+    print("\n" + "="*60)
+    print("🗄️ [TEST] archive.py - Parquet 아카이브")
+    print("="*60)
+    
+    try:
+        from src.archive import is_available, region_of
+        from src.database import RealEstateDB
+        from src.partitions import encode, ensure_partition, list_partitions
+        
+        # 1. 지역 파티션 키
+        print("\n✓ region_of() 테스트:")
+        region = region_of('서울특별시 강남구 개포동 123')
+        print(f"  {region}")
+        assert region == '서울특별시_강남구' and region_of(None) == 'unknown'
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_archive.db"))
+            db.save_complexes(pd.DataFrame([{'단지번호': '12345', '단지명': '테스트아파트', '주소': '서울특별시 강남구 개포동'}]))
+            
+            # 1년 전 변경 이력 + 가격 히스토리
+            with db.conn:
+                old = ensure_partition(db.conn, 20240115)
+                sale = encode(db.conn, 'transaction_type', pd.Series(['SALE']))[0]
+                db.conn.execute(f"""
+                    INSERT INTO {old} (complex_no, listing_key, transaction_type_code, price, collected_at, collected_ts, collected_day)
+                    VALUES ('12345', 'old', ?, 110000, '2024-01-15T09:00:00', 1705276800, 20240115)
+                """, (sale,))
+                db.conn.execute("""
+                    INSERT INTO price_history (complex_no, area_type, record_date, record_day, sale_avg_price, sale_count)
+                    VALUES ('12345', '59A', '2024-01-15', 20240115, 110000, 1)
+                """)
+            
+            # 2. 보존 기간 정리 (pyarrow 없으면 아카이브 없이 파티션만 정리)
+            print(f"\n✓ 보존 기간 정리 테스트 (pyarrow: {is_available()}):")
+            result = db.prune_prices(days=90)
+            history_rows = db.conn.execute("SELECT COUNT(*) FROM price_history").fetchone()[0]
+            print(f"  파티션 삭제: {result['dropped_partitions']}, 아카이브 파일: {len(result['archived_files'])}개")
+            assert result['dropped_partitions'] == ['prices_202401'] and not list_partitions(db.conn)
+            
+            if is_available():
+                # 3. 아카이브 → get_price_history 투명 조회
+                print("\n✓ 아카이브 조회 테스트:")
+                history = db.get_price_history('12345', days=9999)
+                print(f"  DB 잔여 {history_rows}행, 조회 결과 {len(history)}행")
+                assert history_rows == 0 and result['archived_history'] == 1
+                assert history['record_day'].tolist() == [20240115]
+                assert any('region=서울특별시_강남구' in path for path in result['archived_files'])
+            else:
+                print("  pyarrow 미설치 → 가격 히스토리는 DB에 유지")
+                assert history_rows == 1 and result['archived_files'] == []
+            
+            db.close()
+        
+        print("\n✅ archive.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_analytics():
+    """analytics.py 테스트"""
+    print("\n" + "="*60)
+    print("🦆 [TEST] analytics.py - 통계 탭 집계 엔진")
+    print("="*60)
+    
+    try:
+        from src import analytics
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test_analytics.db")
+            db = RealEstateDB(db_path)
+            db.save_complexes(pd.DataFrame([
+                {'단지번호': '12345', '단지명': '테스트아파트', '세대수': 500, '건축년도': 2015},
+                {'단지번호': '67890', '단지명': '비교아파트', '세대수': 800, '건축년도': 2008},
+            ]))
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 130000, '보증금': 0, '층': '7층', '층수': 7, '방향': '남향'},
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'LEASE', '가격': 0, '보증금': 90000, '층': '8층', '층수': 8, '방향': '남향'},
+                {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'SALE', '가격': 170000, '보증금': 0, '층': '6층', '층수': 6, '방향': '동향'},
+            ])
+            db.save_prices(price_df, '12345')
+            db.save_prices(price_df.iloc[[0, 2]], '67890')
+            db.refresh_latest_listings()
+            df = db.get_listings()
+            
+            # 1. pandas 집계 (duckdb 미설치 시 대시보드 경로)
+            print("\n✓ pandas 집계 테스트:")
+            sale_stats = analytics.area_price_stats(df, '매매가_억')
+            stats = analytics.complex_stats(df)
+            print(f"  면적별 매매: {sale_stats.reset_index().values.tolist()}")
+            print(f"  아파트별 현황: {stats.values.tolist()}")
+            assert sale_stats.loc[59.8].tolist() == [3, 12.3, 12.0, 13.0]
+            raw = analytics.area_price_stats(df, '매매가_억', rounded=False)
+            assert raw.loc[59.8, '평균(억)'] == (12.0 + 13.0 + 12.0) / 3  # 투자금 계산용 (반올림 전)
+            assert stats.set_index('아파트명').loc['테스트아파트', '매물수'] == 4
+            assert pd.isna(analytics.complex_stats(df[df['거래유형'] == 'LEASE'])['평균매매가(억)']).all()
+            
+            # 2. DuckDB 집계 → pandas와 같은 결과 (같은 필터 적용)
+            if analytics.is_available():
+                print("\n✓ DuckDB 집계 테스트:")
+                engine = analytics.AnalyticsEngine(db_path)
+                filters = {'complex_nos': ['12345'], 'transaction_type': 'SALE', 'area_range': (56, 62)}
+                subset = df[(df['complex_no'] == '12345') & (df['거래유형'] == 'SALE') & df['면적_m2'].between(56, 62)]
+                for column in ['매매가_억', '전세가_억']:
+                    for rounded in (True, False):
+                        pd.testing.assert_frame_equal(
+                            engine.area_price_stats(column, rounded=rounded),
+                            analytics.area_price_stats(df, column, rounded=rounded), check_dtype=False
+                        )
+                    pd.testing.assert_frame_equal(
+                        engine.complex_area_averages(column, **filters),
+                        analytics.complex_area_averages(subset, column), check_dtype=False
+                    )
+                pd.testing.assert_frame_equal(engine.complex_stats(), analytics.complex_stats(df), check_dtype=False)
+                history = engine.price_history('12345')
+                print(f"  pandas 결과와 일치, 가격 히스토리 {len(history)}행")
+                assert sorted(history['area_type']) == ['59A', '84A']
+                engine.close()
+            else:
+                print("  duckdb 미설치 → pandas 집계 사용")
+            
+            db.close()
+        
+        print("\n✅ analytics.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_backup():
+    """backup.py 테스트"""
+    print("\n" + "="*60)
+    print("💾 [TEST] backup.py - 온라인 백업")
+    print("="*60)
+    
+    try:
+        import gzip
+        import shutil
+        import sqlite3
+        from src.backup import backup_database, list_backups, load_settings
+        from src.database import RealEstateDB
+        
+        # 1. config.yaml 설정 로드
+        print("\n✓ load_settings() 테스트:")
+        settings = load_settings()
+        print(f"  {settings}")
+        assert settings['backup_enabled'] is True and settings['backup_keep'] > 0
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test_backup.db")
+            backup_dir = os.path.join(tmpdir, "backups")
+            db = RealEstateDB(db_path)
+            db.save_complexes(pd.DataFrame([{'단지번호': '12345', '단지명': '테스트아파트'}]))
+            
+            # 2. 연결을 열어 둔 상태에서 페이지 단위 백업 (WAL 미반영분 포함)
+            print("\n✓ backup_database() 테스트:")
+            result = backup_database(db_path, backup_dir, keep=2, pages=1)
+            print(f"  {os.path.basename(result['path'])}: {result['db_bytes']} → {result['backup_bytes']} bytes, {result['seconds']}초")
+            assert result['backup_bytes'] < result['db_bytes']
+            
+            restored = os.path.join(tmpdir, "restored.db")
+            with gzip.open(result['path'], 'rb') as src, open(restored, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            conn = sqlite3.connect(restored)
+            name = conn.execute("SELECT complex_name FROM complexes").fetchone()[0]
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            conn.close()
+            print(f"  복원된 단지: {name}, 저널 모드: {mode}")
+            assert name == '테스트아파트' and mode == 'delete'
+            
+            # 3. 최근 keep개만 유지
+            print("\n✓ 백업 교체 테스트:")
+            backup_database(db_path, backup_dir, keep=2)
+            last = backup_database(db_path, backup_dir, keep=2)
+            backups = list_backups(backup_dir, db_path)
+            print(f"  남은 백업: {len(backups)}개, 삭제: {len(last['removed'])}개")
+            assert len(backups) == 2 and last['removed'] == [result['path']]
+            
+            db.close()
+        
+        print("\n✅ backup.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_maintenance():
+    """maintenance.py 테스트"""
+    print("\n" + "="*60)
+    print("🧹 [TEST] maintenance.py - ANALYZE / 증분 VACUUM")
+    print("="*60)
+    
+    try:
+        import sqlite3
+        from src.database import RealEstateDB
+        from src.maintenance import run_maintenance
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # 1. 새 DB는 증분 auto_vacuum으로 생성 → 빈 페이지를 max_pages만큼만 반환
+            print("\n✓ 증분 VACUUM 테스트:")
+            db_path = os.path.join(tmpdir, "test_maintenance.db")
+            db = RealEstateDB(db_path)
+            db.save_complexes(pd.DataFrame([
+                {'단지번호': str(n), '단지명': '테스트아파트' * 50, '주소': '서울특별시 강남구' * 20} for n in range(3000)
+            ]))
+            with db.conn:
+                db.conn.execute("DELETE FROM complexes")
+            
+            result = run_maintenance(db_path, max_pages=50)
+            before, after = result['before'], result['after']
+            print(f"  빈 페이지 {before['freelist_count']} → {after['freelist_count']}, "
+                  f"파일 {before['file_bytes']:,} → {after['file_bytes']:,} bytes")
+            assert not result['converted'] and result['reclaimed_pages'] == 50
+            assert 0 < after['freelist_count'] < before['freelist_count']
+            assert db.conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()[0] == 1
+            db.close()
+            
+            # 2. 기존(auto_vacuum 없음) DB는 최초 1회 전체 VACUUM으로 전환
+            print("\n✓ 기존 DB 전환 테스트:")
+            legacy_path = os.path.join(tmpdir, "legacy.db")
+            conn = sqlite3.connect(legacy_path)
+            conn.execute("CREATE TABLE legacy (value TEXT)")
+            conn.commit()
+            conn.close()
+            
+            first = run_maintenance(legacy_path)
+            second = run_maintenance(legacy_path)
+            print(f"  1회차 전환: {first['converted']}, 2회차 전환: {second['converted']}")
+            assert first['converted'] and not second['converted']
+        
+        print("\n✅ maintenance.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_query_plans():
+    """주요 쿼리 실행 계획 점검 (전체 테이블 스캔 금지)"""
+    print("\n" + "="*60)
+    print("🔎 [TEST] database.py - 쿼리 실행 계획 (EXPLAIN QUERY PLAN)")
+    print("="*60)
+    
+    try:
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = RealEstateDB(os.path.join(tmpdir, "test_plans.db"))
+            db.save_complexes(pd.DataFrame([{'단지번호': '12345', '단지명': '테스트아파트'}]))
+            price_df = pd.DataFrame([
+                {'면적타입': '59A', '전용면적': 59.8, '거래유형': 'SALE', '가격': 120000, '보증금': 0, '층': '5층', '층수': 5, '방향': '남향'},
+                {'면적타입': '84A', '전용면적': 84.3, '거래유형': 'LEASE', '가격': 0, '보증금': 90000, '층': '8층', '층수': 8, '방향': '남향'},
+            ])
+            
+            # 실제 메소드가 실행하는 SQL 수집 (워커/대시보드 경로 포함)
+            statements = []
+            db.conn.set_trace_callback(statements.append)
+            db.save_prices(price_df, '12345')                # 저장 + 버킷 집계
+            db.save_prices(price_df, '12345')                # 재수집 (last_seen 갱신)
+            db.summarize_day()                               # 날짜 단위 일괄 집계
+            db.get_price_history('12345', '59A')             # 가격 추이 탭
+            db.get_price_trend('12345', '59A')
+            db.get_latest_prices('12345')
+            db.get_area_types('12345')                       # 가격 추이 탭 면적 선택
+            db.get_recent_prices('12345')                    # worker: check_price_changes
+            db.refresh_latest_listings(['12345'])            # 수집 종료 시 스냅샷 갱신
+            db.get_listings('12345')                         # app: load_formatted_data
+            db.get_price_change_ranking(complex_nos=['12345'])  # 관심 단지 가격 변동 순위
+            db.prune_prices()                                # worker: cleanup_old_prices
+            db.conn.set_trace_callback(None)
+            
+            hot_queries = [
+                sql for sql in statements
+                if sql.lstrip().split()[0].upper() in ('SELECT', 'INSERT', 'DELETE', 'UPDATE')
+            ]
+            
+            full_scans = []
+            for sql in hot_queries:
+                plan = db.conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+                # MATERIALIZED CTE 결과 스캔은 테이블 스캔이 아님
+                materialized = {d.split()[1] for _, _, _, d in plan if d.startswith('MATERIALIZE ')}
+                for _, _, _, detail in plan:
+                    if (detail.startswith('SCAN ') and '(subquery' not in detail and 'CONSTANT ROW' not in detail
+                            and detail.split()[1] not in materialized and 'sqlite_master' not in detail):
+                        full_scans.append((' '.join(sql.split())[:80], detail))
+            
+            print(f"\n✓ 점검한 쿼리: {len(hot_queries)}개")
+            for sql, detail in full_scans:
+                print(f"  ✗ {detail} ← {sql}")
+            assert hot_queries and not full_scans, f"전체 스캔 {len(full_scans)}건"
+            print("  ✓ 전체 테이블 스캔 없음")
+            
+            db.close()
+        
+        print("\n✅ 쿼리 실행 계획 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_schema_migration():
+    """schema.py 테스트"""
+    print("\n" + "="*60)
+    print("🧱 [TEST] schema.py - 스키마 마이그레이션")
+    print("="*60)
+    
+    try:
+        import sqlite3
+        from src.schema import ensure_schema, get_schema_version, SCHEMA_VERSION
+        from src.database import RealEstateDB
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test_schema.db")
+            
+            # 1. 새 DB → 최신 버전까지 마이그레이션
+            print("\n✓ 신규 DB 마이그레이션 테스트:")
+            db = RealEstateDB(db_path)
+            version = get_schema_version(db.conn)
+            print(f"  스키마 버전: v{version} (기대: v{SCHEMA_VERSION})")
+            assert version == SCHEMA_VERSION
+            db.close()
+            
+            # 2. 재연결 시 DDL 미실행 (버전 확인만)
+            print("\n✓ 재연결 시 DDL 생략 테스트:")
+            conn = sqlite3.connect(db_path)
+            statements = []
+            conn.set_trace_callback(statements.append)
+            ensure_schema(conn)
+            print(f"  실행된 SQL: {statements}")
+            assert not any('CREATE' in sql for sql in statements)
+            conn.close()
+            
+            # 3. 버전 테이블이 없는 기존 DB 업그레이드
+            print("\n✓ 기존 DB 업그레이드 테스트:")
+            legacy_path = os.path.join(tmpdir, "legacy.db")
+            conn = sqlite3.connect(legacy_path)
+            conn.execute("""
+                CREATE TABLE complexes (
+                    complex_no TEXT PRIMARY KEY, complex_name TEXT, address TEXT, total_households INTEGER,
+                    build_year INTEGER, total_area REAL, updated_at TEXT
+                )
+            """)
+            conn.execute("INSERT INTO complexes (complex_no, complex_name) VALUES ('12345', '기존아파트')")
+            conn.execute("""
+                CREATE TABLE prices (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, complex_no TEXT, area_type TEXT,
+                    exclusive_area REAL, transaction_type TEXT, price BIGINT, deposit BIGINT,
+                    floor TEXT, floor_number INTEGER, direction TEXT, collected_at TEXT
+                )
+            """)
+            conn.execute("""
+                INSERT INTO prices (complex_no, area_type, transaction_type, price, collected_at)
+                VALUES ('12345', '59A', 'SALE', 120000, '2026-01-16T10:11:12.123456')
+            """)
+            conn.commit()
+            ensure_schema(conn)
+            count = conn.execute("SELECT COUNT(*) FROM complexes").fetchone()[0]
+            print(f"  버전: v{get_schema_version(conn)}, 기존 단지 {count}개 유지")
+            assert get_schema_version(conn) == SCHEMA_VERSION and count == 1
+            
+            # 정수 시간 키 백필 확인
+            collected_day = conn.execute("SELECT collected_day FROM prices").fetchone()[0]
+            print(f"  collected_day 백필: {collected_day}")
+            assert collected_day == 20260116
+            
+            # 범주형 컬럼 코드화 후 뷰에서 문자열 복원 확인
+            decoded = conn.execute("SELECT area_type, transaction_type FROM prices").fetchone()
+            print(f"  코드화 후 뷰 조회: {decoded}")
+            assert decoded == ('59A', 'SALE')
+            
+            # 매물 식별 키 백필 확인
+            listing = conn.execute("SELECT listing_key, first_seen_day FROM listings").fetchone()
+            print(f"  listings 백필: {listing}")
+            assert listing == ('12345|SALE|59A|0.00||#0', 20260116)
+            
+            # 대시보드 스냅샷 초기 구성 확인
+            latest = conn.execute("SELECT complex_name, sale_eok FROM latest_listings").fetchall()
+            print(f"  latest_listings 구성: {latest}")
+            assert latest == [('기존아파트', 12.0)]
+            conn.close()
+        
+        print("\n✅ schema.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_connection_pool():
+    """connection.py 테스트"""
+    print("\n" + "="*60)
+    print("🔌 [TEST] connection.py - 연결 풀")
+    print("="*60)
+    
+    try:
+        import sqlite3
+        from src.connection import get_pool, connect
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test_pool.db")
+            
+            # 1. WAL 모드 및 스키마 자동 적용
+            print("\n✓ WAL 모드 테스트:")
+            with connect(db_path) as conn:
+                journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+                conn.execute("INSERT INTO complexes (complex_no, complex_name) VALUES ('1', '풀테스트')")
+                conn.commit()
+            print(f"  journal_mode: {journal_mode}")
+            assert journal_mode == 'wal'
+            
+            # 2. 연결 재사용
+            print("\n✓ 연결 재사용 테스트:")
+            pool = get_pool(db_path)
+            first = pool.acquire()
+            pool.release(first)
+            second = pool.acquire()
+            pool.release(second)
+            print(f"  같은 연결 재사용: {first is second}")
+            assert first is second
+            
+            # 3. 읽기 전용 연결
+            print("\n✓ 읽기 전용 연결 테스트:")
+            with connect(db_path, readonly=True) as conn:
+                count = conn.execute("SELECT COUNT(*) FROM complexes").fetchone()[0]
+                try:
+                    conn.execute("DELETE FROM complexes")
+                    blocked = False
+                except sqlite3.OperationalError:
+                    blocked = True
+            print(f"  조회: {count}개, 쓰기 차단: {blocked}")
+            assert count == 1 and blocked
+            
+            get_pool(db_path).close_all()
+            get_pool(db_path, readonly=True).close_all()
+        
+        print("\n✅ connection.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_http_client():
+    """http_client.py 테스트"""
+    print("\n" + "="*60)
+    print("🔁 [TEST] http_client.py - keep-alive + 조건부 요청")
+    print("="*60)
+    
+    try:
+        import json
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from src.http_client import HttpClient
+        from src.response_cache import ResponseCache
+        
+        # 모의 API: /overview는 ETag, /articles는 Last-Modified로 재검증 지원
+        versions = {'/overview': 1}
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive
+            
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/overview':
+                    etag = f'"v{versions[path]}"'
+                    if self.headers.get('If-None-Match') == etag:
+                        self.send_response(304)
+                        self.send_header('ETag', etag)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    body = json.dumps({'complexName': f'테스트아파트 v{versions[path]}'}).encode()
+                    headers = {'ETag': etag}
+                else:
+                    modified = 'Fri, 16 Jan 2026 09:00:00 GMT'
+                    if self.headers.get('If-Modified-Since') == modified:
+                        self.send_response(304)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    body = json.dumps({'articleList': [{'area': 59.8}]}).encode()
+                    headers = {'Last-Modified': modified}
+                self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        client = HttpClient()
+        
+        try:
+            # 1. 최초 요청 200 → 재요청 304 (저장된 JSON 반환)
+            print("\n✓ 조건부 요청 테스트:")
+            first = client.get_json(f"{base}/overview", params={'complexNo': '12345'})
+            second = client.get_json(f"{base}/overview", params={'complexNo': '12345'})
+            articles = [client.get_json(f"{base}/articles", params={'page': 1, 'complexNo': '12345'})
+                        for _ in range(2)]
+            assert first == second == {'complexName': '테스트아파트 v1'}
+            assert articles[0] == articles[1] == {'articleList': [{'area': 59.8}]}
+            
+            # 2. 서버 데이터 변경 → 새 본문과 새 ETag
+            versions['/overview'] = 2
+            changed = client.get_json(f"{base}/overview", params={'complexNo': '12345'})
+            assert changed == {'complexName': '테스트아파트 v2'}
+            assert client.get_json(f"{base}/overview", params={'complexNo': '12345'}) == changed
+            print(f"  {client.summary()}")
+            assert client.stats == {'requests': 6, 'conditional': 4, 'not_modified': 3, 'cache_hits': 0}
+            assert client.hit_rate() == 0.5
+            
+            # 3. keep-alive: 요청 6회에 연결 1개
+            print("\n✓ 연결 재사용 테스트:")
+            print(f"  새 연결: {client.connections_opened()}개")
+            assert client.connections_opened() == 1
+            
+            # 4. 디스크 캐시: TTL 안의 재조회는 네트워크 요청 없음, refresh는 새로 조회
+            print("\n✓ 디스크 캐시 연동 테스트:")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                cached = HttpClient(cache=ResponseCache(os.path.join(tmpdir, "cache.db")))
+                url = f"{base}/overview"
+                assert cached.cached_json('complex_overview', url, {'complexNo': '1'}) is None
+                data = cached.get_json(url, params={'complexNo': '1'}, endpoint='complex_overview')
+                for _ in range(3):
+                    assert cached.get_json(url, params={'complexNo': '1'}, endpoint='complex_overview') == data
+                cached.get_json(url, params={'complexNo': '1'}, endpoint='complex_overview', refresh=True)
+                print(f"  {cached.summary()}")
+                assert cached.stats['requests'] == 2 and cached.stats['cache_hits'] == 3
+                assert cached.cache_hit_rate() == 0.6
+                cached.close()
+                
+                # 5. 재검증 정보도 디스크에 저장: 새 프로세스(새 클라이언트)의 첫 요청부터 304,
+                #    TTL이 지난 응답도 전체 재요청 대신 조건부 요청으로 재검증
+                print("\n✓ 디스크 재검증 테스트:")
+                path = os.path.join(tmpdir, "cache.db")
+                restarted = HttpClient(cache=ResponseCache(path, ttl={'complex_overview': 0.2}))
+                articles_url = f"{base}/articles"
+                assert restarted.get_json(articles_url, params={'page': 1}) == {'articleList': [{'area': 59.8}]}
+                restarted.close()
+                restarted = HttpClient(cache=ResponseCache(path, ttl={'complex_overview': 0.2}))
+                assert restarted.get_json(articles_url, params={'page': 1}) == {'articleList': [{'area': 59.8}]}
+                overview = restarted.get_json(url, params={'complexNo': '2'}, endpoint='complex_overview')
+                time.sleep(0.25)
+                assert restarted.get_json(url, params={'complexNo': '2'}, endpoint='complex_overview') == overview
+                assert restarted.get_json(url, params={'complexNo': '2'}, endpoint='complex_overview') == overview
+                print(f"  {restarted.summary()}")
+                assert restarted.stats == {'requests': 3, 'conditional': 2, 'not_modified': 2, 'cache_hits': 1}
+                restarted.close()
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+        
+        print("\n✅ http_client.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_response_cache():
+    """response_cache.py 테스트"""
+    print("\n" + "="*60)
+    print("🗄️ [TEST] response_cache.py - TTL + LRU 응답 캐시")
+    print("="*60)
+    
+    try:
+        import sqlite3
+        import time
+        from src.response_cache import ResponseCache, load_settings
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "http_cache.db")
+            
+            # 1. TTL: 유효 기간 안에서만 반환, TTL 없는 엔드포인트는 저장 안 함
+            print("\n✓ TTL 테스트:")
+            cache = ResponseCache(path, ttl={'complex_overview': 3600, 'complex_list': 0.2})
+            cache.put('complex_overview', 'overview?1', {'complexName': '테스트아파트'})
+            cache.put('complex_list', 'complexes', {'complexList': []})
+            cache.put('articles', 'articles?1', {'articleList': []})
+            assert cache.get('complex_overview', 'overview?1') == {'complexName': '테스트아파트'}
+            assert cache.get('complex_list', 'complexes') == {'complexList': []}
+            assert cache.get('articles', 'articles?1') is None
+            time.sleep(0.25)
+            assert cache.get('complex_list', 'complexes') is None
+            print(f"  {cache.stats}")
+            
+            # 2. 재시작 후에도 유지 (디스크 캐시)
+            cache.close()
+            cache = ResponseCache(path, ttl={'complex_overview': 3600})
+            assert cache.get('complex_overview', 'overview?1') == {'complexName': '테스트아파트'}
+            
+            # 3. LRU: 크기 초과 시 가장 오래 안 쓴 응답부터 삭제
+            print("\n✓ LRU 삭제 테스트:")
+            cache.clear()
+            cache.max_bytes = 3000
+            body = {'data': 'x' * 900}
+            for n in range(3):
+                cache.put('complex_overview', f"overview?{n}", body)
+                time.sleep(0.01)
+            assert cache.get('complex_overview', 'overview?0') == body  # 0번을 최근 사용으로
+            cache.put('complex_overview', 'overview?3', body)
+            kept = [n for n in range(4) if cache.get('complex_overview', f"overview?{n}") is not None]
+            print(f"  남은 응답: {kept}, 크기 {cache.size_bytes():,} bytes, 삭제 {cache.stats['evictions']}개")
+            assert kept == [0, 2, 3]
+            assert cache.size_bytes() <= cache.max_bytes
+            
+            # 4. bypass: 읽기는 건너뛰고 저장은 유지
+            print("\n✓ bypass 테스트:")
+            cache.bypass = True
+            assert cache.get('complex_overview', 'overview?0') is None
+            cache.put('complex_overview', 'overview?0', {'data': 'new'})
+            cache.bypass = False
+            assert cache.get('complex_overview', 'overview?0') == {'data': 'new'}
+            cache.close()
+            
+            # 5. 재검증 정보: TTL 없는 엔드포인트도 검증자가 있으면 저장 (get은 None, validators로 조회)
+            print("\n✓ 재검증 정보 테스트:")
+            cache = ResponseCache(path, ttl={'complex_overview': 3600})
+            cache.put('articles', 'articles?1', {'articleList': [1]}, etag='"a1"')
+            cache.put('articles', 'articles?2', {'articleList': [2]})
+            assert cache.get('articles', 'articles?1') is None
+            assert cache.validators('articles?1') == {'etag': '"a1"', 'last_modified': None, 'data': {'articleList': [1]}}
+            assert cache.validators('articles?2') is None
+            cache.close()
+            
+            # 6. 재검증 컬럼이 없는 이전 캐시 파일도 열면 컬럼 추가
+            legacy = os.path.join(tmpdir, "legacy.db")
+            conn = sqlite3.connect(legacy)
+            conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, body TEXT NOT NULL, "
+                         "size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+            conn.close()
+            cache = ResponseCache(legacy)
+            cache.put('complex_overview', 'overview?1', {'complexName': '테스트아파트'}, last_modified='Fri')
+            assert cache.validators('overview?1')['last_modified'] == 'Fri'
+            cache.close()
+            
+            # 7. 설정: config.yaml에 없는 ttl 항목은 기본값으로 병합
+            assert load_settings(os.path.join(tmpdir, "missing.yaml"))['ttl']['complex_overview'] == 7 * 24 * 3600
+        
+        print("\n✅ response_cache.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_async_crawler():
+    """async_crawler.py 테스트"""
+    print("\n" + "="*60)
+    print("🌐 [TEST] async_crawler.py - 비동기 크롤러 + 토큰 버킷")
+    print("="*60)
+    
+    try:
+        import asyncio
+        import time
+        from src import async_crawler
+        from src.crawler import parse_listings
+        
+        if not async_crawler.is_available():
+            print("  httpx 미설치 → 건너뜀")
+            print("\n✅ async_crawler.py 테스트 완료!")
+            return True
+        
+        import httpx
+        
+        # 1. 토큰 버킷: 초당 20회 → 5회 요청에 최소 0.2초 (첫 요청은 즉시)
+        print("\n✓ 토큰 버킷 테스트:")
+        async def take(bucket, count):
+            started = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(count)))
+            return time.monotonic() - started
+        
+        elapsed = asyncio.run(take(async_crawler.TokenBucket(rate=20), 5))
+        print(f"  5회 획득: {elapsed:.3f}초")
+        assert 0.19 <= elapsed < 0.5
+        
+        # 2. 모의 API (응답 지연 0.2초, 첫 요청 1회는 429)
+        print("\n✓ 동시 수집 테스트:")
+        articles = [
+            {'area': 59.8, 'floorInfo': '7층', 'dealOrWarrantPrc': 120000, 'direction': '남향'},
+            {'area': 84.9, 'floorInfo': '2층', 'dealOrWarrantPrc': 150000, 'direction': '동향'},
+            {'area': 84.1, 'floorInfo': '12층', 'dealOrWarrantPrc': 170000, 'direction': '남동향'},
+        ]
+        calls = []
+        granted = []  # 토큰 버킷 통과 시각 (요청 출발 시각)
+        
+        async def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(429)
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={'articleList': articles})
+        
+        backoff = async_crawler.BACKOFF_BASE
+        async_crawler.BACKOFF_BASE = 0.1
+        try:
+            async def crawl(complex_nos):
+                crawler = async_crawler.AsyncCrawler(
+                    rate_limit=0.05, concurrency=5, transport=httpx.MockTransport(handler)
+                )
+                acquire = crawler.bucket.acquire
+                
+                async def record():
+                    await acquire()
+                    granted.append(time.monotonic())
+                
+                crawler.bucket.acquire = record
+                async with crawler:
+                    return await crawler.crawl_listings(complex_nos), crawler.stats
+            
+            complex_nos = ['101', '102', '103', '104', '105']
+            started = time.monotonic()
+            results, stats = asyncio.run(crawl(complex_nos))
+            elapsed = time.monotonic() - started
+        finally:
+            async_crawler.BACKOFF_BASE = backoff
+        
+        gaps = [b - a for a, b in zip(granted, granted[1:])]
+        print(f"  단지 {len(results)}개, 요청 {stats['requests']}회, {elapsed:.2f}초 (순차 실행 시 2초 이상)")
+        print(f"  최소 요청 간격: {min(gaps):.3f}초")
+        assert list(results) == complex_nos
+        assert stats == {'requests': 11, 'retries': 1, 'errors': 0}
+        assert min(gaps) >= 0.045  # 동시 실행이어도 전체 속도 제한 준수
+        assert elapsed < 1.5
+        expected = parse_listings(articles, 'SALE')
+        for sale_df, lease_df in results.values():
+            pd.testing.assert_frame_equal(sale_df, expected)
+            assert lease_df['보증금'].tolist() == [120000, 170000]
+
+        # 3. 한 단지가 JSON이 아닌 응답(차단 페이지 등) → 그 단지만 빈 결과, 나머지는 정상 수집
+        print("\n✓ 잘못된 응답 테스트:")
+
+        async def html_handler(request):
+            if request.url.path.endswith('/222'):
+                return httpx.Response(200, text='<html>점검 중</html>')
+            return httpx.Response(200, json={'articleList': articles})
+
+        async def crawl_bad():
+            async with async_crawler.AsyncCrawler(rate_limit=0, transport=httpx.MockTransport(html_handler)) as crawler:
+                results = await crawler.crawl_listings(['111', '222'])
+
+                async def fail(complex_no):
+                    if complex_no == '2':
+                        raise RuntimeError("파싱 오류")
+                    return complex_no
+
+                # 단지별 예외는 그 단지만 결과에서 제외
+                return results, crawler.stats, await crawler._gather(['1', '2', '3'], fail)
+
+        results, stats, isolated = asyncio.run(crawl_bad())
+        print(f"  단지 {list(results)}, 222 매물 {[len(df) for df in results['222']]}개, 실패 요청 {stats['errors']}회, 예외 격리 {list(isolated)}")
+        assert list(results) == ['111', '222'] and stats['errors'] == 2
+        assert all(df.empty for df in results['222'])
+        pd.testing.assert_frame_equal(results['111'][0], expected)
+        assert isolated == {'1': '1', '3': '3'}
+
+        print("\n✅ async_crawler.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_browser_pool():
+    """browser_pool.py 테스트 (Playwright 객체 대신 가짜 브라우저 사용)"""
+    print("\n" + "="*60)
+    print("🧭 [TEST] browser_pool.py - 브라우저 풀")
+    print("="*60)
+    
+    try:
+        import asyncio
+        from src.browser_pool import BrowserPool
+        
+        class FakePage:
+            def __init__(self):
+                self.closed = False
+                self.visited = []
+            
+            def is_closed(self):
+                return self.closed
+            
+            async def evaluate(self, script):
+                return 1
+            
+            async def goto(self, url):
+                self.visited.append(url)
+        
+        class FakeContext:
+            def __init__(self, log):
+                self.log = log
+                self.routes = []
+            
+            async def route(self, pattern, handler):
+                self.routes.append(pattern)
+            
+            def on(self, event, handler):
+                pass
+            
+            async def new_page(self):
+                return FakePage()
+            
+            async def close(self):
+                self.log.append('context.close')
+        
+        class FakeBrowser:
+            def __init__(self, log):
+                self.log = log
+                self.connected = True
+            
+            def is_connected(self):
+                return self.connected
+            
+            async def new_context(self, **options):
+                assert 'User-Agent' in options['extra_http_headers']
+                return FakeContext(self.log)
+            
+            async def close(self):
+                self.log.append('browser.close')
+        
+        class FakeDriver:
+            def __init__(self, log):
+                self.log = log
+            
+            async def stop(self):
+                self.log.append('driver.stop')
+        
+        class FakePool(BrowserPool):
+            log = []
+            
+            async def _start_driver(self):
+                return FakeDriver(self.log)
+            
+            async def _launch(self):
+                self.stats['launches'] += 1
+                return FakeBrowser(self.log)
+        
+        async def crawl():
+            pool = FakePool(contexts=1, recycle_after=2)
+            pages = []
+            
+            # 1. 단지 5개: 브라우저 1회 실행, 2개마다 컨텍스트 교체
+            for n in range(5):
+                async with pool.page() as page:
+                    await page.goto(f"https://new.land.naver.com/complexes/{n}")
+                    pages.append(page)
+            assert pool.stats['launches'] == 1
+            assert pool.stats['contexts'] == 3 and pool.stats['recycled'] == 2
+            assert pages[0] is pages[1] and pages[1] is not pages[2]
+            
+            # 2. 페이지가 닫혔으면 새 컨텍스트, 브라우저가 죽었으면 재실행
+            pages[-1].closed = True
+            async with pool.page() as page:
+                assert page is not pages[-1]
+            pool.browser.connected = False
+            async with pool.page() as page:
+                pass
+            assert pool.stats['unhealthy'] == 2 and pool.stats['launches'] == 2
+            
+            # 3. 블록 안에서 예외 → 해당 컨텍스트 폐기
+            contexts = pool.stats['contexts']
+            try:
+                async with pool.page() as page:
+                    raise RuntimeError("navigation failed")
+            except RuntimeError:
+                pass
+            async with pool.page() as page:
+                pass
+            assert pool.stats['contexts'] == contexts + 1
+            
+            await pool.close()
+            return pool
+        
+        print("\n✓ 재사용/교체/상태 점검 테스트:")
+        pool = asyncio.run(crawl())
+        print(f"  {pool.stats}")
+        assert FakePool.log[-2:] == ['browser.close', 'driver.stop']
+        assert pool.browser is None and pool.playwright is None
+        
+        # 4. 경량 프로필: 리소스 유형/호스트 차단 + 트래픽 집계
+        print("\n✓ 리소스 차단 테스트:")
+        from src.browser_pool import ResourceBlocker
+        
+        class FakeRoute:
+            def __init__(self, resource_type, url):
+                self.request = type('Request', (), {'resource_type': resource_type, 'url': url})()
+                self.action = None
+            
+            async def abort(self):
+                self.action = 'abort'
+            
+            async def continue_(self):
+                self.action = 'continue'
+        
+        blocker = ResourceBlocker(['image', 'font'], ['map.naver.net', 'wcs.naver.net'])
+        requests_ = [
+            ('document', 'https://new.land.naver.com/complexes/12345'),
+            ('xhr', 'https://new.land.naver.com/api/articles/complex/12345?page=1'),
+            ('image', 'https://landthumb-phinf.pstatic.net/a.jpg'),
+            ('font', 'https://ssl.pstatic.net/font.woff2'),
+            ('image', 'https://nrbe.map.naver.net/tile/1/2/3.png'),
+            ('script', 'https://wcs.naver.net/wcslog.js'),
+            ('script', 'https://notwcs.naver.net.example.com/app.js'),
+        ]
+        
+        async def route_all():
+            routes = [FakeRoute(*request) for request in requests_]
+            for route in routes:
+                await blocker._route(route)
+            return [route.action for route in routes]
+        
+        actions = asyncio.run(route_all())
+        blocker._on_response(type('Response', (), {'headers': {'content-length': '2048'}})())
+        print(f"  {blocker.summary()}")
+        assert actions == ['continue', 'continue', 'abort', 'abort', 'abort', 'abort', 'continue']
+        assert blocker.stats['blocked_types'] == {'image': 2, 'font': 1, 'script': 1}
+        assert blocker.stats['bytes'] == 2048
+        assert not ResourceBlocker().should_block('image', 'https://a.pstatic.net/a.jpg')  # 빈 프로필 = 전체 로드
+        
+        print("\n✅ browser_pool.py 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_browser_orchestrator():
+    """browser_scraper.scrape_complexes 테스트 (단지 수집은 가짜 함수로 대체)"""
+    print("\n" + "="*60)
+    print("🧵 [TEST] browser_scraper.py - 다중 컨텍스트 동시 수집")
+    print("="*60)
+    
+    try:
+        import asyncio
+        import sqlite3
+        import threading
+        import time
+        try:
+            from src import browser_scraper
+        except ImportError:
+            print("  playwright 미설치 → 건너뜀")
+            print("\n✅ 다중 컨텍스트 동시 수집 테스트 완료!")
+            return True
+        
+        class FakePool:
+            size = 3
+        
+        durations = {'1': 0.3, '2': 0.05, '3': 0.1, '4': 0.05, '5': 0.05, '6': 0.05}
+        state = {'running': 0, 'peak': 0}
+        starts = []
+        
+        buckets = set()
+        
+        async def fake_scrape(complex_no, pool=None, bucket=None):
+            buckets.add(id(bucket))
+            starts.append(time.monotonic())
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+            await asyncio.sleep(durations[complex_no])
+            state['running'] -= 1
+            if complex_no == '6':
+                return {}, pd.DataFrame(), pd.DataFrame()  # 페이지 로드 실패
+            if complex_no == '5':
+                raise RuntimeError("browser crashed")
+            listing = pd.DataFrame([{'거래유형': 'SALE', '가격': 100000}])
+            return {'단지번호': complex_no}, listing, pd.DataFrame()
+        
+        saved = []
+        
+        async def on_result(complex_no, complex_info, sale_df, lease_df):
+            await asyncio.sleep(0)
+            saved.append((complex_no, len(sale_df)))
+        
+        def failing_save(complex_no, complex_info, sale_df, lease_df):
+            # 동기 콜백은 스레드에서 실행 → 이벤트 루프를 막지 않음
+            assert threading.current_thread() is not threading.main_thread()
+            if complex_no == '3':
+                raise sqlite3.OperationalError("database is locked")
+            saved.append((complex_no, len(sale_df)))
+        
+        original = browser_scraper.scrape_complex
+        browser_scraper.scrape_complex = fake_scrape
+        try:
+            summary = asyncio.run(browser_scraper.scrape_complexes(
+                list(durations), FakePool(), on_result=on_result, rate_limit=0.02
+            ))
+        finally:
+            browser_scraper.scrape_complex = original
+        
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        print(f"\n✓ 저장 순서: {saved}")
+        print(f"  최대 동시 실행: {state['peak']}, 최소 이동 간격: {min(gaps):.3f}초, {summary}")
+        assert state['peak'] == 3                        # 컨텍스트 수만큼만 동시 실행
+        assert len(buckets) == 1                          # 모든 단지가 버킷 하나 공유 (추가 페이지 요청 포함)
+        assert min(gaps) >= 0.015                         # 전체 이동 간격 제한
+        assert saved[-1][0] == '1'                        # 끝나는 순서대로 저장 (가장 느린 단지가 마지막)
+        assert sorted(saved) == [('1', 1), ('2', 1), ('3', 1), ('4', 1), ('5', 0), ('6', 0)]
+        assert summary['succeeded'] == 4 and sorted(summary['failed']) == ['5', '6']
+        
+        # 저장 콜백이 실패해도 나머지 단지는 계속 수집하고 실패 단지로 기록
+        print("\n✓ 저장 실패 처리 테스트:")
+        saved.clear()
+        browser_scraper.scrape_complex = fake_scrape
+        try:
+            summary = asyncio.run(browser_scraper.scrape_complexes(
+                list(durations), FakePool(), on_result=failing_save, rate_limit=0.02
+            ))
+        finally:
+            browser_scraper.scrape_complex = original
+        print(f"  {summary}")
+        assert sorted(saved) == [('1', 1), ('2', 1), ('4', 1), ('5', 0), ('6', 0)]
+        assert summary['succeeded'] == 3 and sorted(summary['failed']) == ['3', '5', '6']
+        
+        print("\n✅ 다중 컨텍스트 동시 수집 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_article_capture():
+    """browser_scraper.py XHR 매물 수집 테스트 (Playwright 페이지 대신 가짜 객체 사용)"""
+    print("\n" + "="*60)
+    print("📡 [TEST] browser_scraper.py - 매물 목록 API 응답 가로채기")
+    print("="*60)
+    
+    try:
+        import asyncio
+        from urllib.parse import parse_qs, urlparse
+        try:
+            from src import browser_scraper
+        except ImportError:
+            print("  playwright 미설치 → 건너뜀")
+            print("\n✅ 매물 목록 API 응답 가로채기 테스트 완료!")
+            return True
+        
+        # 1. 가격 텍스트 / JSON → DataFrame (DOM 추출과 같은 컬럼)
+        print("\n✓ JSON 파싱 테스트:")
+        assert browser_scraper.parse_price_text('12억 5,000') == 125000
+        assert browser_scraper.parse_price_text('9억') == 90000
+        assert browser_scraper.parse_price_text('8,500') == 8500
+        articles = [
+            {'articleNo': '1', 'tradeTypeName': '매매', 'area2': 59.97, 'floorInfo': '7/15',
+             'dealOrWarrantPrc': '12억 5,000', 'direction': '남향', 'articleFeatureDesc': '올수리'},
+            {'articleNo': '1', 'tradeTypeName': '매매', 'area2': 59.97, 'floorInfo': '7/15',
+             'dealOrWarrantPrc': '12억 5,000', 'direction': '남향'},  # 다른 중개사의 같은 매물
+            {'articleNo': '2', 'tradeTypeName': '전세', 'area2': 84.9, 'floorInfo': '고/20',
+             'dealOrWarrantPrc': '7억', 'direction': '동향'},
+        ]
+        df = browser_scraper.parse_article_json(articles)
+        print(df.to_string())
+        dom_row = browser_scraper.make_listing(59.97, '매매', '7/15', '남향', 125000, '올수리', '1')
+        assert df.iloc[0].to_dict() == dom_row
+        assert df['거래유형'].tolist() == ['SALE', 'LEASE']
+        assert df['보증금'].tolist() == [0, 70000] and df['면적타입'].tolist() == ['59A', '84A']
+        assert df['층수'].tolist() == [7, 15]  # "고/20" → 고층 대표값 (전체 층수 20이 아님)
+        assert df['매물번호'].tolist() == ['1', '2']  # 저장 시 매물 식별 키
+        
+        # 2. 첫 페이지는 응답 가로채기, 이후 페이지는 같은 요청으로 직접 조회 (스크롤 없음)
+        print("\n✓ 응답 가로채기 + 다음 페이지 조회 테스트:")
+        base = "https://new.land.naver.com/api/articles/complex/12345?tradeType=&page=1"
+        
+        class FakeRequest:
+            url = base
+            
+            async def all_headers(self):
+                return {':authority': 'new.land.naver.com', 'authorization': 'Bearer token'}
+        
+        class FakeResponse:
+            def __init__(self, url, data, ok=True):
+                self.url, self.data, self.ok, self.status = url, data, ok, 200
+                self.request = FakeRequest()
+            
+            async def json(self):
+                return self.data
+        
+        requested = []
+        broken_pages = set()
+        
+        class BrokenResponse(FakeResponse):
+            async def json(self):
+                raise ValueError("not JSON")
+        
+        class FakeAPI:
+            async def get(self, url, headers=None):
+                page_no = int(parse_qs(urlparse(url).query)['page'][0])
+                requested.append((page_no, headers))
+                if page_no in broken_pages:
+                    return BrokenResponse(url, None)
+                return FakeResponse(url, {'articleList': [{'articleNo': f"p{page_no}", 'area2': 84.1,
+                                                           'tradeTypeName': '매매', 'floorInfo': '3/10',
+                                                           'dealOrWarrantPrc': '15억'}],
+                                          'isMoreData': page_no < 3})
+        
+        class CountingBucket:
+            acquired = 0
+            
+            async def acquire(self):
+                self.acquired += 1
+        
+        class FakeContext:
+            request = FakeAPI()
+        
+        class FakePage:
+            context = FakeContext()
+            
+            def __init__(self):
+                self.listeners = []
+            
+            def on(self, event, handler):
+                self.listeners.append(handler)
+            
+            def remove_listener(self, event, handler):
+                self.listeners.remove(handler)
+        
+        async def run(bucket=None):
+            page = FakePage()
+            capture = browser_scraper.ArticleCapture(page)
+            capture.start()
+            # 다른 API 응답은 무시
+            await page.listeners[0](FakeResponse("https://new.land.naver.com/api/complexes/12345", {}))
+            assert not await capture.wait(0.05)
+            await page.listeners[0](FakeResponse(base, {'articleList': articles, 'isMoreData': True}))
+            assert await capture.wait(0.05)
+            await capture.fetch_remaining(max_pages=10, bucket=bucket)
+            capture.stop()
+            assert page.listeners == []
+            return capture
+        
+        bucket = CountingBucket()
+        capture = asyncio.run(run(bucket))
+        listings = browser_scraper.parse_article_json(capture.articles())
+        print(f"  페이지 {sorted(capture.pages)}, 매물 {len(listings)}개, 추가 조회 {[p for p, _ in requested]}")
+        assert sorted(capture.pages) == [1, 2, 3] and len(listings) == 4
+        assert requested[0][1] == {'authorization': 'Bearer token'}  # HTTP/2 의사 헤더 제외
+        assert bucket.acquired == 2  # 추가 페이지 요청마다 속도 제한 토큰
+        
+        # 3. JSON이 아닌 페이지에서 멈추되 앞서 받은 페이지는 유지
+        print("\n✓ 잘못된 응답 페이지 테스트:")
+        broken_pages.add(3)
+        capture = asyncio.run(run())
+        print(f"  페이지 {sorted(capture.pages)}")
+        assert sorted(capture.pages) == [1, 2]
+        
+        print("\n✅ 매물 목록 API 응답 가로채기 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_adaptive_scroll():
+    """browser_scraper.scroll_article_list 테스트 (매물이 붙는 가짜 페이지 사용)"""
+    print("\n" + "="*60)
+    print("📜 [TEST] browser_scraper.py - 적응형 스크롤 종료")
+    print("="*60)
+    
+    try:
+        import asyncio
+        try:
+            from src import browser_scraper
+            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        except ImportError:
+            print("  playwright 미설치 → 건너뜀")
+            print("\n✅ 적응형 스크롤 종료 테스트 완료!")
+            return True
+        
+        class FakeResponse:
+            url = "https://new.land.naver.com/api/articles/complex/12345?page=2"
+            ok = True
+            
+            def __init__(self, more):
+                self.more = more
+            
+            async def json(self):
+                return {'articleList': [], 'isMoreData': self.more}
+        
+        class FakePage:
+            """
+            스크롤마다 page_size개씩 매물이 붙다가 total개에서 멈추는 목록
+            스타일시트가 차단된 페이지처럼 레이아웃 정보는 없음 (매물 수 외의 스크립트는 실패)
+            """
+            
+            def __init__(self, total, page_size=20, report_end=False):
+                self.total, self.page_size = total, page_size
+                self.count = min(total, page_size)
+                self.report_end = report_end
+                self.listeners = []
+                self.scrolls = 0
+            
+            def on(self, event, handler):
+                self.listeners.append(handler)
+            
+            def remove_listener(self, event, handler):
+                self.listeners.remove(handler)
+            
+            async def wait_for_selector(self, selector, timeout=None):
+                return True
+            
+            async def evaluate(self, script, arg=None):
+                if script is browser_scraper.SCROLL_ARTICLE_LIST_JS:
+                    self.scrolls += 1
+                    if self.count < self.total:
+                        self.count = min(self.total, self.count + self.page_size)
+                        for listener in self.listeners:
+                            await listener(FakeResponse(self.count < self.total or not self.report_end))
+                    return None
+                if script is browser_scraper.ARTICLE_LIST_STATE_JS:
+                    return self.count
+                raise AssertionError(f"unexpected script: {script}")
+            
+            async def wait_for_function(self, expression, arg=None, timeout=None):
+                if self.count > arg[1]:
+                    return True
+                await asyncio.sleep(timeout / 1000)
+                raise PlaywrightTimeoutError("timeout")
+        
+        async def scroll(page):
+            scraper = browser_scraper.NaverRealEstateScraper(page=page)
+            return await scraper.scroll_article_list(max_scrolls=10, idle_timeout=0.1)
+        
+        # 1. 매물 5개: 스크롤할 필요 없음 → 즉시 종료 (기존: 10초)
+        print("\n✓ 짧은 목록:")
+        short = asyncio.run(scroll(FakePage(total=5)))
+        assert short['scrolls'] == 0 and short['items'] == 5
+        assert short['seconds'] < 0.5 and short['saved_seconds'] > 9
+        
+        # 2. 매물 50개: 3페이지 로드 후 늘지 않으면 종료 (대기 1회만)
+        #    목록 영역이 스크롤되지 않는(스타일시트 차단, 레이아웃 정보 없음) 페이지에서도 다음 페이지 로드
+        print("\n✓ 증가가 멈추는 목록:")
+        page = FakePage(total=50)
+        grown = asyncio.run(scroll(page))
+        assert grown['items'] == 50 and grown['scrolls'] == 3
+        assert page.listeners == []
+        
+        # 3. API가 마지막 페이지를 알리면 추가 대기 없이 종료
+        print("\n✓ 목록 끝 응답:")
+        ended = asyncio.run(scroll(FakePage(total=50, report_end=True)))
+        assert ended['items'] == 50 and ended['scrolls'] == 2
+        assert ended['seconds'] < grown['seconds']
+        
+        # 4. 긴 목록은 max_scrolls에서 멈춤
+        print("\n✓ 최대 스크롤:")
+        capped = asyncio.run(scroll(FakePage(total=1000)))
+        assert capped['scrolls'] == 10 and capped['items'] == 220
+        
+        # 5. 정확히 한 페이지(20개)인 목록: 한 번 스크롤해 보고 늘지 않으면 종료
+        print("\n✓ 한 페이지 목록:")
+        single = asyncio.run(scroll(FakePage(total=20)))
+        assert single['items'] == 20 and single['scrolls'] == 1
+        
+        print("\n✅ 적응형 스크롤 종료 테스트 완료!")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_auth():
     """auth.py 테스트"""
     print("\n" + "="*60)
@@ -279,6 +2104,25 @@ def main():
     results.append(("analyzer.py", test_analyzer()))
     results.append(("filter.py", test_filter()))
     results.append(("database.py", test_database()))
+    results.append(("price_history", test_price_history()))
+    results.append(("snapshot delta", test_snapshot_delta()))
+    results.append(("latest listings", test_latest_listings()))
+    results.append(("ingest.py", test_ingest_queue()))
+    results.append(("partitions.py", test_price_partitions()))
+    results.append(("archive.py", test_archive()))
+    results.append(("analytics.py", test_analytics()))
+    results.append(("backup.py", test_backup()))
+    results.append(("maintenance.py", test_maintenance()))
+    results.append(("query plans", test_query_plans()))
+    results.append(("schema.py", test_schema_migration()))
+    results.append(("connection.py", test_connection_pool()))
+    results.append(("http_client.py", test_http_client()))
+    results.append(("response_cache.py", test_response_cache()))
+    results.append(("async_crawler.py", test_async_crawler()))
+    results.append(("browser_pool.py", test_browser_pool()))
+    results.append(("browser orchestrator", test_browser_orchestrator()))
+    results.append(("article capture", test_article_capture()))
+    results.append(("adaptive scroll", test_adaptive_scroll()))
     results.append(("auth.py", test_auth()))
     
     # 결과 요약
@@ -2,27 +2,31 @@
 Celery Worker 작업 정의
 자동 크롤링 및 백그라운드 작업
 """
-from celery_config import app
+from celery_config import app, REDIS_URL
 from src.database import RealEstateDB
 from src.auth import UserManager
 from src.notifications import EmailNotifier
 from src.analyzer import get_price_summary_by_area
+from src.connection import connect
+from src.ingest import IngestBackpressure, IngestQueue, drain
 import json
 import logging
 import pandas as pd
 import sqlite3
-from datetime import datetime, timedelta
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@app.task(name='worker.tasks.crawl_complex')
-def crawl_complex(complex_no: str, complex_name: str):
+@app.task(name='worker.tasks.crawl_complex', bind=True, max_retries=3)
+def crawl_complex(self, complex_no: str, complex_name: str):
     """
     특정 단지의 데이터를 크롤링
     
+    DB에 직접 쓰지 않고 수집 버퍼에 넣은 뒤 db_writer 큐의 flush_ingest가 모아서 저장
+    (writer가 밀려 버퍼가 가득 차면 잠시 후 재시도)
+    
     Args:
         complex_no: 단지 번호
         complex_name: 단지명
@@ -35,19 +39,32 @@ def crawl_complex(complex_no: str, complex_name: str):
     try:
         from src.crawler import get_listings_api
         
-        db = RealEstateDB()
+        queue = IngestQueue.from_url(REDIS_URL)
+        schedule_flush = False
+        
+        try:
+            # 매매 데이터 수집
+            sale_df = get_listings_api(complex_no, 'SALE')
+            if not sale_df.empty:
+                schedule_flush |= queue.push(complex_no, sale_df)
+                logger.info(f"✓ {complex_name} 매매 {len(sale_df)}개 저장 대기")
+            
+            # 전세 데이터 수집
+            lease_df = get_listings_api(complex_no, 'LEASE')
+            if not lease_df.empty:
+                schedule_flush |= queue.push(complex_no, lease_df)
+                logger.info(f"✓ {complex_name} 전세 {len(lease_df)}개 저장 대기")
         
-        # 매매 데이터 수집
-        sale_df = get_listings_api(complex_no, 'SALE')
-        if not sale_df.empty:
-            db.save_prices(sale_df, complex_no)
-            logger.info(f"✓ {complex_name} 매매 {len(sale_df)}개 저장")
+        except IngestBackpressure as e:
+            # 버퍼가 가득 찬 채 writer 예약이 풀려 있었으면 push가 예약 표시를 다시 걸어 둠
+            schedule_flush |= e.schedule_flush
+            raise
         
-        # 전세 데이터 수집
-        lease_df = get_listings_api(complex_no, 'LEASE')
-        if not lease_df.empty:
-            db.save_prices(lease_df, complex_no)
-            logger.info(f"✓ {complex_name} 전세 {len(lease_df)}개 저장")
+        finally:
+            # 이 작업이 예약 표시를 걸었으면 이후 단계가 실패해도 반드시 writer 예약
+            # (이미 예약됐으면 그 작업이 함께 저장)
+            if schedule_flush:
+                flush_ingest.delay()
         
         logger.info(f"Crawl completed for {complex_name}")
         
@@ -59,6 +76,10 @@ def crawl_complex(complex_no: str, complex_name: str):
             'lease_count': len(lease_df)
         }
     
+    except IngestBackpressure as e:
+        logger.warning(f"{complex_name}: {str(e)}, retrying later")
+        raise self.retry(exc=e, countdown=60)
+    
     except Exception as e:
         logger.error(f"Error crawling {complex_name}: {str(e)}")
         return {
@@ -69,6 +90,56 @@ def crawl_complex(complex_no: str, complex_name: str):
         }
 
 
+@app.task(name='worker.tasks.flush_ingest', bind=True, max_retries=5)
+def flush_ingest(self):
+    """
+    수집 버퍼의 매물 배치를 모아 그룹 커밋으로 저장
+    db_writer 큐 전용 워커(concurrency=1)에서만 실행 → SQLite 쓰기는 이 프로세스 하나뿐
+    
+    Returns:
+        dict: 저장 결과 (트랜잭션 수, 배치 수, 매물 수)
+    """
+    try:
+        queue = IngestQueue.from_url(REDIS_URL)
+        db = RealEstateDB()
+        try:
+            result = drain(queue, db)
+        finally:
+            db.close()
+        
+        logger.info(
+            f"Flushed {result['batches']} batches ({result['rows']} rows, "
+            f"{len(result['complexes'])} complexes) in {result['commits']} commits"
+        )
+        if result['recovered']:
+            logger.warning(f"Recovered {result['recovered']} batches left by a crashed writer")
+        if result['dead']:
+            logger.error(f"Moved {result['dead']} failing batches to dead-letter list")
+        
+        return {
+            'status': 'success',
+            'commits': result['commits'],
+            'batches': result['batches'],
+            'rows': result['rows'],
+            'complexes': len(result['complexes']),
+            'recovered': result['recovered'],
+            'dead': result['dead']
+        }
+    
+    except sqlite3.OperationalError as e:
+        # 잠금 등 일시적 오류: 꺼낸 배치는 버퍼에 되돌려졌으므로 잠시 후 다시 저장
+        # (재시도가 모두 실패해도 예약 표시는 drain 시작 때 풀렸으므로 다음 push가 다시 예약)
+        logger.warning(f"Flush failed: {str(e)}, retrying later")
+        raise self.retry(exc=e, countdown=60)
+    
+    except Exception as e:
+        logger.error(f"Error flushing ingest queue: {str(e)}")
+        return {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
 @app.task(name='worker.tasks.check_price_changes')
 def check_price_changes(user_id: int, complex_no: str, complex_name: str, area_type: str = None):
     """
@@ -86,7 +157,6 @@ def check_price_changes(user_id: int, complex_no: str, complex_name: str, area_t
     logger.info(f"Checking price changes for {complex_name} (user: {user_id})")
     
     try:
-        db = RealEstateDB()
         user_manager = UserManager()
         notifier = EmailNotifier()
         
@@ -101,27 +171,16 @@ def check_price_changes(user_id: int, complex_no: str, complex_name: str, area_t
             return {'status': 'error', 'message': 'No email found'}
         
         # 최근 2개의 데이터 조회 (현재 + 이전)
-        query = """
-            SELECT collected_at, area_type, price, transaction_type
-            FROM prices
-            WHERE complex_no = ? AND transaction_type = 'SALE'
-            ORDER BY collected_at DESC
-            LIMIT 2
-        """
-        
-        conn = sqlite3.connect('data/real_estate.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(query, (complex_no,))
-        results = cursor.fetchall()
-        conn.close()
+        db = RealEstateDB(readonly=True)
+        results = db.get_recent_prices(complex_no, 'SALE', limit=2)
+        db.close()
         
         if len(results) < 2:
             logger.info(f"Not enough data for {complex_no}")
             return {'status': 'success', 'message': 'Not enough historical data'}
         
-        current = dict(results[0])
-        previous = dict(results[1])
+        current = results[0]
+        previous = results[1]
         
         # 가격 변동 계산
         current_price = current['price'] / 100000000  # 원 → 억
@@ -204,11 +263,8 @@ def crawl_all_watchlist():
             GROUP BY w.user_id, w.complex_no
         """
         
-        conn = sqlite3.connect('data/real_estate.db')
-        cursor = conn.cursor()
-        cursor.execute(query)
-        watchlist_items = cursor.fetchall()
-        conn.close()
+        with connect(readonly=True) as conn:
+            watchlist_items = conn.execute(query).fetchall()
         
         results = []
         crawl_tasks = []
@@ -250,14 +306,48 @@ def crawl_all_watchlist():
         }
 
 
+@app.task(name='worker.tasks.summarize_prices_daily')
+def summarize_prices_daily(record_date: str = None):
+    """
+    모든 단지의 일별 가격 히스토리 일괄 집계
+    매일 크롤링 이후 자동으로 실행됨 (Celery Beat)
+    
+    Args:
+        record_date: 집계 날짜 'YYYY-MM-DD' (기본값: 오늘)
+    
+    Returns:
+        dict: 집계 결과
+    """
+    logger.info(f"Summarizing price history for {record_date or 'today'}")
+    
+    try:
+        db = RealEstateDB()
+        row_count = db.summarize_day(record_date)
+        db.close()
+        
+        return {
+            'status': 'success',
+            'record_date': record_date,
+            'row_count': row_count
+        }
+    
+    except Exception as e:
+        logger.error(f"Error summarizing price history: {str(e)}")
+        return {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
 @app.task(name='worker.tasks.cleanup_old_prices')
-def cleanup_old_prices(days: int = 90):
+def cleanup_old_prices(days: int = 90, archive: bool = True):
     """
     90일 이상 된 가격 데이터 정리
-    스토리지 공간 절약용
+    스토리지 공간 절약용 (삭제 전 Parquet 아카이브로 이동, pyarrow 필요)
     
     Args:
         days: 지난 일수 (기본 90일)
+        archive: 삭제 전 아카이브 여부
     
     Returns:
         dict: 정리 결과
@@ -266,18 +356,23 @@ def cleanup_old_prices(days: int = 90):
     
     try:
         db = RealEstateDB()
-        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
-        
-        query = "DELETE FROM prices WHERE collected_at < ?"
-        db.cursor.execute(query, (cutoff_date,))
-        db.conn.commit()
+        # 월 파티션 단위 DROP (행 단위 DELETE로 쓰기 잠금을 오래 잡지 않음)
+        result = db.prune_prices(days, archive=archive)
+        db.close()
         
-        deleted_count = db.cursor.rowcount
-        logger.info(f"Deleted {deleted_count} old price records")
+        dropped = result['dropped_partitions']
+        logger.info(
+            f"Dropped {len(dropped)} price partitions {dropped}, "
+            f"archived {result['archived_history']} history rows to {len(result['archived_files'])} files, "
+            f"{result['deleted_listings']} stale listings"
+        )
         
         return {
             'status': 'success',
-            'deleted_count': deleted_count
+            'dropped_partitions': dropped,
+            'archived_files': len(result['archived_files']),
+            'archived_history': result['archived_history'],
+            'deleted_listings': result['deleted_listings']
         }
     
     except Exception as e:
@@ -288,6 +383,96 @@ def cleanup_old_prices(days: int = 90):
         }
 
 
+@app.task(name='worker.tasks.backup_database')
+def backup_database():
+    """
+    DB 온라인 백업 (config.yaml의 database.backup_enabled가 true일 때만)
+    SQLite 백업 API로 페이지 단위 복사 → 백업 중에도 크롤링 쓰기가 막히지 않음
+    
+    Returns:
+        dict: 백업 결과 (소요 시간, 크기)
+    """
+    from src import backup
+    
+    settings = backup.load_settings()
+    if not settings['backup_enabled']:
+        logger.info("Database backup disabled (database.backup_enabled: false)")
+        return {'status': 'skipped'}
+    
+    logger.info(f"Backing up {settings['path']} to {settings['backup_dir']}")
+    
+    try:
+        result = backup.backup_database(
+            settings['path'], settings['backup_dir'], keep=settings['backup_keep']
+        )
+        logger.info(
+            f"Backup {result['path']} done in {result['seconds']}s "
+            f"({result['db_bytes'] / 1024 / 1024:.1f}MB → {result['backup_bytes'] / 1024 / 1024:.1f}MB), "
+            f"removed {len(result['removed'])} old backups"
+        )
+        
+        return {
+            'status': 'success',
+            'path': result['path'],
+            'seconds': result['seconds'],
+            'db_bytes': result['db_bytes'],
+            'backup_bytes': result['backup_bytes'],
+            'removed': len(result['removed'])
+        }
+    
+    except Exception as e:
+        logger.error(f"Error backing up database: {str(e)}")
+        return {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
+@app.task(name='worker.tasks.maintain_database')
+def maintain_database(max_pages: int = 10000):
+    """
+    DB 정기 유지보수 (빈 페이지 일부 반환, ANALYZE / PRAGMA optimize, WAL 정리)
+    가격 정리/초기화로 생긴 빈 공간과 오래된 통계를 매일 조금씩 정리
+    
+    Args:
+        max_pages: 이번 실행에서 반환할 최대 빈 페이지 수
+    
+    Returns:
+        dict: 유지보수 전후 파일 크기/빈 페이지 수
+    """
+    from src.maintenance import run_maintenance
+    
+    logger.info(f"Running database maintenance (max {max_pages} pages)")
+    
+    try:
+        result = run_maintenance(max_pages=max_pages)
+        before, after = result['before'], result['after']
+        logger.info(
+            f"Maintenance done in {result['seconds']}s: "
+            f"{before['file_bytes'] / 1024 / 1024:.1f}MB → {after['file_bytes'] / 1024 / 1024:.1f}MB, "
+            f"free pages {before['freelist_count']} → {after['freelist_count']}"
+            + (" (converted to incremental auto_vacuum)" if result['converted'] else "")
+        )
+        
+        return {
+            'status': 'success',
+            'seconds': result['seconds'],
+            'converted': result['converted'],
+            'reclaimed_pages': result['reclaimed_pages'],
+            'file_bytes_before': before['file_bytes'],
+            'file_bytes_after': after['file_bytes'],
+            'free_pages_before': before['freelist_count'],
+            'free_pages_after': after['freelist_count']
+        }
+    
+    except Exception as e:
+        logger.error(f"Error maintaining database: {str(e)}")
+        return {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
 @app.task(name='worker.tasks.test_task')
 def test_task(message: str):
     """